@@ -5,7 +5,7 @@ a = Analysis(
     ['src\\qt_data_extractor\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[('src/qt_data_extractor/design/*.ui', 'design')],
+    datas=[],
     hiddenimports=['win32timezone', 'data_agent'],
     hookspath=['src/qt_data_extractor/hooks'],
     hooksconfig={},
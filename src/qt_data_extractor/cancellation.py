@@ -0,0 +1,56 @@
+"""
+Cooperative cancellation of long running jobs.
+
+A job checks its token between units of work (i.e. between tags and time windows of an
+extraction): a paused token blocks the job there until it is resumed, a cancelled token
+raises `ExtractionCancelled`. Requests already sent to the historian are not
+interrupted, so a job stops as soon as its running requests return.
+"""
+
+import threading
+
+
+class ExtractionCancelled(Exception):
+    """Raised by `CancellationToken.check` once the job was cancelled"""
+
+
+class CancellationToken:
+    """Cancel / pause flags shared by a job and its controller, thread safe"""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self._lock = threading.Lock()
+
+    @property
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def is_paused(self):
+        return not self._running.is_set() and not self._cancelled.is_set()
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled.set()
+            # Wake up a paused job, so it can stop
+            self._running.set()
+
+    def pause(self):
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def sleep(self, seconds):
+        """Sleep, returning early once cancelled"""
+        self._cancelled.wait(seconds)
+
+    def check(self):
+        """Block while paused, raise ExtractionCancelled if cancelled"""
+        self._running.wait()
+        if self._cancelled.is_set():
+            raise ExtractionCancelled("Extraction cancelled")
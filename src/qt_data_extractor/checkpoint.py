@@ -0,0 +1,161 @@
+"""
+Checkpoint manifest of an extraction job.
+
+The manifest is a JSON lines file kept next to the archive. The first line describes
+the job and each following line records a (tag, time window) unit that was stored in
+the archive, so a failed job can be resumed without reading finished units again. Units
+are recorded once the archive holding them is closed.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+CHECKPOINT_FILE_EXTENSION = ".checkpoint"
+
+_DATETIME_FIELDS = ["first_timestamp", "last_timestamp"]
+_TIMEDELTA_FIELDS = ["window"]
+
+
+def _encode_timestamp(ts):
+    return ts.isoformat() if ts is not None else None
+
+
+def _unit_start(value):
+    """Unit start of a manifest record - older manifests have naive starts in local time"""
+    if value is None:
+        return None
+
+    ts = datetime.fromisoformat(value)
+    return _encode_timestamp(ts if ts.tzinfo else ts.astimezone(timezone.utc))
+
+
+def _encode_job(job):
+    res = dict(job)
+    for field in _DATETIME_FIELDS:
+        if res.get(field) is not None:
+            res[field] = _encode_timestamp(res[field])
+    for field in _TIMEDELTA_FIELDS:
+        if res.get(field) is not None:
+            res[field] = res[field].total_seconds()
+    return res
+
+
+def _decode_job(job):
+    res = dict(job)
+    for field in _DATETIME_FIELDS:
+        if res.get(field) is not None:
+            res[field] = datetime.fromisoformat(res[field])
+    for field in _TIMEDELTA_FIELDS:
+        if res.get(field) is not None:
+            res[field] = timedelta(seconds=res[field])
+    return res
+
+
+class Checkpoint:
+    """
+    Tracks the units of a job that are already stored in the archive.
+
+    :param path: Manifest file path
+    :param job: Job description (see `ExtractionEngine.copy_period` arguments)
+    :param completed: Already completed (tag, window start) units
+    """
+
+    def __init__(self, path, job, completed=None):
+        self._path = path
+        self._job = job
+        self._completed = set(completed or ())
+        self._lock = threading.Lock()
+        self._file = None
+
+    @classmethod
+    def create(cls, path, job):
+        """Start a new manifest (overwrites an existing one)"""
+        checkpoint = cls(path, job)
+        checkpoint._write_job()
+        return checkpoint
+
+    @classmethod
+    def load(cls, path):
+        """Load an existing manifest for resuming"""
+        job = None
+        completed = set()
+
+        with open(path, "r") as fl:
+            for line in fl:
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last line may be truncated if the process was killed while writing it
+                    break
+
+                if "job" in record:
+                    job = _decode_job(record["job"])
+                else:
+                    completed.add((record["tag"], _unit_start(record["start"])))
+
+        if job is None:
+            raise ValueError(f"'{path}' is not a valid checkpoint manifest")
+
+        return cls(path, job, completed)
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def job(self):
+        return self._job
+
+    @property
+    def completed_units(self):
+        return len(self._completed)
+
+    def is_completed(self, tag, start):
+        return (tag, _encode_timestamp(start)) in self._completed
+
+    def mark_completed(self, tag, start, end):
+        record = {
+            "tag": tag,
+            "start": _encode_timestamp(start),
+            "end": _encode_timestamp(end),
+        }
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self._path, "a")
+
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            self._completed.add((record["tag"], record["start"]))
+
+    def reset(self):
+        """Forget the completed units (i.e. the archive holding them was lost)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+            self._completed.clear()
+            self._write_job()
+
+    def _write_job(self):
+        with open(self._path, "w") as fl:
+            fl.write(json.dumps({"job": _encode_job(self._job)}) + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self):
+        """Drop the manifest once the job is finished"""
+        self.close()
+        if os.path.exists(self._path):
+            os.remove(self._path)
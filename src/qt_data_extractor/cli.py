@@ -0,0 +1,351 @@
+"""
+Headless batch extractor.
+
+Runs the same extraction pipeline as the GUI without Qt, and reports progress as JSON
+lines on stdout, i.e.:
+
+    qt-data-extractor-batch --connection pi-main --tags-file tags.txt \\
+        --from 2023-01-01 --to 2024-01-01 --sample-rate "1 minute" --output-dir c:\\temp
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import json
+import logging
+import signal
+import sys
+from datetime import datetime, timezone
+
+import pandas as pd
+from data_agent.local_agent import LocalAgent
+
+from qt_data_extractor import __version__
+from qt_data_extractor.cancellation import CancellationToken, ExtractionCancelled
+from qt_data_extractor.checkpoint import Checkpoint
+from qt_data_extractor.extraction import (
+    ARCHIVE_FORMATS,
+    DEFAULT_ARCHIVE_TYPE,
+    DEFAULT_MAX_READERS,
+    checkpoint_path,
+    create_job,
+    job_file_path,
+    run_job,
+)
+from qt_data_extractor.profiling import OperationProfiler, profiling_requested
+from qt_data_extractor.progress import ProgressThrottle
+from qt_data_extractor.report import REPORT_FILE_EXTENSION, JobReport
+from qt_data_extractor.tag_import import column_index, open_tag_list
+
+__author__ = "Meir Tseitlin"
+__copyright__ = "Imubit"
+__license__ = "LGPLv3"
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE = "Raw Data"
+PROGRESS_INTERVAL_SECONDS = 1.0
+
+
+def _emit(event, **kwargs):
+    print(json.dumps({"event": event, **kwargs}, default=str), flush=True)
+
+
+def _run_with_progress(progress, fn, *args, **kwargs):
+    """Run `fn` in a thread, reporting progress at a fixed rate until it returns (reads
+    of the historian block the readers for a while)"""
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="extraction"
+    ) as executor:
+        future = executor.submit(fn, *args, **kwargs)
+        while True:
+            try:
+                return future.result(timeout=PROGRESS_INTERVAL_SECONDS)
+            except concurrent.futures.TimeoutError:
+                progress.poll()
+
+
+def _save_report(report, job, prometheus_path=None):
+    try:
+        path = job_file_path(job, REPORT_FILE_EXTENSION)
+        report.write_json(path)
+        if prometheus_path:
+            report.write_prometheus(prometheus_path)
+        _emit("report", path=path, prometheus=prometheus_path)
+    except OSError as e:
+        log.warning(f"Failed saving the job report: {e}")
+
+
+def read_tags_file(path, sheet=None, column="A", header=False):
+    """Read unique tag names from a column of an Excel sheet, a CSV or a text file (one per line)"""
+    return list(
+        open_tag_list(
+            path, sheet=sheet, column=column_index(column), skip_rows=int(header)
+        )
+    )
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        description="Extract historian data into an archive without the GUI"
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"qt-data-extractor {__version__}"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="CHECKPOINT",
+        help="resume an interrupted extraction from its checkpoint manifest "
+        "(other job arguments are ignored)",
+    )
+    parser.add_argument("-c", "--connection", help="source connection name")
+    parser.add_argument(
+        "-t", "--tags-file", help="tags list (.xlsx, .csv or text file)"
+    )
+    parser.add_argument("--tags-sheet", help="Excel sheet of the tags (default: first)")
+    parser.add_argument(
+        "--tags-column",
+        default="A",
+        help="column of the tags, i.e. B or 2 (default: A)",
+    )
+    parser.add_argument(
+        "--tags-header", action="store_true", help="skip the first row of the tags list"
+    )
+    parser.add_argument(
+        "--from",
+        dest="first_timestamp",
+        help="period start (ISO format, local time unless an offset is given, "
+        "i.e. 2024-01-01T00:00Z for UTC)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="last_timestamp",
+        help="period end (ISO format, local time unless an offset is given)",
+    )
+    parser.add_argument(
+        "-r",
+        "--sample-rate",
+        default=DEFAULT_SAMPLE_RATE,
+        help=f'sample rate, i.e. "1 minute" (default: "{DEFAULT_SAMPLE_RATE}")',
+    )
+    parser.add_argument("-o", "--output-dir", help="archive directory")
+    parser.add_argument(
+        "-u",
+        "--update",
+        metavar="ARCHIVE",
+        help="update an existing archive - tags already in it are extracted from their "
+        "last stored timestamp (--to defaults to now)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=list(ARCHIVE_FORMATS),
+        default=DEFAULT_ARCHIVE_TYPE,
+        help=f"archive format (default: {DEFAULT_ARCHIVE_TYPE})",
+    )
+    parser.add_argument(
+        "--window",
+        help="time window to stream the period in, i.e. 7d or 12h (default: whole period)",
+    )
+    parser.add_argument(
+        "--readers",
+        type=int,
+        default=DEFAULT_MAX_READERS,
+        help=f"concurrent readers (default: {DEFAULT_MAX_READERS})",
+    )
+    parser.add_argument(
+        "--attributes-only", action="store_true", help="extract tag metadata only"
+    )
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="append to existing groups instead of failing",
+    )
+    parser.add_argument(
+        "--prometheus",
+        metavar="FILE",
+        help="also save the job metrics in Prometheus text format (i.e. for the node "
+        "exporter textfile collector)",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="log to stderr in debug level"
+    )
+
+    parsed = parser.parse_args(args)
+
+    if not parsed.resume:
+        for arg, name in [
+            ("connection", "--connection"),
+            ("tags_file", "--tags-file"),
+        ]:
+            if not getattr(parsed, arg):
+                parser.error(f"{name} is required")
+
+        try:
+            column_index(parsed.tags_column)
+        except ValueError as e:
+            parser.error(str(e))
+
+        if not parsed.output_dir and not parsed.update:
+            parser.error("--output-dir or --update is required")
+
+        if parsed.update and not parsed.last_timestamp:
+            parsed.last_timestamp = datetime.now(timezone.utc).isoformat(
+                timespec="seconds"
+            )
+
+        if not parsed.attributes_only and not (
+            parsed.first_timestamp and parsed.last_timestamp
+        ):
+            parser.error("--from and --to are required")
+
+    return parsed
+
+
+def main(args):
+    args = parse_args(args)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.resume:
+        checkpoint = Checkpoint.load(args.resume)
+        job = checkpoint.job
+    else:
+        try:
+            job = create_job(
+                src_conn=args.connection,
+                tags=read_tags_file(
+                    args.tags_file,
+                    sheet=args.tags_sheet,
+                    column=args.tags_column,
+                    header=args.tags_header,
+                ),
+                directory=args.output_dir,
+                first_timestamp=datetime.fromisoformat(args.first_timestamp)
+                if args.first_timestamp
+                else None,
+                last_timestamp=datetime.fromisoformat(args.last_timestamp)
+                if args.last_timestamp
+                else None,
+                time_frequency=args.sample_rate,
+                window=pd.to_timedelta(args.window).to_pytimedelta()
+                if args.window
+                else None,
+                attributes_only=args.attributes_only,
+                max_readers=args.readers,
+                archive_type=args.format,
+                update_archive=args.update,
+            )
+        except ValueError as e:
+            # i.e. an invalid timestamp or an archive format that cannot be updated
+            _emit("error", message=str(e))
+            return 1
+
+        checkpoint = (
+            None
+            if job["attributes_only"]
+            else Checkpoint.create(checkpoint_path(job), job)
+        )
+
+    total = len(job["tags"])
+
+    # Ctrl+C stops the extraction between time windows and closes the archive
+    cancel_token = CancellationToken()
+    signal.signal(signal.SIGINT, lambda signum, frame: cancel_token.cancel())
+    progress = ProgressThrottle(
+        total,
+        lambda snapshot: _emit("progress", **snapshot),
+        interval=PROGRESS_INTERVAL_SECONDS,
+    )
+
+    report = JobReport(job)
+    profiler = (
+        OperationProfiler(job_file_path(job, ""), title=f"Extraction of {total} tags")
+        if profiling_requested()
+        else None
+    )
+
+    _emit(
+        "start",
+        connection=job["src_conn"],
+        archive=job["archive"],
+        tags=total,
+        resume=bool(args.resume),
+    )
+
+    try:
+        with LocalAgent() as agent:
+            if not agent.api.is_connected(job["src_conn"]):
+                agent.api.enable_connection(job["src_conn"])
+
+            with profiler or contextlib.nullcontext():
+                failures = _run_with_progress(
+                    progress,
+                    run_job,
+                    agent.api,
+                    job,
+                    checkpoint=checkpoint,
+                    resume=bool(args.resume),
+                    progress_callback=progress.tag_completed,
+                    confirm_append=(lambda e: True) if args.append else None,
+                    cancel_token=cancel_token,
+                    window_callback=progress.window_read,
+                    report=report,
+                )
+            progress.flush()
+
+        report.finish("completed", failures=failures)
+
+    except ExtractionCancelled:
+        report.finish("cancelled")
+        _emit("cancelled", checkpoint=checkpoint.path if checkpoint else None)
+        return 130
+
+    except Exception as e:
+        report.finish("failed", error=e)
+        log.exception("Extraction failed")
+        _emit(
+            "error",
+            message=str(e),
+            checkpoint=checkpoint.path if checkpoint else None,
+        )
+        return 1
+
+    finally:
+        if checkpoint:
+            checkpoint.close()
+
+        _save_report(report, job, args.prometheus)
+        if profiler:
+            _emit("profile", path=profiler.summary_path)
+
+    for failure in failures or []:
+        _emit("failed", **failure)
+
+    if failures:
+        _emit(
+            "completed",
+            archive=job["archive"],
+            tags=total,
+            failed=len(failures),
+            checkpoint=checkpoint.path if checkpoint else None,
+        )
+        return 2
+
+    if checkpoint:
+        checkpoint.remove()
+
+    _emit("completed", archive=job["archive"], tags=total)
+    return 0
+
+
+def run():
+    sys.exit(main(sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,439 @@
+"""
+Parquet archive connector.
+
+The archive is a single Parquet file in long format - one row per (tag, timestamp) with
+typed, compressed columns. Every stored frame becomes its own row group holding a single
+tag, so readers can prune both columns and row groups, i.e.:
+
+    pd.read_parquet(path, columns=["tag", "timestamp", "value"],
+                    filters=[("tag", "in", ["TAG1", "TAG2"])])
+
+Tag attributes and the group layout are stored in the file key-value metadata.
+
+Parquet files cannot be extended. The frames of a session are written to a part file
+next to the archive, which becomes the archive on disconnect - merged with the stored
+row groups when the archive already exists. The archive is only replaced once the new
+one is complete, the files of an interrupted session are dropped on the next connect.
+"""
+
+import json
+import logging
+import os
+from typing import Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data_agent.abstract_connector import (
+    AbstractConnector,
+    SupportedOperation,
+    active_connection,
+)
+
+log = logging.getLogger(__name__)
+
+
+class ParquetConnector(AbstractConnector):
+    TYPE = "parquet"
+    CATEGORY = "archive"
+    SUPPORTED_FILTERS = []
+    SUPPORTED_OPERATIONS = [
+        SupportedOperation.READ_TAG_PERIOD,
+        SupportedOperation.WRITE_TAG_PERIOD,
+        SupportedOperation.WRITE_TAG_META,
+    ]
+    DEFAULT_ATTRIBUTES = [
+        ("Name", {"Type": "str", "Name": "Tag Name"}),
+        ("Description", {"Type": "str", "Name": "Description"}),
+        ("EngUnits", {"Type": "str", "Name": "Eng. Units"}),
+    ]
+
+    TAG_COL = "tag"
+    TIMESTAMP_COL = "timestamp"
+    VALUE_COL = "value"
+    # Non numeric values (i.e. digital states) are kept as text
+    TEXT_COL = "text"
+    GROUP_DELIMITER = "::"
+    COMPRESSION = "zstd"
+
+    ATTRIBUTES_METADATA_KEY = b"tag_attributes"
+    GROUPS_METADATA_KEY = b"groups"
+
+    PART_SUFFIX = ".part"
+    MERGE_SUFFIX = ".merge"
+    # Left by versions moving the archive aside while rewriting it
+    BACKUP_SUFFIX = ".bak"
+
+    SCHEMA = pa.schema(
+        [
+            (TAG_COL, pa.string()),
+            (TIMESTAMP_COL, pa.timestamp("ns", tz="UTC")),
+            (VALUE_COL, pa.float64()),
+            (TEXT_COL, pa.string()),
+        ]
+    )
+
+    def __init__(self, conn_name="parquet_archive", parquet_path=None):
+        super(ParquetConnector, self).__init__(conn_name)
+
+        self._parquet_path = parquet_path
+        self._connected = False
+        self._writer = None
+        self._metadata_changed = False
+        self._attributes = {}
+        self._groups = {}
+        self._written_bytes = {}
+
+    @staticmethod
+    def list_connection_fields():
+        return {
+            "parquet_path": {
+                "name": "Parquet File",
+                "type": "local_file",
+                "default_value": "c:\\temp\\data.parquet",
+                "optional": False,
+            }
+        }
+
+    @staticmethod
+    def target_info(target_ref):
+        return {}
+
+    @staticmethod
+    def is_valid_archive(path):
+        """Parquet file with a footer, it is written last"""
+        try:
+            pq.read_metadata(path)
+        except (OSError, pa.ArrowException):
+            return False
+
+        return True
+
+    @property
+    def connected(self):
+        return self._connected
+
+    def connect(self):
+        self._attributes = {}
+        self._groups = {}
+        self._metadata_changed = False
+        self._written_bytes = {}
+        self._recover()
+
+        if os.path.exists(self._parquet_path):
+            metadata = pq.read_metadata(self._parquet_path).metadata or {}
+            if self.ATTRIBUTES_METADATA_KEY in metadata:
+                self._attributes = json.loads(metadata[self.ATTRIBUTES_METADATA_KEY])
+            if self.GROUPS_METADATA_KEY in metadata:
+                self._groups = json.loads(metadata[self.GROUPS_METADATA_KEY])
+
+        self._connected = True
+
+    @active_connection
+    def disconnect(self):
+        if self._writer is None and self._metadata_changed:
+            # Metadata only (i.e. attributes only extraction)
+            self._open_writer()
+
+        if self._writer is not None:
+            self._writer.add_key_value_metadata(self._metadata())
+            self._writer.close()
+            self._writer = None
+            self._count_written_bytes()
+            self._commit()
+
+        self._connected = False
+
+    @property
+    def written_bytes(self):
+        """Compressed bytes written to the archive by the last session, by group.
+        Complete once disconnected."""
+        return dict(self._written_bytes)
+
+    @active_connection
+    def connection_info(self):
+        return {
+            "OneLiner": f"[{self.TYPE}] {self._parquet_path}",
+            "Path": self._parquet_path,
+        }
+
+    @active_connection
+    def list_tags(
+        self,
+        filter: Union[str, list] = "",
+        include_attributes: Union[bool, list] = False,
+        recursive: bool = False,
+        max_results: int = 0,
+    ):
+        tags = [t for tags in self._groups.values() for t in tags]
+
+        if isinstance(filter, list):
+            tags = [t for t in tags if t in filter]
+        elif filter:
+            tags = [t for t in tags if filter.lower() in t.lower()]
+
+        if max_results:
+            tags = tags[:max_results]
+
+        return {
+            tag: {
+                **(self._attributes.get(tag, {}) if include_attributes else {}),
+                "Name": tag,
+                "HasChildren": False,
+            }
+            for tag in tags
+        }
+
+    @active_connection
+    def list_groups(self) -> list:
+        return list(self._groups)
+
+    @active_connection
+    def group_last_timestamps(self, groups=None):
+        """Last stored timestamp of every group, taken from row group statistics"""
+        tag_groups = {
+            tag: group
+            for group, tags in self._groups.items()
+            if groups is None or group in groups
+            for tag in tags
+        }
+        if not tag_groups or not os.path.exists(self._parquet_path):
+            return {}
+
+        metadata = pq.read_metadata(self._parquet_path)
+        names = metadata.schema.names
+        tag_col = names.index(self.TAG_COL)
+        timestamp_col = names.index(self.TIMESTAMP_COL)
+
+        res = {}
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            tag_stats = row_group.column(tag_col).statistics
+            timestamp_stats = row_group.column(timestamp_col).statistics
+            if row_group.num_rows == 0 or tag_stats is None or timestamp_stats is None:
+                continue
+
+            group = tag_groups.get(tag_stats.min)
+            if group is None:
+                continue
+
+            last = pd.Timestamp(timestamp_stats.max)
+            if group not in res or last > res[group]:
+                res[group] = last
+
+        return res
+
+    @active_connection
+    def read_tag_attributes(self, tags: list, attributes: list = None):
+        return {
+            tag: {
+                a: v
+                for a, v in self._attributes.get(tag, {}).items()
+                if not attributes or a in attributes
+            }
+            for tag in tags
+        }
+
+    @active_connection
+    def write_tag_attributes(self, tags: dict):
+        self._attributes.update(tags)
+        self._metadata_changed = True
+
+    @active_connection
+    def read_tag_values(self, tags: list):
+        return self.read_tag_values_period(tags)
+
+    @active_connection
+    def read_tag_values_period(
+        self,
+        tags: list,
+        first_timestamp=None,
+        last_timestamp=None,
+        time_frequency=None,
+        result_format="dataframe",
+        progress_callback=None,
+    ):
+        filters = [(self.TAG_COL, "in", list(tags))]
+        if first_timestamp is not None:
+            filters.append((self.TIMESTAMP_COL, ">=", self._utc(first_timestamp)))
+        if last_timestamp is not None:
+            filters.append((self.TIMESTAMP_COL, "<=", self._utc(last_timestamp)))
+
+        df = pq.read_table(
+            self._parquet_path, schema=self.SCHEMA, filters=filters
+        ).to_pandas()
+
+        return self._to_wide(df, tags)
+
+    @active_connection
+    def write_tag_values(self, tags: dict, wait_for_result: bool = True, **kwargs):
+        pass
+
+    @active_connection
+    def read_group_values_period(
+        self,
+        group_name: str,
+        first_timestamp=None,
+        last_timestamp=None,
+        from_cache: bool = True,
+    ):
+        tags = self._groups[group_name]
+        df = self.read_tag_values_period(tags, first_timestamp, last_timestamp)
+        df.columns = [self._column_name(group_name, tag) for tag in df.columns]
+        return df
+
+    @active_connection
+    def write_group_values_period(
+        self,
+        group_name: str,
+        df: pd.DataFrame,
+        wait_for_result: bool = True,
+        on_conflict="append",
+        **kwargs,
+    ) -> dict:
+        assert on_conflict in ["append", "ignore"]
+
+        if on_conflict == "ignore" and group_name in self._groups:
+            return
+
+        if self._writer is None:
+            self._open_writer()
+
+        group_tags = self._groups.setdefault(group_name, [])
+        timestamps = pa.array(self._utc_index(df.index), type=pa.timestamp("ns", "UTC"))
+
+        for col in df.columns:
+            tag = self._tag_name(group_name, col)
+            if tag not in group_tags:
+                group_tags.append(tag)
+                self._metadata_changed = True
+
+            if len(df.index) == 0:
+                continue
+
+            values = pd.to_numeric(df[col], errors="coerce")
+            text = df[col].where(values.isna() & df[col].notna())
+
+            table = pa.Table.from_arrays(
+                [
+                    pa.array([tag] * len(df.index), type=pa.string()),
+                    timestamps,
+                    pa.array(values, type=pa.float64(), from_pandas=True),
+                    pa.array(
+                        text.map(str, na_action="ignore"),
+                        type=pa.string(),
+                        from_pandas=True,
+                    ),
+                ],
+                schema=self.SCHEMA,
+            )
+
+            # A row group per tag and frame keeps row group statistics selective
+            self._writer.write_table(table, row_group_size=len(df.index))
+
+    def _open_writer(self):
+        self._writer = pq.ParquetWriter(
+            f"{self._parquet_path}{self.PART_SUFFIX}",
+            self.SCHEMA,
+            compression=self.COMPRESSION,
+        )
+
+    def _metadata(self):
+        return {
+            self.ATTRIBUTES_METADATA_KEY: json.dumps(self._attributes, default=str),
+            self.GROUPS_METADATA_KEY: json.dumps(self._groups),
+        }
+
+    def _count_written_bytes(self):
+        """Sum the compressed row groups of the part file by group"""
+        tag_groups = {
+            tag: group for group, tags in self._groups.items() for tag in tags
+        }
+
+        metadata = pq.read_metadata(f"{self._parquet_path}{self.PART_SUFFIX}")
+        tag_col = metadata.schema.names.index(self.TAG_COL)
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            tag_stats = row_group.column(tag_col).statistics
+            group = tag_groups.get(tag_stats.min) if tag_stats is not None else None
+            if group is None:
+                continue
+
+            self._written_bytes[group] = self._written_bytes.get(group, 0) + sum(
+                row_group.column(j).total_compressed_size
+                for j in range(row_group.num_columns)
+            )
+
+    def _commit(self):
+        """Replace the archive with the stored row groups followed by the part file"""
+        part_path = f"{self._parquet_path}{self.PART_SUFFIX}"
+        if not os.path.exists(self._parquet_path):
+            os.replace(part_path, self._parquet_path)
+            return
+
+        merge_path = f"{self._parquet_path}{self.MERGE_SUFFIX}"
+        with pq.ParquetWriter(
+            merge_path, self.SCHEMA, compression=self.COMPRESSION
+        ) as writer:
+            for path in [self._parquet_path, part_path]:
+                source = pq.ParquetFile(path)
+                for i in range(source.num_row_groups):
+                    writer.write_table(source.read_row_group(i))
+                source.close()
+            writer.add_key_value_metadata(self._metadata())
+
+        os.replace(merge_path, self._parquet_path)
+        os.remove(part_path)
+
+    def _recover(self):
+        """Drop the files of an interrupted session, the archive is left as it was"""
+        backup_path = f"{self._parquet_path}{self.BACKUP_SUFFIX}"
+        if os.path.exists(backup_path):
+            if self.is_valid_archive(self._parquet_path):
+                os.remove(backup_path)
+            else:
+                log.warning(f"Restoring {self._parquet_path} from {backup_path}")
+                os.replace(backup_path, self._parquet_path)
+
+        for suffix in [self.PART_SUFFIX, self.MERGE_SUFFIX]:
+            path = f"{self._parquet_path}{suffix}"
+            if os.path.exists(path):
+                log.warning(f"Dropping {path} of an interrupted extraction")
+                os.remove(path)
+
+    def _tag_name(self, group_name, col):
+        col = str(col)
+        return col if col == group_name else f"{group_name}{self.GROUP_DELIMITER}{col}"
+
+    def _column_name(self, group_name, tag):
+        prefix = f"{group_name}{self.GROUP_DELIMITER}"
+        return tag[len(prefix) :] if tag.startswith(prefix) else tag
+
+    @staticmethod
+    def _utc(ts):
+        ts = pd.Timestamp(ts)
+        return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+    @staticmethod
+    def _utc_index(index):
+        index = pd.DatetimeIndex(index)
+        return index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+
+    def _to_wide(self, df, tags):
+        df = df.drop_duplicates([self.TAG_COL, self.TIMESTAMP_COL], keep="last")
+
+        values = df[self.VALUE_COL]
+        if df[self.TEXT_COL].notna().any():
+            values = values.astype(object).where(
+                df[self.TEXT_COL].isna(), df[self.TEXT_COL]
+            )
+
+        wide = (
+            df.assign(**{self.VALUE_COL: values})
+            .pivot(
+                index=self.TIMESTAMP_COL, columns=self.TAG_COL, values=self.VALUE_COL
+            )
+            .reindex(columns=[t for t in tags if t in set(df[self.TAG_COL])])
+        )
+        wide.columns.name = None
+        return wide
@@ -0,0 +1,321 @@
+"""
+Synthetic historian connector.
+
+Generates a deterministic tag catalog and time series of configurable size and density,
+and delays every request by an injectable latency, so tag browsing and extraction can be
+benchmarked (or reproduced) without a PI or IP21 server. Values depend on the tag and the
+timestamp only - any split of a period into windows or requests reads the same samples.
+Like PI, naive period bounds are local time and the returned index is naive UTC.
+
+The connector is not registered as a data agent plugin, the tests and benchmarks pass it
+to their ConnectionManager (see tests/benchmarks/benchmark_utils.py).
+"""
+
+import fnmatch
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Union
+
+import numpy as np
+import pandas as pd
+from data_agent.abstract_connector import (
+    AbstractConnector,
+    SupportedOperation,
+    active_connection,
+)
+
+from qt_data_extractor.timestamps import to_utc
+
+DEFAULT_TAGS_COUNT = 10000
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 60
+# Period read when the request does not specify one
+DEFAULT_READ_PERIOD = timedelta(days=1)
+RAW_DATA_FREQUENCY = "Raw Data"
+
+TAG_KINDS = [
+    ("TI", "Temperature", "degC"),
+    ("PI", "Pressure", "barg"),
+    ("FI", "Flow", "m3/h"),
+    ("LI", "Level", "%"),
+    ("AI", "Analyzer", "ppm"),
+]
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+def _pattern(filter):
+    """Case insensitive regular expression of a tag filter (`*`, `%` and `?` wildcards)"""
+    return re.compile(
+        fnmatch.translate(filter.replace("%", "*")), flags=re.IGNORECASE
+    ).match
+
+
+class SyntheticHistorianConnector(AbstractConnector):
+    """
+    Historian serving generated data.
+
+    :param tags_count: Number of tags of the catalog
+    :param sample_interval: Seconds between raw samples of a tag
+    :param latency: Seconds every request takes
+    :param latency_per_1k_values: Additional seconds per thousand returned values
+    :param tag_prefix: Prefix of the tag names
+    :param seed: Seed of the generated values
+    """
+
+    TYPE = "synthetic"
+    CATEGORY = "historian"
+    SUPPORTED_FILTERS = []
+    SUPPORTED_OPERATIONS = [
+        SupportedOperation.READ_TAG_PERIOD,
+        SupportedOperation.READ_TAG_META,
+    ]
+    DEFAULT_ATTRIBUTES = [
+        ("Name", {"Type": "str", "Name": "Tag Name"}),
+        ("Description", {"Type": "str", "Name": "Description"}),
+        ("EngUnits", {"Type": "str", "Name": "Eng. Units"}),
+    ]
+
+    def __init__(
+        self,
+        conn_name="synthetic_historian",
+        tags_count=DEFAULT_TAGS_COUNT,
+        sample_interval=DEFAULT_SAMPLE_INTERVAL_SECONDS,
+        latency=0,
+        latency_per_1k_values=0,
+        tag_prefix="SYN",
+        seed=0,
+    ):
+        super(SyntheticHistorianConnector, self).__init__(conn_name)
+
+        # Connection dialog fields are strings
+        self._tags_count = int(tags_count)
+        self._sample_interval = float(sample_interval)
+        self._latency = float(latency)
+        self._latency_per_1k_values = float(latency_per_1k_values)
+        self._tag_prefix = tag_prefix
+        self._seed = int(seed)
+        self._connected = False
+        self._names = []
+        self._index = {}
+
+    @staticmethod
+    def plugin_supported():
+        return True
+
+    @staticmethod
+    def list_connection_fields():
+        return {
+            "tags_count": {
+                "name": "Number of Tags",
+                "type": "str",
+                "default_value": str(DEFAULT_TAGS_COUNT),
+                "optional": True,
+            },
+            "sample_interval": {
+                "name": "Sample Interval (seconds)",
+                "type": "str",
+                "default_value": str(DEFAULT_SAMPLE_INTERVAL_SECONDS),
+                "optional": True,
+            },
+            "latency": {
+                "name": "Request Latency (seconds)",
+                "type": "str",
+                "default_value": "0",
+                "optional": True,
+            },
+        }
+
+    @staticmethod
+    def target_info(target_ref):
+        return {"Name": "synthetic", "Endpoints": []}
+
+    @property
+    def connected(self):
+        return self._connected
+
+    def connect(self):
+        self._names = [self.tag_name(i) for i in range(self._tags_count)]
+        self._index = {name.lower(): i for i, name in enumerate(self._names)}
+        self._connected = True
+
+    def disconnect(self):
+        self._names = []
+        self._index = {}
+        self._connected = False
+
+    @active_connection
+    def connection_info(self):
+        return {
+            "OneLiner": f"[{self.TYPE}] {self._tags_count} tags, "
+            f"{self._sample_interval:g}s samples",
+            "TagsCount": self._tags_count,
+            "SampleInterval": self._sample_interval,
+            "Latency": self._latency,
+        }
+
+    def tag_name(self, number):
+        kind = TAG_KINDS[number % len(TAG_KINDS)][0]
+        return f"{self._tag_prefix}:{kind}{number:06d}.PV"
+
+    def _attributes(self, number, attributes=None):
+        _, description, units = TAG_KINDS[number % len(TAG_KINDS)]
+        res = {
+            "Name": self._names[number],
+            "Description": f"{description} {number}",
+            "EngUnits": units,
+            "Type": "Float64",
+            "Path": self._names[number],
+            "HasChildren": False,
+        }
+        if attributes:
+            res = {k: v for k, v in res.items() if k in attributes}
+        return res
+
+    def _find(self, filter):
+        """Numbers of the tags matching a filter, in catalog order"""
+        if filter in ("", "*", "%"):
+            return range(len(self._names))
+
+        if not any(c in filter for c in "*%?"):
+            number = self._index.get(filter.lower())
+            return [] if number is None else [number]
+
+        match = _pattern(filter)
+        return [i for i, name in enumerate(self._names) if match(name)]
+
+    def _delay(self, values=0):
+        seconds = self._latency + self._latency_per_1k_values * values / 1000
+        if seconds > 0:
+            time.sleep(seconds)
+
+    @active_connection
+    def list_tags(
+        self,
+        filter: Union[str, list] = "",
+        include_attributes: Union[bool, list] = False,
+        recursive: bool = False,
+        max_results: int = 0,
+    ):
+        numbers = []
+        seen = set()
+        for item in filter if isinstance(filter, list) else [filter]:
+            for number in self._find(item):
+                if number not in seen:
+                    seen.add(number)
+                    numbers.append(number)
+            if max_results and len(numbers) >= max_results:
+                numbers = numbers[:max_results]
+                break
+
+        if not include_attributes:
+            attributes = ["Name", "HasChildren"]
+        elif isinstance(include_attributes, list):
+            attributes = ["Name", "HasChildren"] + include_attributes
+        else:
+            attributes = None
+
+        res = {
+            self._names[number]: self._attributes(number, attributes)
+            for number in numbers
+        }
+
+        self._delay(len(res))
+        return res
+
+    @active_connection
+    def read_tag_attributes(self, tags: list, attributes: list = None):
+        res = {}
+        for tag in tags:
+            number = self._index.get(tag.lower())
+            if number is not None:
+                res[tag] = self._attributes(number, attributes)
+
+        self._delay(len(res))
+        return res
+
+    @active_connection
+    def read_tag_values(self, tags: list):
+        step = self._step_ns(None)
+        now = np.array([pd.Timestamp.now().value // step * step], dtype=np.int64)
+        res = {
+            tag: {
+                "Value": float(self._values(self._number(tag), now)[0]),
+                "Quality": "Good",
+                "Timestamp": pd.Timestamp(now[0]).to_pydatetime(),
+            }
+            for tag in tags
+        }
+
+        self._delay(len(res))
+        return res
+
+    @active_connection
+    def read_tag_values_period(
+        self,
+        tags: list,
+        first_timestamp=None,
+        last_timestamp=None,
+        time_frequency=None,
+        max_results=None,
+        result_format="dataframe",
+        progress_callback=None,
+    ):
+        numbers = [self._number(tag) for tag in tags]
+
+        last = pd.Timestamp(to_utc(last_timestamp or datetime.now()))
+        first = pd.Timestamp(to_utc(first_timestamp) or last - DEFAULT_READ_PERIOD)
+        step = self._step_ns(time_frequency)
+
+        # Samples are aligned to the epoch, so overlapping requests read the same ones
+        start = -(-first.value // step) * step
+        timestamps = np.arange(start, last.value + 1, step, dtype=np.int64)
+        if max_results:
+            timestamps = timestamps[:max_results]
+
+        df = pd.DataFrame(
+            {tag: self._values(n, timestamps) for tag, n in zip(tags, numbers)},
+            index=pd.DatetimeIndex(
+                timestamps.astype("datetime64[ns]"), name="timestamp"
+            ),
+            columns=tags,
+        )
+
+        self._delay(len(timestamps) * len(tags))
+        return df
+
+    @active_connection
+    def write_tag_values(self, tags: dict, wait_for_result: bool = True, **kwargs):
+        raise ValueError("Synthetic historian is read only")
+
+    def _number(self, tag):
+        number = self._index.get(tag.lower())
+        if number is None:
+            raise ValueError(f"Tag '{tag}' not found")
+        return number
+
+    def _step_ns(self, time_frequency):
+        """Nanoseconds between samples - raw data or `time_frequency` (i.e. "1 minute")"""
+        step = pd.Timedelta(seconds=self._sample_interval)
+        if time_frequency and time_frequency != RAW_DATA_FREQUENCY:
+            try:
+                step = pd.Timedelta(time_frequency)
+            except ValueError:
+                pass
+
+        return max(int(step.value), 1)
+
+    def _values(self, number, timestamps):
+        """Slow wave of the tag plus noise hashed from the timestamp"""
+        seconds = timestamps // _NS_PER_SECOND
+        period = 3600.0 * (1 + number % 24)
+        offset = 10.0 * (number % 100)
+        wave = offset + 5.0 * np.sin(2 * np.pi * (seconds % period) / period)
+
+        x = seconds.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+        x ^= np.uint64((number + self._seed * 0x10001) * 0xBF58476D1CE4E5B9 % 2**64)
+        x ^= x >> np.uint64(31)
+        x *= np.uint64(0x94D049BB133111EB)
+        x ^= x >> np.uint64(29)
+        noise = (x & np.uint64(0xFFFFFF)).astype(np.float64) / 0x1000000 - 0.5
+        return wave + noise
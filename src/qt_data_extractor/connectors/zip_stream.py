@@ -0,0 +1,243 @@
+import collections
+import io
+import logging
+import os
+import shutil
+import tempfile
+import zipfile
+
+import pandas as pd
+from data_agent.abstract_connector import active_connection
+from data_agent_zip.connector import ZipConnector, csv_file_extension_validate
+
+log = logging.getLogger(__name__)
+
+
+class StreamingZipConnector(ZipConnector):
+    """
+    Zip connector that appends to groups without keeping them in memory.
+
+    Zip entries cannot be extended once written, so appended frames are spooled to a CSV
+    file on disk and moved into the archive when the group is closed (or on disconnect).
+
+    Frames appended to a group already stored in a reopened archive (an update) are
+    spooled alone. On disconnect the archive is rewritten once, extending these entries
+    with their spooled rows and dropping superseded entries - an update reads only the new
+    data from the historian, but still costs a rewrite of the archive.
+    """
+
+    TYPE = "zip-stream"
+
+    def __init__(self, conn_name="zip_archive", zipfile_path=None, spool_dir=None):
+        super(StreamingZipConnector, self).__init__(conn_name, zipfile_path)
+
+        self._spool_dir = spool_dir
+        self._spool_dir_owned = False
+        self._spools = {}
+        # Closed spools of groups stored in the reopened archive, merged on disconnect
+        self._appended = {}
+        self._written_bytes = {}
+
+    def connect(self):
+        super(StreamingZipConnector, self).connect()
+        self._written_bytes = {}
+
+        # Keep the tags list of a reopened archive, the base connector starts an empty one
+        self._stored_tags_list_len = 0
+        if self.TAGS_LIST_FILE in self._zipfile.namelist():
+            with self._zipfile.open(self.TAGS_LIST_FILE) as fl:
+                self._tags_list_df = pd.read_csv(fl)
+            self._stored_tags_list_len = len(self._tags_list_df.index)
+
+        if self._spool_dir is None:
+            self._spool_dir = tempfile.mkdtemp(
+                prefix=".spool-",
+                dir=os.path.dirname(os.path.abspath(self._zipfile_path)),
+            )
+            self._spool_dir_owned = True
+        else:
+            os.makedirs(self._spool_dir, exist_ok=True)
+
+    @staticmethod
+    def is_valid_archive(path):
+        """Zip file with a central directory - a killed extraction leaves none"""
+        return zipfile.is_zipfile(path)
+
+    @active_connection
+    def disconnect(self):
+        for group in list(self._spools):
+            self.close_group(group)
+
+        if self._stored_tags_list_len and self._stored_tags_list_len == len(
+            self._tags_list_df.index
+        ):
+            # Tags list is unchanged, skip writing a duplicate entry
+            self._zipfile.close()
+            self._zipfile = None
+        else:
+            super(StreamingZipConnector, self).disconnect()
+
+        self._compact()
+        for spool_path in self._appended.values():
+            os.remove(spool_path)
+        self._appended = {}
+
+        if self._spool_dir_owned:
+            shutil.rmtree(self._spool_dir, ignore_errors=True)
+            self._spool_dir = None
+            self._spool_dir_owned = False
+
+    @property
+    def written_bytes(self):
+        """Compressed bytes written to the archive by the last session, by group (group
+        names without extension). Complete once disconnected."""
+        return dict(self._written_bytes)
+
+    @active_connection
+    def list_groups(self) -> list:
+        groups = super(StreamingZipConnector, self).list_groups()
+        return groups + [g for g in self._spools if g not in groups]
+
+    @active_connection
+    def group_last_timestamps(self, groups=None):
+        """Last stored timestamp of every group (group names without extension)"""
+        res = {}
+
+        for group in self.list_groups():
+            name = group[: -len(".csv")] if group.lower().endswith(".csv") else group
+            if groups is not None and name not in groups:
+                continue
+
+            last_line = None
+            spool_path = self._spools.get(group) or self._appended.get(group)
+            if spool_path:
+                with open(spool_path, "r", newline="") as fl:
+                    last_line = collections.deque(fl, maxlen=1)
+
+            fqn = f"{self.DATA_FOLDER}/{group}"
+            # Rows appended to a stored group are spooled alone, nothing new yet
+            if not last_line and fqn in self._zipfile.namelist():
+                # Entries are compressed - the stream is decompressed, but not parsed
+                with self._zipfile.open(fqn) as entry:
+                    last_line = collections.deque(
+                        io.TextIOWrapper(entry, newline=""), maxlen=1
+                    )
+
+            if not last_line:
+                continue
+
+            try:
+                res[name] = pd.Timestamp(last_line[0].split(",", 1)[0])
+            except ValueError:
+                # Header only
+                continue
+
+        return res
+
+    @active_connection
+    @csv_file_extension_validate
+    def write_group_values_period(
+        self,
+        group_name: str,
+        df: pd.DataFrame,
+        wait_for_result: bool = True,
+        on_conflict="append",
+        **kwargs,
+    ) -> dict:
+        assert on_conflict in ["append", "ignore"]
+
+        if group_name in self._appended:
+            # Appended again after being closed
+            self._spools[group_name] = self._appended.pop(group_name)
+
+        if group_name not in self._spools:
+            stored = f"{self.DATA_FOLDER}/{group_name}" in self._zipfile.namelist()
+            if stored and on_conflict == "ignore":
+                return
+
+            fd, spool_path = tempfile.mkstemp(suffix=".csv", dir=self._spool_dir)
+            os.close(fd)
+            self._spools[group_name] = spool_path
+            # Rows of a stored group are appended to its entry (with its header)
+            header = not stored
+        else:
+            header = False
+
+        df.to_csv(self._spools[group_name], mode="a", header=header)
+
+    @active_connection
+    @csv_file_extension_validate
+    def close_group(self, group_name: str):
+        """Move the spooled group into the archive
+
+        Rows appended to a stored group are kept spooled, they extend its entry when the
+        archive is rewritten on disconnect.
+        """
+        spool_path = self._spools.pop(group_name, None)
+        if spool_path is None:
+            return
+
+        fqn = f"{self.DATA_FOLDER}/{group_name}"
+        if fqn in self._zipfile.namelist():
+            self._appended[group_name] = spool_path
+            return
+
+        self._zipfile.write(spool_path, arcname=fqn)
+        os.remove(spool_path)
+        self._add_written_bytes(group_name, self._zipfile.getinfo(fqn).compress_size)
+
+    def _compact(self):
+        """Rewrite the archive once to extend stored groups and drop superseded entries
+
+        Stored groups are extended with their appended rows, superseded entries (i.e. the
+        tags list of a reopened archive) are dropped.
+        """
+        appended = {
+            f"{self.DATA_FOLDER}/{group}": spool_path
+            for group, spool_path in self._appended.items()
+        }
+
+        with zipfile.ZipFile(self._zipfile_path, "r") as src:
+            entries = {}
+            for info in src.infolist():
+                entries[info.filename] = info
+
+            if len(entries) == len(src.infolist()) and not appended:
+                return
+
+            fd, compact_path = tempfile.mkstemp(
+                suffix=".zip", dir=os.path.dirname(os.path.abspath(self._zipfile_path))
+            )
+            os.close(fd)
+
+            with zipfile.ZipFile(
+                compact_path, "w", compression=zipfile.ZIP_DEFLATED
+            ) as dest:
+                for info in entries.values():
+                    # A new ZipInfo is stored uncompressed unless told otherwise
+                    dest_info = zipfile.ZipInfo(info.filename, info.date_time)
+                    dest_info.compress_type = info.compress_type
+                    with src.open(info) as src_entry, dest.open(
+                        dest_info, "w"
+                    ) as dest_entry:
+                        shutil.copyfileobj(src_entry, dest_entry)
+                        if info.filename in appended:
+                            with open(appended[info.filename], "rb") as spool:
+                                shutil.copyfileobj(spool, dest_entry)
+
+                    if info.filename in appended:
+                        # The entry grew by the compressed appended rows
+                        self._add_written_bytes(
+                            info.filename[len(self.DATA_FOLDER) + 1 :],
+                            max(dest_info.compress_size - info.compress_size, 0),
+                        )
+
+        os.replace(compact_path, self._zipfile_path)
+
+    def _add_written_bytes(self, group_name, nbytes):
+        name = (
+            group_name[: -len(".csv")]
+            if group_name.lower().endswith(".csv")
+            else group_name
+        )
+        self._written_bytes[name] = self._written_bytes.get(name, 0) + nbytes
@@ -0,0 +1,95 @@
+"""
+Time series decimation for plotting.
+
+A chart cannot show more points than it has pixels, so series are reduced to a few
+points per pixel before plotting. Min/max decimation keeps the extremes of every pixel
+bucket (outliers and spikes stay visible), LTTB (Largest Triangle Three Buckets) keeps
+the points that best preserve the visual shape. Both work on NumPy arrays.
+"""
+
+import numpy as np
+
+DECIMATION_METHODS = ["minmax", "lttb"]
+
+
+def _valid(x, y):
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=float)
+    mask = ~np.isnan(y)
+    return x[mask], y[mask]
+
+
+def decimate_min_max(x, y, buckets):
+    """Keep the minimum and maximum point of each of `buckets` equal width x ranges
+
+    :param x: Sorted x values (i.e. timestamps as integers)
+    :param y: Values, NaNs are dropped
+    :param buckets: Number of buckets (i.e. chart width in pixels)
+    :return: (x, y) arrays of at most 2 * `buckets` points, in x order
+    """
+    x, y = _valid(x, y)
+    if len(x) <= 2 * buckets or buckets < 1:
+        return x, y
+
+    span = int(x[-1] - x[0]) + 1
+    bucket = ((x - x[0]) * buckets // span).astype(np.int64)
+
+    # Points ordered by bucket, then value - first point of a bucket is its minimum,
+    # last point its maximum
+    order = np.lexsort((y, bucket))
+    starts = np.flatnonzero(np.diff(bucket[order], prepend=-1))
+    ends = np.append(starts[1:], len(order)) - 1
+
+    keep = np.unique(np.concatenate((order[starts], order[ends])))
+    return x[keep], y[keep]
+
+
+def decimate_lttb(x, y, threshold):
+    """Largest Triangle Three Buckets downsampling to `threshold` points
+
+    :param x: Sorted x values (i.e. timestamps as integers)
+    :param y: Values, NaNs are dropped
+    :param threshold: Number of points to keep (including the first and the last)
+    :return: (x, y) arrays of at most `threshold` points, in x order
+    """
+    x, y = _valid(x, y)
+    n = len(x)
+    if n <= threshold or threshold < 3:
+        return x, y
+
+    xf = x.astype(float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average point of the next bucket (the last point for the last bucket)
+        next_start, next_end = end, edges[i + 2] if i + 2 < len(edges) else n
+        if next_start >= next_end:
+            next_start, next_end = n - 1, n
+        avg_x = xf[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (xf[a] - avg_x) * (y[start:end] - y[a])
+            - (xf[a] - xf[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax()) if end > start else start
+        keep[i + 1] = a
+
+    keep = np.unique(keep)
+    return x[keep], y[keep]
+
+
+def decimate(x, y, points, method="minmax"):
+    """Reduce a series to about `points` points with one of `DECIMATION_METHODS`"""
+    if method == "minmax":
+        return decimate_min_max(x, y, max(points // 2, 1))
+    if method == "lttb":
+        return decimate_lttb(x, y, points)
+
+    raise ValueError(f"Unknown decimation method '{method}'")
@@ -0,0 +1,40 @@
+"""
+Widgets of the Qt Designer forms.
+
+The forms (*.ui) are compiled into the ui_*.py modules ahead of time (`tox -e uic`), so
+no form is parsed at startup. Child widgets are attributes of the form widget, as with
+forms loaded by QUiLoader.
+"""
+
+from PySide6.QtWidgets import QDialog, QMainWindow
+
+from qt_data_extractor.design.ui_copy_progress import Ui_Dialog as Ui_CopyProgress
+from qt_data_extractor.design.ui_copy_prompt import Ui_Dialog as Ui_CopyPrompt
+from qt_data_extractor.design.ui_main_window import Ui_MainWindow
+from qt_data_extractor.design.ui_manage_connections import (
+    Ui_Dialog as Ui_ManageConnections,
+)
+
+
+class MainWindowForm(QMainWindow, Ui_MainWindow):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+
+class CopyPromptForm(QDialog, Ui_CopyPrompt):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+
+class CopyProgressForm(QDialog, Ui_CopyProgress):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+
+class ManageConnectionsForm(QDialog, Ui_ManageConnections):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
@@ -0,0 +1,293 @@
+import os
+
+from PySide6 import QtCore
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QDialogButtonBox,
+    QGridLayout,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QSpinBox,
+    QTableView,
+)
+
+from qt_data_extractor.job_queue import CANCELLED, COMPLETED, FAILED, QUEUED, RUNNING
+
+JOB_ROLE = Qt.UserRole + 1
+MAX_CONNECTION_JOB_SLOTS = 8
+PERIOD_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def _period(job):
+    if job["attributes_only"]:
+        return "Attributes only"
+
+    # Jobs are kept in UTC, the period is shown in local time as it was selected
+    return (
+        f"{job['first_timestamp'].astimezone():{PERIOD_FORMAT}} - "
+        f"{job['last_timestamp'].astimezone():{PERIOD_FORMAT}}"
+    )
+
+
+def _status(queued):
+    if queued.state == QUEUED:
+        return "Queued"
+    if queued.state == RUNNING:
+        return f"Running - {queued.completed_tags} / {queued.tags_count} tags"
+    if queued.state == COMPLETED:
+        if queued.failures:
+            return f"Completed, {len(queued.failures)} tags failed"
+        return "Completed"
+    if queued.state == FAILED:
+        return f"Failed - {queued.error}"
+    if queued.state == CANCELLED:
+        return "Cancelled"
+    return queued.state
+
+
+class JobQueueModel(QAbstractTableModel):
+    """
+    Table of the jobs of a JobQueue, in start order.
+
+    The queue is not observed, call `refresh` after it changes and `update_job` after
+    the progress of a job changes.
+
+    :param queue: JobQueue instance
+    """
+
+    COLUMNS = [
+        ("#", lambda q: q.id),
+        ("Priority", lambda q: q.priority),
+        ("Source", lambda q: q.conn_name),
+        ("Tags", lambda q: q.tags_count),
+        ("Period", lambda q: _period(q.job)),
+        ("Sample Rate", lambda q: q.job["time_frequency"]),
+        ("Destination", lambda q: os.path.basename(q.job["archive"])),
+        ("Status", _status),
+    ]
+
+    def __init__(self, queue, parent=None):
+        QAbstractTableModel.__init__(self, parent)
+        self._queue = queue
+        self._jobs = queue.jobs
+
+    def job(self, index):
+        """QueuedJob of the row of `index`"""
+        return self._jobs[index.row()]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        queued = self._jobs[index.row()]
+
+        if role == Qt.DisplayRole:
+            return str(self.COLUMNS[index.column()][1](queued))
+
+        if role == Qt.ToolTipRole:
+            if self.COLUMNS[index.column()][0] == "Destination":
+                return queued.job["archive"]
+            if queued.state == FAILED:
+                return str(queued.error)
+            return None
+
+        if role == JOB_ROLE:
+            return queued
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+
+        return None
+
+    def refresh(self):
+        """Follow jobs added, removed or reordered in the queue, keeping the selection"""
+        jobs = self._queue.jobs
+        if {q.id for q in jobs} != {q.id for q in self._jobs}:
+            self.beginResetModel()
+            self._jobs = jobs
+            self.endResetModel()
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_rows = {q.id: row for row, q in enumerate(self._jobs)}
+        self._jobs = jobs
+        columns = range(len(self.COLUMNS))
+        self.changePersistentIndexList(
+            [self.index(old_rows[q.id], c) for q in jobs for c in columns],
+            [self.index(row, c) for row in range(len(jobs)) for c in columns],
+        )
+        self.layoutChanged.emit()
+
+    def update_job(self, queued):
+        """Re-render the row of a job"""
+        for row, q in enumerate(self._jobs):
+            if q is queued:
+                self.dataChanged.emit(
+                    self.index(row, 0), self.index(row, len(self.COLUMNS) - 1)
+                )
+                return
+
+
+class JobQueueDialog(QDialog):
+    """
+    Panel of the extraction job queue - priorities, cancellation and job slots.
+
+    Running jobs are cancelled by the owner of their workers (`cancel_requested`),
+    changes that may let queued jobs start are signalled by `scheduling_changed`.
+
+    :param queue: JobQueue instance
+    """
+
+    scheduling_changed = QtCore.Signal()
+    cancel_requested = QtCore.Signal(object)
+
+    def __init__(self, queue, parent=None):
+        super().__init__(parent)
+
+        self._queue = queue
+        self.model = JobQueueModel(queue, self)
+
+        self._main_layout = QGridLayout()
+
+        self._table = QTableView()
+        self._table.setModel(self.model)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeToContents
+        )
+        self._table.horizontalHeader().setStretchLastSection(True)
+        self._main_layout.addWidget(self._table, 0, 0)
+
+        buttons = QHBoxLayout()
+        self._button_raise = QPushButton(self.tr("&Raise Priority"))
+        self._button_lower = QPushButton(self.tr("&Lower Priority"))
+        self._button_cancel = QPushButton(self.tr("&Cancel Job"))
+        self._button_remove = QPushButton(self.tr("Re&move"))
+        self._button_clear = QPushButton(self.tr("Clear &Finished"))
+        for button in [
+            self._button_raise,
+            self._button_lower,
+            self._button_cancel,
+            self._button_remove,
+            self._button_clear,
+        ]:
+            buttons.addWidget(button)
+        buttons.addStretch()
+
+        self._slots_label = QLabel("Jobs per connection:")
+        self._slots = QSpinBox()
+        self._slots.setRange(1, MAX_CONNECTION_JOB_SLOTS)
+        self._slots.setToolTip(
+            "Jobs running at the same time against the source connection of the "
+            "selected job"
+        )
+        buttons.addWidget(self._slots_label)
+        buttons.addWidget(self._slots)
+        self._main_layout.addLayout(buttons, 1, 0)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Close)
+        button_box.rejected.connect(self.hide)
+        self._main_layout.addWidget(button_box, 2, 0)
+
+        self.setLayout(self._main_layout)
+        self.resize(900, 350)
+
+        self._button_raise.clicked.connect(lambda: self._change_priority(1))
+        self._button_lower.clicked.connect(lambda: self._change_priority(-1))
+        self._button_cancel.clicked.connect(self._cancel_selected)
+        self._button_remove.clicked.connect(self._remove_selected)
+        self._button_clear.clicked.connect(self._clear_finished)
+        self._slots.valueChanged.connect(self._set_slots)
+        self._table.selectionModel().selectionChanged.connect(self._update_buttons)
+        self.model.modelReset.connect(self._update_buttons)
+        self.model.layoutChanged.connect(self._update_buttons)
+        self.model.dataChanged.connect(self._update_buttons)
+
+        self._update_buttons()
+
+    def refresh(self):
+        self.model.refresh()
+
+    def update_job(self, queued):
+        self.model.update_job(queued)
+
+    def _selected(self):
+        rows = self._table.selectionModel().selectedRows()
+        return self.model.job(rows[0]) if rows else None
+
+    @QtCore.Slot()
+    def _update_buttons(self):
+        queued = self._selected()
+        waiting = queued is not None and queued.state == QUEUED
+        self._button_raise.setEnabled(waiting)
+        self._button_lower.setEnabled(waiting)
+        self._button_cancel.setEnabled(
+            queued is not None and queued.state in [QUEUED, RUNNING]
+        )
+        self._button_remove.setEnabled(queued is not None and queued.state != RUNNING)
+        self._button_clear.setEnabled(any(q.is_finished for q in self._queue.jobs))
+
+        self._slots.setEnabled(queued is not None)
+        self._slots_label.setEnabled(queued is not None)
+        if queued is not None:
+            self._slots.blockSignals(True)
+            self._slots.setValue(
+                self._queue.connection_slots(queued.conn_name, queued.conn_type)
+            )
+            self._slots.blockSignals(False)
+            self._slots_label.setText(f"Jobs per connection ({queued.conn_name}):")
+
+    def _change_priority(self, change):
+        queued = self._selected()
+        if queued is None:
+            return
+
+        self._queue.set_priority(queued, queued.priority + change)
+        self.refresh()
+        self.scheduling_changed.emit()
+
+    def _cancel_selected(self):
+        queued = self._selected()
+        if queued is None:
+            return
+
+        if queued.state == RUNNING:
+            self.cancel_requested.emit(queued)
+        elif self._queue.cancel(queued):
+            self.refresh()
+
+    def _remove_selected(self):
+        queued = self._selected()
+        if queued is None or queued.state == RUNNING:
+            return
+
+        self._queue.remove(queued)
+        self.refresh()
+
+    def _clear_finished(self):
+        self._queue.clear_finished()
+        self.refresh()
+
+    @QtCore.Slot(int)
+    def _set_slots(self, slots):
+        queued = self._selected()
+        if queued is None:
+            return
+
+        self._queue.set_connection_slots(queued.conn_name, slots)
+        self.scheduling_changed.emit()
@@ -1,14 +1,66 @@
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
-from PySide6.QtWidgets import QDialog, QTableView, QVBoxLayout
+from PySide6.QtWidgets import QDialog, QHeaderView, QSplitter, QTableView, QVBoxLayout
 
+# Rows formatted at once, formatted blocks are cached (least recently used dropped)
+FORMAT_BLOCK_SIZE = 1000
+MAX_CACHED_BLOCKS = 64
+FLOAT_FORMAT = "%.6g"
+NAN_TEXT = ""
 
-class PandasModel(QAbstractTableModel):
-    """A model to interface a Qt view with pandas dataframe"""
+_ALIGN_NUMBER = int(Qt.AlignRight | Qt.AlignVCenter)
+_ALIGN_TEXT = int(Qt.AlignLeft | Qt.AlignVCenter)
+
+
+def format_values(values, float_format=FLOAT_FORMAT, nan_text=NAN_TEXT):
+    """Format a pandas Series / Index into a numpy array of strings"""
+    values = pd.Series(values)
+    missing = values.isna().to_numpy()
 
-    def __init__(self, dataframe: pd.DataFrame, parent=None):
+    if pd.api.types.is_float_dtype(values.dtype):
+        text = np.char.mod(float_format, values.to_numpy(dtype=float, na_value=np.nan))
+    else:
+        text = values.astype(str).to_numpy()
+
+    text = text.astype(object)
+    text[missing] = nan_text
+    return text
+
+
+class PandasModel(QAbstractTableModel):
+    """
+    A model to interface a Qt view with pandas dataframe.
+
+    Cells are formatted to strings column by column (vectorized) in blocks of rows, when
+    a block is first shown. Header labels and column alignments are computed up front, so
+    repaints only index into cached arrays.
+    """
+
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        parent=None,
+        block_size=FORMAT_BLOCK_SIZE,
+        max_cached_blocks=MAX_CACHED_BLOCKS,
+    ):
         QAbstractTableModel.__init__(self, parent)
         self._dataframe = dataframe
+        self._block_size = block_size
+        self._max_cached_blocks = max_cached_blocks
+        self._blocks = OrderedDict()
+
+        self._columns = [str(c) for c in dataframe.columns]
+        self._alignments = [
+            _ALIGN_NUMBER
+            if pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            else _ALIGN_TEXT
+            for dtype in dataframe.dtypes
+        ]
+        self._index = format_values(dataframe.index)
 
     def rowCount(self, parent=QModelIndex()) -> int:
         """Override method from QAbstractTableModel
@@ -26,7 +78,7 @@ class PandasModel(QAbstractTableModel):
         Return column count of the pandas DataFrame
         """
         if parent == QModelIndex():
-            return len(self._dataframe.columns)
+            return len(self._columns)
         return 0
 
     def data(self, index: QModelIndex, role=Qt.ItemDataRole):
@@ -38,7 +90,12 @@ class PandasModel(QAbstractTableModel):
             return None
 
         if role == Qt.DisplayRole:
-            return str(self._dataframe.iloc[index.row(), index.column()])
+            row = index.row()
+            block = self._block(row // self._block_size)
+            return block[index.column()][row % self._block_size]
+
+        if role == Qt.TextAlignmentRole:
+            return self._alignments[index.column()]
 
         return None
 
@@ -51,21 +108,41 @@ class PandasModel(QAbstractTableModel):
         """
         if role == Qt.DisplayRole:
             if orientation == Qt.Horizontal:
-                return str(self._dataframe.columns[section])
+                return self._columns[section]
 
             if orientation == Qt.Vertical:
-                return str(self._dataframe.index[section])
+                return self._index[section]
 
         return None
 
+    def _block(self, block_number):
+        block = self._blocks.get(block_number)
+        if block is not None:
+            self._blocks.move_to_end(block_number)
+            return block
+
+        start = block_number * self._block_size
+        rows = self._dataframe.iloc[start : start + self._block_size]
+        block = [format_values(rows.iloc[:, col]) for col in range(rows.shape[1])]
+
+        self._blocks[block_number] = block
+        if len(self._blocks) > self._max_cached_blocks:
+            self._blocks.popitem(last=False)
+
+        return block
+
 
 class DataTableDialog(QDialog):
-    def __init__(self, df, parent=None):
+    """Preview table, with `chart` (i.e. TimeSeriesChartView) next to it if given"""
+
+    def __init__(self, df, parent=None, chart=None):
         super().__init__(parent)
 
         view = QTableView(parent=parent)
         view.resize(800, 500)
         view.horizontalHeader().setStretchLastSection(True)
+        # Fixed row heights - the view does not measure rows of large previews
+        view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         view.setAlternatingRowColors(True)
         view.setSelectionBehavior(QTableView.SelectRows)
         model = PandasModel(df)
@@ -73,5 +150,12 @@ class DataTableDialog(QDialog):
 
         self.setWindowTitle(self.parent().windowTitle())
         layout = QVBoxLayout()
-        layout.addWidget(view)
+        if chart is None:
+            layout.addWidget(view)
+        else:
+            splitter = QSplitter(Qt.Horizontal)
+            splitter.addWidget(view)
+            splitter.addWidget(chart)
+            splitter.setStretchFactor(1, 1)
+            layout.addWidget(splitter)
         self.setLayout(layout)
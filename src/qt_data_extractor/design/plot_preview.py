@@ -0,0 +1,201 @@
+from datetime import datetime
+
+import pandas as pd
+from PySide6.QtCharts import QChart, QChartView, QDateTimeAxis, QLineSeries, QValueAxis
+from PySide6.QtCore import QDateTime, Qt, QThreadPool, QTimer
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from qt_data_extractor.decimation import decimate
+from qt_data_extractor.timestamps import to_local_naive, to_utc, utc_index
+from qt_data_extractor.worker_thread import Worker
+
+# Samples requested per pixel of the chart width, series are decimated to this density
+SAMPLES_PER_PIXEL = 4
+PLOT_DECIMATION = "minmax"
+# Below this sampling interval raw data is requested instead of interpolated values
+MIN_INTERPOLATION_INTERVAL_SECONDS = 1
+# Sample rates of plot requests - zooming reuses cached reads of the same rate
+PLOT_INTERVALS_SECONDS = [
+    *(1, 2, 5, 10, 15, 30),
+    *(60, 120, 300, 600, 900, 1800),
+    *(3600, 7200, 10800, 21600, 43200, 86400),
+]
+# Limit of samples per tag of a raw data request
+MAX_PLOT_SAMPLES = 200000
+# Wait for zooming to settle before querying the visible range
+ZOOM_QUERY_DELAY_MS = 300
+RAW_DATA_FREQUENCY = "Raw Data"
+
+
+def plot_time_frequency(first_timestamp, last_timestamp, samples, time_frequency=None):
+    """Sample rate returning at most `samples` values over the period (None - raw data)
+
+    The rate is snapped to one of `PLOT_INTERVALS_SECONDS` (whole days above), and is
+    never finer than `time_frequency` selected by the user.
+    """
+    seconds = (last_timestamp - first_timestamp).total_seconds() / max(samples, 1)
+    if seconds > MIN_INTERPOLATION_INTERVAL_SECONDS:
+        day = PLOT_INTERVALS_SECONDS[-1]
+        seconds = next(
+            (i for i in PLOT_INTERVALS_SECONDS if i >= seconds),
+            -(-seconds // day) * day,
+        )
+    if time_frequency and time_frequency != RAW_DATA_FREQUENCY:
+        seconds = max(seconds, pd.Timedelta(time_frequency).total_seconds())
+    if seconds <= MIN_INTERPOLATION_INTERVAL_SECONDS:
+        return None
+
+    return f"{int(seconds)} seconds"
+
+
+class TimeSeriesChartView(QChartView):
+    """
+    Chart preview of tag values.
+
+    Data is requested at a sample rate matching the chart width and decimated to a few
+    points per pixel. Zooming in (dragging a range, right click zooms out) re-queries
+    only the visible time range at the matching resolution. Data is read in a worker,
+    the chart shows local time.
+
+    :param reader: Called with (first_timestamp, last_timestamp, time_frequency,
+        max_results), returns a DataFrame of tag values indexed by timestamp (a naive
+        index is UTC)
+    :param time_frequency: Sample rate selected by the user, the finest rate plotted
+    :param threadpool: Thread pool running the reads (the global one by default)
+    """
+
+    def __init__(
+        self,
+        reader,
+        first_timestamp,
+        last_timestamp,
+        time_frequency=None,
+        threadpool=None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._reader = reader
+        self._range = (to_utc(first_timestamp), to_utc(last_timestamp))
+        self._time_frequency = time_frequency
+        self._threadpool = threadpool or QThreadPool.globalInstance()
+        # Running read, results of older reads (i.e. zoomed again meanwhile) are dropped
+        self._worker = None
+        self._updating = False
+
+        self.setRenderHint(QPainter.Antialiasing)
+        self.setRubberBand(QChartView.HorizontalRubberBand)
+        self.setMinimumSize(600, 400)
+
+        chart = QChart()
+        chart.legend().setAlignment(Qt.AlignBottom)
+        self._axis_x = QDateTimeAxis()
+        self._axis_x.setFormat("yyyy-MM-dd hh:mm:ss")
+        self._axis_x.setTickCount(5)
+        self._axis_y = QValueAxis()
+        chart.addAxis(self._axis_x, Qt.AlignBottom)
+        chart.addAxis(self._axis_y, Qt.AlignLeft)
+        self.setChart(chart)
+
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(ZOOM_QUERY_DELAY_MS)
+        self._zoom_timer.timeout.connect(self._on_zoomed)
+        self._axis_x.rangeChanged.connect(self._on_range_changed)
+
+    def load(self, first_timestamp=None, last_timestamp=None):
+        """Query and plot the period (the whole preview period by default)"""
+        first_timestamp = to_utc(first_timestamp) or self._range[0]
+        last_timestamp = to_utc(last_timestamp) or self._range[1]
+        samples = self._width() * SAMPLES_PER_PIXEL
+        time_frequency = plot_time_frequency(
+            first_timestamp, last_timestamp, samples, self._time_frequency
+        )
+
+        def read(progress_callback, cancel_token):
+            return self._reader(
+                first_timestamp,
+                last_timestamp,
+                time_frequency or RAW_DATA_FREQUENCY,
+                None if time_frequency else MAX_PLOT_SAMPLES,
+            )
+
+        def loaded(df):
+            if self._worker is worker:
+                self._plot(df, first_timestamp, last_timestamp)
+
+        def failed(error):
+            if self._worker is worker:
+                QMessageBox.critical(self, self.window().windowTitle(), str(error[1]))
+
+        def finished():
+            if self._worker is worker:
+                self._worker = None
+                QApplication.restoreOverrideCursor()
+
+        if self._worker is None:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+
+        worker = Worker(read)
+        worker.signals.result.connect(loaded)
+        worker.signals.error.connect(failed)
+        worker.signals.finished.connect(finished)
+        self._worker = worker
+        self._threadpool.start(worker)
+
+    def _plot(self, df, first_timestamp, last_timestamp):
+        chart = self.chart()
+        chart.removeAllSeries()
+
+        # Timestamps as milliseconds since epoch, as expected by QDateTimeAxis (which
+        # shows them in local time)
+        x = utc_index(pd.DatetimeIndex(df.index)).asi8 // 1_000_000
+        points = self._width() * 2
+        y_min, y_max = None, None
+        for column in df.columns:
+            values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+            px, py = decimate(x, values, points, method=PLOT_DECIMATION)
+            if not len(px):
+                continue
+
+            series = QLineSeries()
+            series.setName(str(column))
+            series.appendNp(px.astype(float), py)
+            chart.addSeries(series)
+            series.attachAxis(self._axis_x)
+            series.attachAxis(self._axis_y)
+
+            y_min = py.min() if y_min is None else min(y_min, py.min())
+            y_max = py.max() if y_max is None else max(y_max, py.max())
+
+        self._updating = True
+        try:
+            self._axis_x.setRange(
+                QDateTime(to_local_naive(first_timestamp)),
+                QDateTime(to_local_naive(last_timestamp)),
+            )
+            if y_min is not None:
+                margin = (y_max - y_min) * 0.05 or 1
+                self._axis_y.setRange(y_min - margin, y_max + margin)
+        finally:
+            self._updating = False
+
+    def _width(self):
+        return max(self.viewport().width(), 100)
+
+    def _on_range_changed(self, first, last):
+        if not self._updating:
+            self._zoom_timer.start()
+
+    def _on_zoomed(self):
+        first = self._axis_x.min().toPython()
+        last = self._axis_x.max().toPython()
+        if not isinstance(first, datetime) or not isinstance(last, datetime):
+            return
+
+        # Axis range is local time
+        first, last = max(to_utc(first), self._range[0]), min(
+            to_utc(last), self._range[1]
+        )
+        if first < last:
+            self.load(first, last)
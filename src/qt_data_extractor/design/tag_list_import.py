@@ -0,0 +1,125 @@
+import itertools
+
+from PySide6 import QtCore
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QGridLayout,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+)
+
+from qt_data_extractor.tag_import import (
+    PREVIEW_ROWS,
+    column_name,
+    list_sheets,
+    parse_text,
+    read_rows,
+)
+
+
+class TagListImportDialog(QDialog):
+    """
+    Selection of the sheet and column holding the tag names of a tag list.
+
+    Only the first rows of the list are read, for the preview.
+
+    :param path: Tag list file
+    :param text: Pasted tag list, when there is no file
+    """
+
+    def __init__(self, path=None, text=None, parent=None):
+        super().__init__(parent)
+
+        self._path = path
+        self._text = text
+
+        self._main_layout = QGridLayout()
+
+        self._main_layout.addWidget(
+            QLabel("Select the column holding the tag names:"), 0, 0, 1, 2
+        )
+
+        self.sheet = QComboBox()
+        sheets = list_sheets(path) if path else []
+        self.sheet.addItems(sheets)
+        sheet_label = QLabel("Sheet:")
+        self._main_layout.addWidget(sheet_label, 1, 0)
+        self._main_layout.addWidget(self.sheet, 1, 1)
+        sheet_label.setVisible(len(sheets) > 1)
+        self.sheet.setVisible(len(sheets) > 1)
+
+        self.column = QComboBox()
+        self._main_layout.addWidget(QLabel("Column:"), 2, 0)
+        self._main_layout.addWidget(self.column, 2, 1)
+
+        self.header = QCheckBox("First row is a header")
+        self._main_layout.addWidget(self.header, 3, 0, 1, 2)
+
+        self._preview = QTableWidget()
+        self._preview.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._preview.setSelectionBehavior(QAbstractItemView.SelectColumns)
+        self._preview.setSelectionMode(QAbstractItemView.SingleSelection)
+        self._main_layout.addWidget(self._preview, 4, 0, 1, 2)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        self._main_layout.addWidget(button_box, 5, 0, 1, 2)
+
+        self.setLayout(self._main_layout)
+        self.resize(600, 450)
+
+        self.sheet.currentIndexChanged.connect(self._load_preview)
+        self.column.currentIndexChanged.connect(self._preview.selectColumn)
+        self._preview.horizontalHeader().sectionClicked.connect(
+            self.column.setCurrentIndex
+        )
+
+        self._load_preview()
+
+    @QtCore.Slot()
+    def _load_preview(self):
+        rows = (
+            read_rows(self._path, self.sheet.currentText() or None)
+            if self._path
+            else parse_text(self._text or "")
+        )
+        try:
+            preview = list(itertools.islice(rows, PREVIEW_ROWS))
+        finally:
+            # Releases the file of the partially read list
+            rows.close()
+
+        columns = max([len(row) for row in preview], default=1)
+        self._preview.clear()
+        self._preview.setRowCount(len(preview))
+        self._preview.setColumnCount(columns)
+        self._preview.setHorizontalHeaderLabels(
+            [column_name(c) for c in range(columns)]
+        )
+        for r, row in enumerate(preview):
+            for c, value in enumerate(row):
+                if value is not None:
+                    self._preview.setItem(r, c, QTableWidgetItem(str(value)))
+
+        column = min(self.column.currentIndex(), columns - 1)
+        self.column.blockSignals(True)
+        self.column.clear()
+        self.column.addItems([column_name(c) for c in range(columns)])
+        self.column.blockSignals(False)
+        self.column.setCurrentIndex(-1)
+        self.column.setCurrentIndex(max(column, 0))
+
+    @property
+    def values(self):
+        """Keyword arguments of open_tag_list() / TagList"""
+        return {
+            "sheet": self.sheet.currentText() or None,
+            "column": self.column.currentIndex(),
+            "skip_rows": 1 if self.header.isChecked() else 0,
+        }
@@ -0,0 +1,343 @@
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtGui import QFont
+
+# Rows materialized per fetchMore call
+FETCH_BATCH_SIZE = 500
+
+TAG_NAME_ROLE = Qt.UserRole
+TAG_ATTRIBUTES_ROLE = Qt.UserRole + 1
+
+
+class _TagNode:
+    __slots__ = ("name", "attributes", "parent", "row", "children", "fetched", "loaded")
+
+    def __init__(self, name, attributes, parent, row):
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.row = row
+        self.children = []
+        # Children were requested / received
+        self.fetched = False
+        self.loaded = False
+
+
+class TagsTreeModel(QAbstractItemModel):
+    """
+    Tag browser model.
+
+    Top level rows are materialized in batches as the view scrolls (`canFetchMore` /
+    `fetchMore`), so large result sets do not create an item per tag up front.
+    Children of tags with `HasChildren` are requested on expansion through `children_loader`
+    and added with `add_children` once available, so slow queries can run in background.
+
+    :param children_loader: Called with the parent (QPersistentModelIndex) and the tag name
+    :param batch_size: Number of rows materialized per fetch
+    """
+
+    def __init__(self, children_loader=None, batch_size=FETCH_BATCH_SIZE, parent=None):
+        QAbstractItemModel.__init__(self, parent)
+        self._children_loader = children_loader
+        self._batch_size = batch_size
+        self._columns = []
+        self._tags = {}
+        # Set by `set_tags`, the dictionary is the caller's (i.e. the tag catalog)
+        self._tags_shared = False
+        self._names = []
+        self._root = _TagNode(None, {}, None, 0)
+        # Row of every fetched top level tag
+        self._rows = {}
+        self._marked = set()
+
+        self._font_marked = QFont()
+        self._font_marked.setBold(True)
+
+    @property
+    def total_count(self):
+        """Number of top level tags, including rows not fetched yet"""
+        return len(self._names)
+
+    def set_tags(self, tags, names=None, columns=None):
+        """Replace the top level tags
+
+        :param tags: Tag attributes by tag name
+        :param names: Tag names to show (in this order), None - all tags
+        :param columns: (attribute, title) pairs of the displayed columns
+        """
+        self.beginResetModel()
+        if columns is not None:
+            self._columns = list(columns)
+        self._tags = tags
+        self._tags_shared = True
+        self._names = list(tags) if names is None else list(names)
+        self._reset_rows()
+        self.endResetModel()
+
+    def append_tags(self, tags):
+        """Add top level tags (i.e. the next batch of a running query)"""
+        names = [name for name in tags if name not in self._tags]
+        if self._tags_shared:
+            # Copied once, later batches are added in place
+            self._tags = dict(self._tags)
+            self._tags_shared = False
+        self._tags.update(tags)
+        self._names.extend(names)
+
+        # Views fetch more on scrolling, fill the first batch right away
+        if len(self._root.children) < self._batch_size:
+            self.fetchMore()
+
+    def add_children(self, parent, children):
+        """Add loaded children of `parent` (QPersistentModelIndex)"""
+        if not parent.isValid():
+            # Model was reset meanwhile
+            return
+
+        parent = self.index(parent.row(), 0, parent.parent())
+        node = parent.internalPointer()
+        node.loaded = True
+        if children:
+            self._insert(parent, node, list(children), list(children.values()))
+        else:
+            # Drop the expansion indicator
+            self.dataChanged.emit(parent, parent)
+
+    def clear(self):
+        self.set_tags({}, columns=[])
+
+    def set_marked(self, marked):
+        """Show top level tags contained in `marked` in bold (i.e. selected for extraction)
+
+        :param marked: Container of tag names, kept by reference - call `update_marked`
+            with the names whose membership changed
+        """
+        self._marked = marked
+        if self._root.children:
+            self._emit_marked_changed(0, len(self._root.children) - 1)
+
+    def update_marked(self, names):
+        """Re-render fetched rows of `names`"""
+        rows = [self._rows[name] for name in names if name in self._rows]
+        if rows:
+            self._emit_marked_changed(min(rows), max(rows))
+
+    def tag(self, index):
+        """(name, attributes) of the tag at `index`"""
+        node = index.internalPointer()
+        return node.name, node.attributes
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        return self.createIndex(row, column, self._node(parent).children[row])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+
+        node = index.internalPointer().parent
+        if node is None or node is self._root:
+            return QModelIndex()
+
+        return self.createIndex(node.row, 0, node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self._columns)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._names) > 0
+
+        node = parent.internalPointer()
+        return bool(node.children) or (
+            not node.loaded and bool(node.attributes.get("HasChildren"))
+        )
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._root.children) < len(self._names)
+
+        node = parent.internalPointer()
+        return not node.fetched and bool(node.attributes.get("HasChildren"))
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not parent.isValid():
+            start = len(self._root.children)
+            end = min(start + self._batch_size, len(self._names))
+            names = self._names[start:end]
+            attributes = [self._tags[name] for name in names]
+            self._insert(parent, self._root, names, attributes)
+            return
+
+        node = parent.internalPointer()
+        node.fetched = True
+        if self._children_loader:
+            self._children_loader(QPersistentModelIndex(parent), node.name)
+        else:
+            self.add_children(QPersistentModelIndex(parent), {})
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        node = index.internalPointer()
+
+        if role == Qt.DisplayRole:
+            key = self._columns[index.column()][0]
+            return str(node.attributes[key]) if key in node.attributes else ""
+
+        if (
+            role == Qt.FontRole
+            and node.parent is self._root
+            and node.name in self._marked
+        ):
+            return self._font_marked
+
+        if role == TAG_NAME_ROLE:
+            return node.name
+
+        if role == TAG_ATTRIBUTES_ROLE:
+            return node.attributes
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if (
+            role == Qt.DisplayRole
+            and orientation == Qt.Horizontal
+            and section < len(self._columns)
+        ):
+            return self._columns[section][1]
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column < 0 or column >= len(self._columns):
+            return
+
+        key = self._columns[column][0]
+        self.beginResetModel()
+        self._names.sort(
+            key=lambda name: str(self._tags[name].get(key, "")),
+            reverse=order == Qt.DescendingOrder,
+        )
+        # Rows are fetched again in the new order
+        self._reset_rows()
+        self.endResetModel()
+
+    def _reset_rows(self):
+        self._root = _TagNode(None, {}, None, 0)
+        self._rows = {}
+
+    def _emit_marked_changed(self, first, last):
+        self.dataChanged.emit(
+            self.index(first, 0),
+            self.index(last, max(len(self._columns) - 1, 0)),
+            [Qt.FontRole],
+        )
+
+    def _node(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _insert(self, parent_index, parent_node, names, attributes):
+        if not names:
+            return
+
+        start = len(parent_node.children)
+        self.beginInsertRows(parent_index, start, start + len(names) - 1)
+        parent_node.children.extend(
+            _TagNode(name, attrs, parent_node, start + i)
+            for i, (name, attrs) in enumerate(zip(names, attributes))
+        )
+        if parent_node is self._root:
+            self._rows.update((name, start + i) for i, name in enumerate(names))
+        self.endInsertRows()
+
+
+class SelectedTagsModel(QAbstractItemModel):
+    """
+    Flat model of the tags selected for extraction, follows a `SelectedTags` store.
+
+    :param store: SelectedTags instance
+    """
+
+    def __init__(self, store, parent=None):
+        QAbstractItemModel.__init__(self, parent)
+        self._store = store
+        self._names = store.names
+        store.subscribe(self._on_store_changed)
+
+    def tag(self, index):
+        """(name, attributes) of the tag at `index`"""
+        name = self._names[index.row()]
+        return name, self._store[name]
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        name = self._names[index.row()]
+
+        if role == Qt.DisplayRole:
+            return str(self._store[name].get("Name", name))
+
+        if role == TAG_NAME_ROLE:
+            return name
+
+        if role == TAG_ATTRIBUTES_ROLE:
+            return self._store[name]
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section == 0:
+            return "Tag Name"
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        old_rows = {name: row for row, name in enumerate(self._names)}
+        self._names.sort(
+            key=lambda name: str(self._store[name].get("Name", name)),
+            reverse=order == Qt.DescendingOrder,
+        )
+        self.changePersistentIndexList(
+            [self.index(old_rows[name], 0) for name in self._names],
+            [self.index(row, 0) for row in range(len(self._names))],
+        )
+        self.layoutChanged.emit()
+
+    def _on_store_changed(self, added, removed):
+        if removed:
+            self.beginResetModel()
+            self._names = [name for name in self._names if name in self._store]
+            self.endResetModel()
+
+        if added:
+            start = len(self._names)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            self._names.extend(added)
+            self.endInsertRows()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'copy-progress.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QGridLayout, QLabel, QProgressBar, QSizePolicy,
+    QTextEdit, QVBoxLayout, QWidget)
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        if not Dialog.objectName():
+            Dialog.setObjectName(u"Dialog")
+        Dialog.resize(461, 327)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Dialog.sizePolicy().hasHeightForWidth())
+        Dialog.setSizePolicy(sizePolicy)
+        self.gridLayout = QGridLayout(Dialog)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.labelCopy = QLabel(Dialog)
+        self.labelCopy.setObjectName(u"labelCopy")
+        self.labelCopy.setAlignment(Qt.AlignCenter)
+
+        self.verticalLayout.addWidget(self.labelCopy)
+
+        self.labelFrom = QLabel(Dialog)
+        self.labelFrom.setObjectName(u"labelFrom")
+
+        self.verticalLayout.addWidget(self.labelFrom)
+
+        self.labelTo = QLabel(Dialog)
+        self.labelTo.setObjectName(u"labelTo")
+
+        self.verticalLayout.addWidget(self.labelTo)
+
+        self.progressBar = QProgressBar(Dialog)
+        self.progressBar.setObjectName(u"progressBar")
+        self.progressBar.setValue(24)
+
+        self.verticalLayout.addWidget(self.progressBar)
+
+        self.labelTotalCopied = QLabel(Dialog)
+        self.labelTotalCopied.setObjectName(u"labelTotalCopied")
+
+        self.verticalLayout.addWidget(self.labelTotalCopied)
+
+        self.textExtractionLog = QTextEdit(Dialog)
+        self.textExtractionLog.setObjectName(u"textExtractionLog")
+
+        self.verticalLayout.addWidget(self.textExtractionLog)
+
+        self.buttonBox = QDialogButtonBox(Dialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.gridLayout.addLayout(self.verticalLayout, 0, 0, 1, 1)
+
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept)
+
+        QMetaObject.connectSlotsByName(Dialog)
+    # setupUi
+
+    def retranslateUi(self, Dialog):
+        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
+        self.labelCopy.setText(QCoreApplication.translate("Dialog", u"Extraction in progress...", None))
+        self.labelFrom.setText(QCoreApplication.translate("Dialog", u"From: ", None))
+        self.labelTo.setText(QCoreApplication.translate("Dialog", u"To: ", None))
+        self.labelTotalCopied.setText(QCoreApplication.translate("Dialog", u"10 / 100 completed", None))
+    # retranslateUi
+
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'copy-prompt.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QCheckBox, QComboBox,
+    QDateTimeEdit, QDialog, QDialogButtonBox, QFrame,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QSizePolicy, QSpinBox, QVBoxLayout, QWidget)
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        if not Dialog.objectName():
+            Dialog.setObjectName(u"Dialog")
+        Dialog.resize(512, 296)
+        self.gridLayout = QGridLayout(Dialog)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.labelCopyDescription = QLabel(Dialog)
+        self.labelCopyDescription.setObjectName(u"labelCopyDescription")
+
+        self.verticalLayout.addWidget(self.labelCopyDescription)
+
+        self.horizontalLayoutCopyTarget = QHBoxLayout()
+        self.horizontalLayoutCopyTarget.setObjectName(u"horizontalLayoutCopyTarget")
+        self.comboCopyTarget = QComboBox(Dialog)
+        self.comboCopyTarget.setObjectName(u"comboCopyTarget")
+        self.comboCopyTarget.setEditable(False)
+
+        self.horizontalLayoutCopyTarget.addWidget(self.comboCopyTarget)
+
+        self.comboArchiveFormat = QComboBox(Dialog)
+        self.comboArchiveFormat.setObjectName(u"comboArchiveFormat")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.comboArchiveFormat.sizePolicy().hasHeightForWidth())
+        self.comboArchiveFormat.setSizePolicy(sizePolicy)
+        self.comboArchiveFormat.setMinimumSize(QSize(100, 0))
+
+        self.horizontalLayoutCopyTarget.addWidget(self.comboArchiveFormat)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayoutCopyTarget)
+
+        self.checkboxAttributesOnly = QCheckBox(Dialog)
+        self.checkboxAttributesOnly.setObjectName(u"checkboxAttributesOnly")
+
+        self.verticalLayout.addWidget(self.checkboxAttributesOnly)
+
+        self.checkboxUpdateArchive = QCheckBox(Dialog)
+        self.checkboxUpdateArchive.setObjectName(u"checkboxUpdateArchive")
+
+        self.verticalLayout.addWidget(self.checkboxUpdateArchive)
+
+        self.groupboxDataSettings = QGroupBox(Dialog)
+        self.groupboxDataSettings.setObjectName(u"groupboxDataSettings")
+        self.groupboxDataSettings.setEnabled(True)
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.groupboxDataSettings.sizePolicy().hasHeightForWidth())
+        self.groupboxDataSettings.setSizePolicy(sizePolicy1)
+        self.groupboxDataSettings.setMinimumSize(QSize(0, 126))
+        self.labelCopyDescription_2 = QLabel(self.groupboxDataSettings)
+        self.labelCopyDescription_2.setObjectName(u"labelCopyDescription_2")
+        self.labelCopyDescription_2.setGeometry(QRect(10, 20, 419, 28))
+        self.label = QLabel(self.groupboxDataSettings)
+        self.label.setObjectName(u"label")
+        self.label.setGeometry(QRect(406, 14, 104, 40))
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy2)
+        self.dateTimeTo = QDateTimeEdit(self.groupboxDataSettings)
+        self.dateTimeTo.setObjectName(u"dateTimeTo")
+        self.dateTimeTo.setEnabled(True)
+        self.dateTimeTo.setGeometry(QRect(276, 23, 130, 22))
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.dateTimeTo.sizePolicy().hasHeightForWidth())
+        self.dateTimeTo.setSizePolicy(sizePolicy3)
+        self.dateTimeTo.setFocusPolicy(Qt.ClickFocus)
+        self.label_3 = QLabel(self.groupboxDataSettings)
+        self.label_3.setObjectName(u"label_3")
+        self.label_3.setGeometry(QRect(261, 14, 15, 40))
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.label_3.sizePolicy().hasHeightForWidth())
+        self.label_3.setSizePolicy(sizePolicy4)
+        self.label_2 = QLabel(self.groupboxDataSettings)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setGeometry(QRect(100, 14, 31, 40))
+        sizePolicy4.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy4)
+        self.dateTimeFrom = QDateTimeEdit(self.groupboxDataSettings)
+        self.dateTimeFrom.setObjectName(u"dateTimeFrom")
+        self.dateTimeFrom.setEnabled(True)
+        self.dateTimeFrom.setGeometry(QRect(131, 23, 130, 22))
+        sizePolicy3.setHeightForWidth(self.dateTimeFrom.sizePolicy().hasHeightForWidth())
+        self.dateTimeFrom.setSizePolicy(sizePolicy3)
+        self.dateTimeFrom.setFocusPolicy(Qt.ClickFocus)
+        self.label_4 = QLabel(self.groupboxDataSettings)
+        self.label_4.setObjectName(u"label_4")
+        self.label_4.setGeometry(QRect(10, 60, 605, 16))
+        self.comboSampleRate = QComboBox(self.groupboxDataSettings)
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.setObjectName(u"comboSampleRate")
+        self.comboSampleRate.setGeometry(QRect(100, 60, 111, 22))
+        self.labelTimeWindow = QLabel(self.groupboxDataSettings)
+        self.labelTimeWindow.setObjectName(u"labelTimeWindow")
+        self.labelTimeWindow.setGeometry(QRect(10, 90, 90, 16))
+        self.comboTimeWindow = QComboBox(self.groupboxDataSettings)
+        self.comboTimeWindow.setObjectName(u"comboTimeWindow")
+        self.comboTimeWindow.setGeometry(QRect(100, 90, 111, 22))
+        self.labelReaders = QLabel(self.groupboxDataSettings)
+        self.labelReaders.setObjectName(u"labelReaders")
+        self.labelReaders.setGeometry(QRect(230, 60, 110, 16))
+        self.spinReaders = QSpinBox(self.groupboxDataSettings)
+        self.spinReaders.setObjectName(u"spinReaders")
+        self.spinReaders.setGeometry(QRect(340, 60, 66, 22))
+        self.spinReaders.setMinimum(1)
+        self.spinReaders.setMaximum(32)
+        self.spinReaders.setValue(4)
+
+        self.verticalLayout.addWidget(self.groupboxDataSettings)
+
+        self.widgetLeftTimeFilter = QWidget(Dialog)
+        self.widgetLeftTimeFilter.setObjectName(u"widgetLeftTimeFilter")
+        sizePolicy3.setHeightForWidth(self.widgetLeftTimeFilter.sizePolicy().hasHeightForWidth())
+        self.widgetLeftTimeFilter.setSizePolicy(sizePolicy3)
+        self.layoutLeftTimeFilter = QHBoxLayout(self.widgetLeftTimeFilter)
+        self.layoutLeftTimeFilter.setSpacing(0)
+        self.layoutLeftTimeFilter.setObjectName(u"layoutLeftTimeFilter")
+        self.layoutLeftTimeFilter.setContentsMargins(-1, 0, 0, 0)
+
+        self.verticalLayout.addWidget(self.widgetLeftTimeFilter)
+
+        self.line = QFrame(Dialog)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.Shape.HLine)
+        self.line.setFrameShadow(QFrame.Shadow.Sunken)
+
+        self.verticalLayout.addWidget(self.line)
+
+        self.buttonBox = QDialogButtonBox(Dialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.gridLayout.addLayout(self.verticalLayout, 0, 0, 1, 1)
+
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept)
+        self.buttonBox.rejected.connect(Dialog.reject)
+
+        QMetaObject.connectSlotsByName(Dialog)
+    # setupUi
+
+    def retranslateUi(self, Dialog):
+        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
+        self.labelCopyDescription.setText(QCoreApplication.translate("Dialog", u"Extract X tags to", None))
+        self.checkboxAttributesOnly.setText(QCoreApplication.translate("Dialog", u"Extract Tag Metadata Only", None))
+#if QT_CONFIG(tooltip)
+        self.checkboxUpdateArchive.setToolTip(QCoreApplication.translate("Dialog", u"Append data newer than the last stored timestamp of every tag to an existing archive", None))
+#endif // QT_CONFIG(tooltip)
+        self.checkboxUpdateArchive.setText(QCoreApplication.translate("Dialog", u"Update Existing Archive (New Data Only)", None))
+        self.groupboxDataSettings.setTitle(QCoreApplication.translate("Dialog", u"Data Extraction Settings", None))
+        self.labelCopyDescription_2.setText(QCoreApplication.translate("Dialog", u"Copy Period", None))
+        self.label.setText(QCoreApplication.translate("Dialog", u"UTC", None))
+        self.label_3.setText(QCoreApplication.translate("Dialog", u"To:", None))
+        self.label_2.setText(QCoreApplication.translate("Dialog", u"From:", None))
+        self.label_4.setText(QCoreApplication.translate("Dialog", u"Sample Rate", None))
+        self.comboSampleRate.setItemText(0, QCoreApplication.translate("Dialog", u"Raw data", None))
+        self.comboSampleRate.setItemText(1, QCoreApplication.translate("Dialog", u"1 minute", None))
+        self.comboSampleRate.setItemText(2, QCoreApplication.translate("Dialog", u"3 minutes", None))
+        self.comboSampleRate.setItemText(3, QCoreApplication.translate("Dialog", u"5 minutes", None))
+        self.comboSampleRate.setItemText(4, QCoreApplication.translate("Dialog", u"10 minutes", None))
+        self.comboSampleRate.setItemText(5, QCoreApplication.translate("Dialog", u"1 hour", None))
+        self.comboSampleRate.setItemText(6, QCoreApplication.translate("Dialog", u"1 day", None))
+
+        self.labelTimeWindow.setText(QCoreApplication.translate("Dialog", u"Time Window", None))
+#if QT_CONFIG(tooltip)
+        self.comboTimeWindow.setToolTip(QCoreApplication.translate("Dialog", u"Data is read and written one window at a time to limit memory usage", None))
+#endif // QT_CONFIG(tooltip)
+        self.labelReaders.setText(QCoreApplication.translate("Dialog", u"Concurrent Readers", None))
+    # retranslateUi
+
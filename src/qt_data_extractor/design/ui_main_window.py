@@ -0,0 +1,660 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main-window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QComboBox,
+    QDateTimeEdit, QFrame, QGridLayout, QGroupBox,
+    QHBoxLayout, QHeaderView, QLabel, QMainWindow,
+    QMenu, QMenuBar, QPushButton, QSizePolicy,
+    QSpacerItem, QSplitter, QStatusBar, QTreeView,
+    QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1330, 808)
+        self.actionAddNewConnection = QAction(MainWindow)
+        self.actionAddNewConnection.setObjectName(u"actionAddNewConnection")
+        icon = QIcon()
+        iconThemeName = u"folder-new"
+        if QIcon.hasThemeIcon(iconThemeName):
+            icon = QIcon.fromTheme(iconThemeName)
+        else:
+            icon.addFile(u".", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+
+        self.actionAddNewConnection.setIcon(icon)
+        self.actionManageConnections = QAction(MainWindow)
+        self.actionManageConnections.setObjectName(u"actionManageConnections")
+        self.actionRefreshTagCatalog = QAction(MainWindow)
+        self.actionRefreshTagCatalog.setObjectName(u"actionRefreshTagCatalog")
+        self.actionImportTagsList = QAction(MainWindow)
+        self.actionImportTagsList.setObjectName(u"actionImportTagsList")
+        self.actionPasteTagsList = QAction(MainWindow)
+        self.actionPasteTagsList.setObjectName(u"actionPasteTagsList")
+        self.actionResumeExtraction = QAction(MainWindow)
+        self.actionResumeExtraction.setObjectName(u"actionResumeExtraction")
+        self.actionJobQueue = QAction(MainWindow)
+        self.actionJobQueue.setObjectName(u"actionJobQueue")
+        self.actionProfileNextOperation = QAction(MainWindow)
+        self.actionProfileNextOperation.setObjectName(u"actionProfileNextOperation")
+        self.actionProfileNextOperation.setCheckable(True)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.gridLayout_2 = QGridLayout(self.centralwidget)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.verticalLayoutMainContainer = QVBoxLayout()
+        self.verticalLayoutMainContainer.setObjectName(u"verticalLayoutMainContainer")
+        self.horizontalLayoutConnectionStatus = QHBoxLayout()
+        self.horizontalLayoutConnectionStatus.setObjectName(u"horizontalLayoutConnectionStatus")
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayoutConnectionStatus.addItem(self.horizontalSpacer_5)
+
+        self.label_3 = QLabel(self.centralwidget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayoutConnectionStatus.addWidget(self.label_3)
+
+        self.comboLeftConnection = QComboBox(self.centralwidget)
+        self.comboLeftConnection.addItem("")
+        self.comboLeftConnection.setObjectName(u"comboLeftConnection")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.comboLeftConnection.sizePolicy().hasHeightForWidth())
+        self.comboLeftConnection.setSizePolicy(sizePolicy)
+        self.comboLeftConnection.setFocusPolicy(Qt.ClickFocus)
+        self.comboLeftConnection.setAcceptDrops(False)
+        self.comboLeftConnection.setEditable(False)
+
+        self.horizontalLayoutConnectionStatus.addWidget(self.comboLeftConnection)
+
+        self.labelLeftConnectionDetails = QLabel(self.centralwidget)
+        self.labelLeftConnectionDetails.setObjectName(u"labelLeftConnectionDetails")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.labelLeftConnectionDetails.sizePolicy().hasHeightForWidth())
+        self.labelLeftConnectionDetails.setSizePolicy(sizePolicy1)
+        self.labelLeftConnectionDetails.setMinimumSize(QSize(300, 0))
+
+        self.horizontalLayoutConnectionStatus.addWidget(self.labelLeftConnectionDetails)
+
+        self.buttonLeftConnect = QPushButton(self.centralwidget)
+        self.buttonLeftConnect.setObjectName(u"buttonLeftConnect")
+
+        self.horizontalLayoutConnectionStatus.addWidget(self.buttonLeftConnect)
+
+
+        self.verticalLayoutMainContainer.addLayout(self.horizontalLayoutConnectionStatus)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.verticalLayoutMainContainer.addItem(self.horizontalSpacer_2)
+
+        self.splitterPanels = QSplitter(self.centralwidget)
+        self.splitterPanels.setObjectName(u"splitterPanels")
+        self.splitterPanels.setOrientation(Qt.Horizontal)
+        self.layoutWidget = QWidget(self.splitterPanels)
+        self.layoutWidget.setObjectName(u"layoutWidget")
+        self.verticalLayoutLeftPanel = QVBoxLayout(self.layoutWidget)
+        self.verticalLayoutLeftPanel.setObjectName(u"verticalLayoutLeftPanel")
+        self.verticalLayoutLeftPanel.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.layoutWidget)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.verticalLayoutLeftPanel.addWidget(self.label)
+
+        self.widget_4 = QWidget(self.layoutWidget)
+        self.widget_4.setObjectName(u"widget_4")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.widget_4.sizePolicy().hasHeightForWidth())
+        self.widget_4.setSizePolicy(sizePolicy2)
+        self.widget_4.setMinimumSize(QSize(0, 45))
+        self.gridLayout_7 = QGridLayout(self.widget_4)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.comboLeftTagFilter = QComboBox(self.widget_4)
+        self.comboLeftTagFilter.setObjectName(u"comboLeftTagFilter")
+        self.comboLeftTagFilter.setEnabled(True)
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Preferred)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.comboLeftTagFilter.sizePolicy().hasHeightForWidth())
+        self.comboLeftTagFilter.setSizePolicy(sizePolicy3)
+        self.comboLeftTagFilter.setMinimumSize(QSize(150, 0))
+        self.comboLeftTagFilter.setFocusPolicy(Qt.ClickFocus)
+        self.comboLeftTagFilter.setAcceptDrops(False)
+        self.comboLeftTagFilter.setEditable(True)
+
+        self.horizontalLayout_2.addWidget(self.comboLeftTagFilter)
+
+        self.buttonLeftTagsFileSelect = QPushButton(self.widget_4)
+        self.buttonLeftTagsFileSelect.setObjectName(u"buttonLeftTagsFileSelect")
+        self.buttonLeftTagsFileSelect.setFocusPolicy(Qt.ClickFocus)
+
+        self.horizontalLayout_2.addWidget(self.buttonLeftTagsFileSelect)
+
+
+        self.gridLayout_7.addLayout(self.horizontalLayout_2, 0, 0, 1, 1)
+
+
+        self.verticalLayoutLeftPanel.addWidget(self.widget_4)
+
+        self.splitterLeftPanel = QSplitter(self.layoutWidget)
+        self.splitterLeftPanel.setObjectName(u"splitterLeftPanel")
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.splitterLeftPanel.sizePolicy().hasHeightForWidth())
+        self.splitterLeftPanel.setSizePolicy(sizePolicy4)
+        self.splitterLeftPanel.setOrientation(Qt.Horizontal)
+        self.treeLeftTagHierarchy = QTreeView(self.splitterLeftPanel)
+        self.treeLeftTagHierarchy.setObjectName(u"treeLeftTagHierarchy")
+        sizePolicy5 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy5.setHorizontalStretch(3)
+        sizePolicy5.setVerticalStretch(0)
+        sizePolicy5.setHeightForWidth(self.treeLeftTagHierarchy.sizePolicy().hasHeightForWidth())
+        self.treeLeftTagHierarchy.setSizePolicy(sizePolicy5)
+        self.treeLeftTagHierarchy.setAlternatingRowColors(False)
+        self.treeLeftTagHierarchy.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.treeLeftTagHierarchy.setUniformRowHeights(True)
+        self.treeLeftTagHierarchy.setSortingEnabled(True)
+        self.splitterLeftPanel.addWidget(self.treeLeftTagHierarchy)
+        self.treeLeftTagHierarchy.header().setHighlightSections(True)
+
+        self.verticalLayoutLeftPanel.addWidget(self.splitterLeftPanel)
+
+        self.labelLeftPanelStatus = QLabel(self.layoutWidget)
+        self.labelLeftPanelStatus.setObjectName(u"labelLeftPanelStatus")
+        self.labelLeftPanelStatus.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.verticalLayoutLeftPanel.addWidget(self.labelLeftPanelStatus)
+
+        self.widget = QWidget(self.layoutWidget)
+        self.widget.setObjectName(u"widget")
+        self.widget.setMinimumSize(QSize(0, 30))
+        self.widget.setLayoutDirection(Qt.LeftToRight)
+        self.gridLayout_5 = QGridLayout(self.widget)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.horizontalLayout_11 = QHBoxLayout()
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_11.addItem(self.horizontalSpacer_3)
+
+        self.buttonLeftView = QPushButton(self.widget)
+        self.buttonLeftView.setObjectName(u"buttonLeftView")
+        sizePolicy6 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy6.setHorizontalStretch(0)
+        sizePolicy6.setVerticalStretch(0)
+        sizePolicy6.setHeightForWidth(self.buttonLeftView.sizePolicy().hasHeightForWidth())
+        self.buttonLeftView.setSizePolicy(sizePolicy6)
+
+        self.horizontalLayout_11.addWidget(self.buttonLeftView)
+
+        self.buttonAddSelectedTags = QPushButton(self.widget)
+        self.buttonAddSelectedTags.setObjectName(u"buttonAddSelectedTags")
+        sizePolicy6.setHeightForWidth(self.buttonAddSelectedTags.sizePolicy().hasHeightForWidth())
+        self.buttonAddSelectedTags.setSizePolicy(sizePolicy6)
+        self.buttonAddSelectedTags.setMinimumSize(QSize(100, 0))
+
+        self.horizontalLayout_11.addWidget(self.buttonAddSelectedTags)
+
+
+        self.gridLayout_5.addLayout(self.horizontalLayout_11, 0, 0, 1, 1)
+
+
+        self.verticalLayoutLeftPanel.addWidget(self.widget)
+
+        self.verticalLayoutLeftPanel.setStretch(2, 6)
+        self.splitterPanels.addWidget(self.layoutWidget)
+        self.line = QFrame(self.splitterPanels)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.Shape.VLine)
+        self.line.setFrameShadow(QFrame.Shadow.Sunken)
+        self.splitterPanels.addWidget(self.line)
+        self.layoutWidget1 = QWidget(self.splitterPanels)
+        self.layoutWidget1.setObjectName(u"layoutWidget1")
+        self.verticalLayoutRightPanel = QVBoxLayout(self.layoutWidget1)
+        self.verticalLayoutRightPanel.setObjectName(u"verticalLayoutRightPanel")
+        self.verticalLayoutRightPanel.setContentsMargins(0, 0, 0, 0)
+        self.label_2 = QLabel(self.layoutWidget1)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setFont(font)
+
+        self.verticalLayoutRightPanel.addWidget(self.label_2)
+
+        self.widget_5 = QWidget(self.layoutWidget1)
+        self.widget_5.setObjectName(u"widget_5")
+        sizePolicy2.setHeightForWidth(self.widget_5.sizePolicy().hasHeightForWidth())
+        self.widget_5.setSizePolicy(sizePolicy2)
+        self.widget_5.setMinimumSize(QSize(0, 45))
+        self.widget_5.setBaseSize(QSize(0, 40))
+        self.gridLayout_8 = QGridLayout(self.widget_5)
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+
+        self.gridLayout_8.addLayout(self.horizontalLayout_3, 0, 0, 1, 1)
+
+
+        self.verticalLayoutRightPanel.addWidget(self.widget_5)
+
+        self.splitterRightPanel = QSplitter(self.layoutWidget1)
+        self.splitterRightPanel.setObjectName(u"splitterRightPanel")
+        self.splitterRightPanel.setOrientation(Qt.Horizontal)
+        self.treeSelectedTags = QTreeView(self.splitterRightPanel)
+        self.treeSelectedTags.setObjectName(u"treeSelectedTags")
+        sizePolicy5.setHeightForWidth(self.treeSelectedTags.sizePolicy().hasHeightForWidth())
+        self.treeSelectedTags.setSizePolicy(sizePolicy5)
+        font1 = QFont()
+        font1.setBold(False)
+        self.treeSelectedTags.setFont(font1)
+        self.treeSelectedTags.setAlternatingRowColors(False)
+        self.treeSelectedTags.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.treeSelectedTags.setUniformRowHeights(True)
+        self.treeSelectedTags.setSortingEnabled(True)
+        self.splitterRightPanel.addWidget(self.treeSelectedTags)
+        self.treeSelectedTags.header().setHighlightSections(True)
+
+        self.verticalLayoutRightPanel.addWidget(self.splitterRightPanel)
+
+        self.labelRightPanelStatus = QLabel(self.layoutWidget1)
+        self.labelRightPanelStatus.setObjectName(u"labelRightPanelStatus")
+        self.labelRightPanelStatus.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.verticalLayoutRightPanel.addWidget(self.labelRightPanelStatus)
+
+        self.widget_3 = QWidget(self.layoutWidget1)
+        self.widget_3.setObjectName(u"widget_3")
+        self.widget_3.setMinimumSize(QSize(0, 40))
+        self.gridLayout_6 = QGridLayout(self.widget_3)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.horizontalLayout_13 = QHBoxLayout()
+        self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_13.addItem(self.horizontalSpacer_4)
+
+        self.buttonRightView = QPushButton(self.widget_3)
+        self.buttonRightView.setObjectName(u"buttonRightView")
+
+        self.horizontalLayout_13.addWidget(self.buttonRightView)
+
+        self.buttonRemoveSelected = QPushButton(self.widget_3)
+        self.buttonRemoveSelected.setObjectName(u"buttonRemoveSelected")
+
+        self.horizontalLayout_13.addWidget(self.buttonRemoveSelected)
+
+        self.buttonRemoveAllSelected = QPushButton(self.widget_3)
+        self.buttonRemoveAllSelected.setObjectName(u"buttonRemoveAllSelected")
+
+        self.horizontalLayout_13.addWidget(self.buttonRemoveAllSelected)
+
+
+        self.gridLayout_6.addLayout(self.horizontalLayout_13, 0, 0, 1, 1)
+
+
+        self.verticalLayoutRightPanel.addWidget(self.widget_3)
+
+        self.verticalLayoutRightPanel.setStretch(2, 6)
+        self.splitterPanels.addWidget(self.layoutWidget1)
+
+        self.verticalLayoutMainContainer.addWidget(self.splitterPanels)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.verticalLayoutMainContainer.addItem(self.horizontalSpacer)
+
+        self.horizontalLayoutExtractionDetails = QHBoxLayout()
+        self.horizontalLayoutExtractionDetails.setObjectName(u"horizontalLayoutExtractionDetails")
+        self.groupBoxExtractionSettings = QGroupBox(self.centralwidget)
+        self.groupBoxExtractionSettings.setObjectName(u"groupBoxExtractionSettings")
+        sizePolicy2.setHeightForWidth(self.groupBoxExtractionSettings.sizePolicy().hasHeightForWidth())
+        self.groupBoxExtractionSettings.setSizePolicy(sizePolicy2)
+        self.groupBoxExtractionSettings.setMinimumSize(QSize(0, 120))
+        self.horizontalLayout_4 = QHBoxLayout(self.groupBoxExtractionSettings)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.widgetLeftTimeFilter = QWidget(self.groupBoxExtractionSettings)
+        self.widgetLeftTimeFilter.setObjectName(u"widgetLeftTimeFilter")
+        self.gridLayout = QGridLayout(self.widgetLeftTimeFilter)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.verticaLayout = QVBoxLayout()
+        self.verticaLayout.setObjectName(u"verticaLayout")
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.label_7 = QLabel(self.widgetLeftTimeFilter)
+        self.label_7.setObjectName(u"label_7")
+        sizePolicy7 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
+        sizePolicy7.setHorizontalStretch(0)
+        sizePolicy7.setVerticalStretch(0)
+        sizePolicy7.setHeightForWidth(self.label_7.sizePolicy().hasHeightForWidth())
+        self.label_7.setSizePolicy(sizePolicy7)
+
+        self.horizontalLayout_7.addWidget(self.label_7)
+
+        self.dateTimeLeftFrom = QDateTimeEdit(self.widgetLeftTimeFilter)
+        self.dateTimeLeftFrom.setObjectName(u"dateTimeLeftFrom")
+        self.dateTimeLeftFrom.setEnabled(True)
+        sizePolicy.setHeightForWidth(self.dateTimeLeftFrom.sizePolicy().hasHeightForWidth())
+        self.dateTimeLeftFrom.setSizePolicy(sizePolicy)
+        self.dateTimeLeftFrom.setFocusPolicy(Qt.ClickFocus)
+        self.dateTimeLeftFrom.setMaximumDateTime(QDateTime(QDate(2050, 12, 31), QTime(12, 59, 59)))
+        self.dateTimeLeftFrom.setMinimumDateTime(QDateTime(QDate(2000, 1, 1), QTime(0, 0, 0)))
+        self.dateTimeLeftFrom.setDisplayFormat(u"MM/dd/yyyy h:mm AP")
+        self.dateTimeLeftFrom.setCalendarPopup(True)
+        self.dateTimeLeftFrom.setTimeSpec(Qt.LocalTime)
+
+        self.horizontalLayout_7.addWidget(self.dateTimeLeftFrom)
+
+
+        self.verticaLayout.addLayout(self.horizontalLayout_7)
+
+        self.horizontalLayout_8 = QHBoxLayout()
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.label_8 = QLabel(self.widgetLeftTimeFilter)
+        self.label_8.setObjectName(u"label_8")
+        sizePolicy7.setHeightForWidth(self.label_8.sizePolicy().hasHeightForWidth())
+        self.label_8.setSizePolicy(sizePolicy7)
+
+        self.horizontalLayout_8.addWidget(self.label_8)
+
+        self.dateTimeLeftTo = QDateTimeEdit(self.widgetLeftTimeFilter)
+        self.dateTimeLeftTo.setObjectName(u"dateTimeLeftTo")
+        self.dateTimeLeftTo.setEnabled(True)
+        sizePolicy.setHeightForWidth(self.dateTimeLeftTo.sizePolicy().hasHeightForWidth())
+        self.dateTimeLeftTo.setSizePolicy(sizePolicy)
+        self.dateTimeLeftTo.setFocusPolicy(Qt.ClickFocus)
+        self.dateTimeLeftTo.setMaximumDateTime(QDateTime(QDate(2050, 12, 31), QTime(12, 59, 59)))
+        self.dateTimeLeftTo.setMinimumDateTime(QDateTime(QDate(2000, 1, 1), QTime(0, 0, 0)))
+        self.dateTimeLeftTo.setDisplayFormat(u"MM/dd/yyyy h:mm AP")
+        self.dateTimeLeftTo.setCalendarPopup(True)
+
+        self.horizontalLayout_8.addWidget(self.dateTimeLeftTo)
+
+
+        self.verticaLayout.addLayout(self.horizontalLayout_8)
+
+
+        self.gridLayout.addLayout(self.verticaLayout, 0, 0, 1, 1)
+
+
+        self.horizontalLayout_4.addWidget(self.widgetLeftTimeFilter)
+
+        self.widget_2 = QWidget(self.groupBoxExtractionSettings)
+        self.widget_2.setObjectName(u"widget_2")
+        self.gridLayout_3 = QGridLayout(self.widget_2)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.horizontalLayout_9 = QHBoxLayout()
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.label_9 = QLabel(self.widget_2)
+        self.label_9.setObjectName(u"label_9")
+
+        self.horizontalLayout_9.addWidget(self.label_9)
+
+        self.comboSampleRate = QComboBox(self.widget_2)
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.addItem("")
+        self.comboSampleRate.setObjectName(u"comboSampleRate")
+        sizePolicy.setHeightForWidth(self.comboSampleRate.sizePolicy().hasHeightForWidth())
+        self.comboSampleRate.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_9.addWidget(self.comboSampleRate)
+
+        self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_6)
+
+        self.checkboxExtractAttributesOnly = QCheckBox(self.widget_2)
+        self.checkboxExtractAttributesOnly.setObjectName(u"checkboxExtractAttributesOnly")
+
+        self.horizontalLayout_9.addWidget(self.checkboxExtractAttributesOnly)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_9)
+
+        self.horizontalLayout_10 = QHBoxLayout()
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.label_10 = QLabel(self.widget_2)
+        self.label_10.setObjectName(u"label_10")
+        sizePolicy7.setHeightForWidth(self.label_10.sizePolicy().hasHeightForWidth())
+        self.label_10.setSizePolicy(sizePolicy7)
+
+        self.horizontalLayout_10.addWidget(self.label_10)
+
+        self.comboArchiveDirectory = QComboBox(self.widget_2)
+        self.comboArchiveDirectory.setObjectName(u"comboArchiveDirectory")
+        sizePolicy.setHeightForWidth(self.comboArchiveDirectory.sizePolicy().hasHeightForWidth())
+        self.comboArchiveDirectory.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_10.addWidget(self.comboArchiveDirectory)
+
+        self.buttonSelectArchiveFile = QPushButton(self.widget_2)
+        self.buttonSelectArchiveFile.setObjectName(u"buttonSelectArchiveFile")
+        sizePolicy6.setHeightForWidth(self.buttonSelectArchiveFile.sizePolicy().hasHeightForWidth())
+        self.buttonSelectArchiveFile.setSizePolicy(sizePolicy6)
+        self.buttonSelectArchiveFile.setMinimumSize(QSize(30, 0))
+
+        self.horizontalLayout_10.addWidget(self.buttonSelectArchiveFile)
+
+        self.comboArchiveFormat = QComboBox(self.widget_2)
+        self.comboArchiveFormat.setObjectName(u"comboArchiveFormat")
+        sizePolicy7.setHeightForWidth(self.comboArchiveFormat.sizePolicy().hasHeightForWidth())
+        self.comboArchiveFormat.setSizePolicy(sizePolicy7)
+        self.comboArchiveFormat.setMinimumSize(QSize(100, 0))
+
+        self.horizontalLayout_10.addWidget(self.comboArchiveFormat)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_10)
+
+
+        self.gridLayout_3.addLayout(self.verticalLayout_2, 0, 0, 1, 1)
+
+
+        self.horizontalLayout_4.addWidget(self.widget_2)
+
+        self.horizontalLayout_4.setStretch(0, 1)
+        self.horizontalLayout_4.setStretch(1, 2)
+
+        self.horizontalLayoutExtractionDetails.addWidget(self.groupBoxExtractionSettings)
+
+        self.verticalLayout_4 = QVBoxLayout()
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+
+        self.horizontalLayoutExtractionDetails.addLayout(self.verticalLayout_4)
+
+        self.verticalLayout_3 = QVBoxLayout()
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widgetTransferControls = QWidget(self.centralwidget)
+        self.widgetTransferControls.setObjectName(u"widgetTransferControls")
+        sizePolicy2.setHeightForWidth(self.widgetTransferControls.sizePolicy().hasHeightForWidth())
+        self.widgetTransferControls.setSizePolicy(sizePolicy2)
+        self.widgetTransferControls.setMinimumSize(QSize(0, 50))
+        self.gridLayout_4 = QGridLayout(self.widgetTransferControls)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout_4.addItem(self.verticalSpacer, 0, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.widgetTransferControls)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.buttonCopy = QPushButton(self.centralwidget)
+        self.buttonCopy.setObjectName(u"buttonCopy")
+        font2 = QFont()
+        font2.setBold(True)
+        self.buttonCopy.setFont(font2)
+
+        self.horizontalLayout.addWidget(self.buttonCopy)
+
+        self.buttonExit = QPushButton(self.centralwidget)
+        self.buttonExit.setObjectName(u"buttonExit")
+        self.buttonExit.setFocusPolicy(Qt.ClickFocus)
+
+        self.horizontalLayout.addWidget(self.buttonExit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+
+
+        self.horizontalLayoutExtractionDetails.addLayout(self.verticalLayout_3)
+
+        self.horizontalLayoutExtractionDetails.setStretch(0, 8)
+        self.horizontalLayoutExtractionDetails.setStretch(1, 1)
+        self.horizontalLayoutExtractionDetails.setStretch(2, 3)
+
+        self.verticalLayoutMainContainer.addLayout(self.horizontalLayoutExtractionDetails)
+
+        self.verticalLayoutMainContainer.setStretch(2, 7)
+
+        self.gridLayout_2.addLayout(self.verticalLayoutMainContainer, 0, 0, 1, 1)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1330, 22))
+        self.menuConnection = QMenu(self.menubar)
+        self.menuConnection.setObjectName(u"menuConnection")
+        self.menuTags = QMenu(self.menubar)
+        self.menuTags.setObjectName(u"menuTags")
+        self.menuExtraction = QMenu(self.menubar)
+        self.menuExtraction.setObjectName(u"menuExtraction")
+        self.menuHelp = QMenu(self.menubar)
+        self.menuHelp.setObjectName(u"menuHelp")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.menubar.addAction(self.menuConnection.menuAction())
+        self.menubar.addAction(self.menuTags.menuAction())
+        self.menubar.addAction(self.menuExtraction.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuConnection.addAction(self.actionAddNewConnection)
+        self.menuConnection.addAction(self.actionManageConnections)
+        self.menuConnection.addSeparator()
+        self.menuConnection.addAction(self.actionRefreshTagCatalog)
+        self.menuTags.addAction(self.actionImportTagsList)
+        self.menuTags.addAction(self.actionPasteTagsList)
+        self.menuExtraction.addAction(self.actionResumeExtraction)
+        self.menuExtraction.addAction(self.actionJobQueue)
+        self.menuHelp.addAction(self.actionProfileNextOperation)
+
+        self.retranslateUi(MainWindow)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
+        self.actionAddNewConnection.setText(QCoreApplication.translate("MainWindow", u"Add New Connection...", None))
+        self.actionManageConnections.setText(QCoreApplication.translate("MainWindow", u"Manage Connections...", None))
+        self.actionRefreshTagCatalog.setText(QCoreApplication.translate("MainWindow", u"Refresh Tag Catalog", None))
+#if QT_CONFIG(tooltip)
+        self.actionRefreshTagCatalog.setToolTip(QCoreApplication.translate("MainWindow", u"Reload tags of the current connection from the historian instead of the local cache", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(shortcut)
+        self.actionRefreshTagCatalog.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+R", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionImportTagsList.setText(QCoreApplication.translate("MainWindow", u"Import Tags List...", None))
+#if QT_CONFIG(tooltip)
+        self.actionImportTagsList.setToolTip(QCoreApplication.translate("MainWindow", u"Find the tags of an Excel, CSV or text file", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(shortcut)
+        self.actionImportTagsList.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+O", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionPasteTagsList.setText(QCoreApplication.translate("MainWindow", u"Paste Tags List", None))
+#if QT_CONFIG(tooltip)
+        self.actionPasteTagsList.setToolTip(QCoreApplication.translate("MainWindow", u"Find the tags copied to the clipboard, i.e. cells copied from Excel", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(shortcut)
+        self.actionPasteTagsList.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Shift+V", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionResumeExtraction.setText(QCoreApplication.translate("MainWindow", u"Resume Extraction...", None))
+        self.actionJobQueue.setText(QCoreApplication.translate("MainWindow", u"Job Queue...", None))
+#if QT_CONFIG(tooltip)
+        self.actionJobQueue.setToolTip(QCoreApplication.translate("MainWindow", u"Extraction jobs queued, running and finished", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(shortcut)
+        self.actionJobQueue.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+J", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionProfileNextOperation.setText(QCoreApplication.translate("MainWindow", u"Profile Next Operation", None))
+#if QT_CONFIG(tooltip)
+        self.actionProfileNextOperation.setToolTip(QCoreApplication.translate("MainWindow", u"Profile the next extraction or tags query, the profile is saved next to the extraction log", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_3.setText(QCoreApplication.translate("MainWindow", u"Server:", None))
+        self.comboLeftConnection.setItemText(0, QCoreApplication.translate("MainWindow", u"Business PI Server", None))
+
+        self.labelLeftConnectionDetails.setText(QCoreApplication.translate("MainWindow", u"Connection Details...", None))
+        self.buttonLeftConnect.setText(QCoreApplication.translate("MainWindow", u"Connect", None))
+        self.label.setText(QCoreApplication.translate("MainWindow", u"Server Tags", None))
+        self.comboLeftTagFilter.setCurrentText("")
+        self.comboLeftTagFilter.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Tags filter...", None))
+        self.buttonLeftTagsFileSelect.setText(QCoreApplication.translate("MainWindow", u"Select Tags From File...", None))
+        self.labelLeftPanelStatus.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.buttonLeftView.setText(QCoreApplication.translate("MainWindow", u"Preview Tags", None))
+        self.buttonAddSelectedTags.setText(QCoreApplication.translate("MainWindow", u"Add to Selected Tags", None))
+        self.label_2.setText(QCoreApplication.translate("MainWindow", u"Selected Tags", None))
+        self.labelRightPanelStatus.setText(QCoreApplication.translate("MainWindow", u"0 tags", None))
+        self.buttonRightView.setText(QCoreApplication.translate("MainWindow", u"Preview Tags", None))
+        self.buttonRemoveSelected.setText(QCoreApplication.translate("MainWindow", u"Remove", None))
+        self.buttonRemoveAllSelected.setText(QCoreApplication.translate("MainWindow", u"Remove All", None))
+        self.groupBoxExtractionSettings.setTitle(QCoreApplication.translate("MainWindow", u"Extraction Settings", None))
+        self.label_7.setText(QCoreApplication.translate("MainWindow", u"Start Time", None))
+        self.label_8.setText(QCoreApplication.translate("MainWindow", u"End Time", None))
+        self.label_9.setText(QCoreApplication.translate("MainWindow", u"Data Frequency", None))
+        self.comboSampleRate.setItemText(0, QCoreApplication.translate("MainWindow", u"Raw Data", None))
+        self.comboSampleRate.setItemText(1, QCoreApplication.translate("MainWindow", u"1 minute", None))
+        self.comboSampleRate.setItemText(2, QCoreApplication.translate("MainWindow", u"3 minutes", None))
+        self.comboSampleRate.setItemText(3, QCoreApplication.translate("MainWindow", u"5 minutes", None))
+        self.comboSampleRate.setItemText(4, QCoreApplication.translate("MainWindow", u"10 minutes", None))
+        self.comboSampleRate.setItemText(5, QCoreApplication.translate("MainWindow", u"1 hour", None))
+        self.comboSampleRate.setItemText(6, QCoreApplication.translate("MainWindow", u"1 day", None))
+
+        self.checkboxExtractAttributesOnly.setText(QCoreApplication.translate("MainWindow", u"Extract Tag Metadata Only", None))
+        self.label_10.setText(QCoreApplication.translate("MainWindow", u"Save Directory", None))
+        self.buttonSelectArchiveFile.setText(QCoreApplication.translate("MainWindow", u" Browse ...", None))
+#if QT_CONFIG(tooltip)
+        self.comboArchiveFormat.setToolTip(QCoreApplication.translate("MainWindow", u"Archive format", None))
+#endif // QT_CONFIG(tooltip)
+        self.buttonCopy.setText(QCoreApplication.translate("MainWindow", u"Extract", None))
+        self.buttonExit.setText(QCoreApplication.translate("MainWindow", u"Exit", None))
+        self.menuConnection.setTitle(QCoreApplication.translate("MainWindow", u"Connections", None))
+        self.menuTags.setTitle(QCoreApplication.translate("MainWindow", u"Tags", None))
+        self.menuExtraction.setTitle(QCoreApplication.translate("MainWindow", u"Extraction", None))
+        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"Help", None))
+    # retranslateUi
+
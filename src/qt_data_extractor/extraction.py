@@ -0,0 +1,999 @@
+"""
+Extraction pipeline shared by all front-ends.
+
+Historian reads are spread over a pool of concurrent readers, while all writes go
+through a single ``ArchiveWriter`` that owns the destination connector. The module
+does not depend on Qt, so it can be driven from a ``Worker`` as well as from batch
+runs.
+"""
+
+import collections
+import importlib
+import importlib.util
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from data_agent.connection_manager import ConnectionManager
+from data_agent.exceptions import GroupAlreadyExists, UnrecognizedConnectionType
+
+from qt_data_extractor import __version__
+from qt_data_extractor.checkpoint import CHECKPOINT_FILE_EXTENSION
+from qt_data_extractor.timestamps import to_local_naive, to_utc, utc_index
+
+log = logging.getLogger(__name__)
+
+SHORT_VERSION = f'{__version__.split(".")[0]}.{__version__.split(".")[1]}'
+OUTPUT_FILE_PREFIX = "extractor-output"
+DEFAULT_ARCHIVE_TYPE = "zip-stream"
+DEFAULT_MAX_READERS = 4
+DEFAULT_CONNECTION_CONCURRENCY = 4
+# Max number of simultaneous requests per source connection, by connection type. With
+# adaptive load control these are ceilings, the actual limit follows the server latency.
+CONNECTION_CONCURRENCY_LIMITS = {
+    "osisoft-pi": 4,
+    "aspen-ip21": 2,
+}
+# Adjust concurrency and request size of every source connection to its latency (AIMD)
+ADAPTIVE_LOAD_CONTROL = True
+ADAPTIVE_INITIAL_CONCURRENCY = 2
+DEFAULT_TARGET_LATENCY_SECONDS = 10.0
+# Requests slower than this are a sign of an overloaded server, by connection type
+CONNECTION_TARGET_LATENCY_SECONDS = {
+    "osisoft-pi": 10.0,
+    "aspen-ip21": 15.0,
+}
+# Smallest part of a time window read by a single request
+MIN_REQUEST_SCALE = 1 / 16
+# Reads of a (tag, time window) unit are retried with exponential backoff and full
+# jitter, a unit failing all attempts is reported and the rest of the job continues
+MAX_UNIT_ATTEMPTS = 4
+RETRY_BACKOFF_SECONDS = 2.0
+MAX_RETRY_BACKOFF_SECONDS = 60.0
+# Frames read ahead of the archive writer, per reader
+WRITER_QUEUE_DEPTH_PER_READER = 2
+# Suffix of a resumed archive that was left unreadable (i.e. the process was killed)
+DAMAGED_ARCHIVE_SUFFIX = ".damaged"
+# Archive connectors shipped with the extractor (looked up before data agent plugins),
+# imported on first use - they bring pandas (and pyarrow) in
+ARCHIVE_CONNECTORS = {
+    "zip-stream": "qt_data_extractor.connectors.zip_stream:StreamingZipConnector",
+    "parquet": "qt_data_extractor.connectors.parquet:ParquetConnector",
+}
+# Archive formats available for extraction, by connector type
+ARCHIVE_FORMATS = {
+    "zip-stream": {
+        "name": "Zipped CSV",
+        "extension": ".zip",
+        "path_param": "zipfile_path",
+    },
+}
+
+# pyarrow is optional - pip install qt-data-extractor[parquet]
+if importlib.util.find_spec("pyarrow") is not None:
+    ARCHIVE_FORMATS["parquet"] = {
+        "name": "Parquet",
+        "extension": ".parquet",
+        "path_param": "parquet_path",
+    }
+
+_connection_limiters = {}
+_connection_limiters_lock = threading.Lock()
+# Output paths handed out by this process, they are not created until the job runs
+_output_paths = set()
+_output_paths_lock = threading.Lock()
+
+
+def _connector_class(conn_type):
+    if conn_type in ARCHIVE_CONNECTORS:
+        module_name, class_name = ARCHIVE_CONNECTORS[conn_type].split(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    for entry in ConnectionManager.list_plugins():
+        if entry.name == conn_type:
+            return entry.load()
+
+    raise UnrecognizedConnectionType(f'Unrecognized connection type "{conn_type}".')
+
+
+class ConnectionLimiter:
+    """Caps the number of requests running against a single connection"""
+
+    def __init__(self, limit):
+        self._limit = max(1, limit)
+        self._active = 0
+        self._cond = threading.Condition()
+
+    @property
+    def request_scale(self):
+        """Part of a time window read by a single request"""
+        return 1.0
+
+    @property
+    def limit(self):
+        return self._limit
+
+    @limit.setter
+    def limit(self, value):
+        with self._cond:
+            self._limit = max(1, value)
+            self._cond.notify_all()
+
+    @property
+    def active(self):
+        return self._active
+
+    def __enter__(self):
+        with self._cond:
+            self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+
+class AdaptiveConnectionLimiter(ConnectionLimiter):
+    """
+    Connection limiter following the latency and errors of the requests (AIMD).
+
+    Every request is timed. A request faster than `target_latency` counts towards
+    additive increase - the limit grows by one once a limit's worth of requests succeeded,
+    up to `ceiling`. A slow or failed request halves the limit and the request size (at
+    most once per `target_latency`, so a burst of slow requests counts once). Fast requests
+    double the request size back, up to a whole time window.
+
+    :param ceiling: Max number of simultaneous requests
+    :param target_latency: Request duration (seconds) above which the server is overloaded
+    :param initial: Starting limit
+    """
+
+    def __init__(
+        self,
+        ceiling,
+        target_latency=DEFAULT_TARGET_LATENCY_SECONDS,
+        initial=ADAPTIVE_INITIAL_CONCURRENCY,
+    ):
+        super().__init__(min(initial, ceiling))
+        self._ceiling = max(1, ceiling)
+        self._target_latency = target_latency
+        self._request_scale = 1.0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._started = threading.local()
+
+    @property
+    def ceiling(self):
+        return self._ceiling
+
+    @ceiling.setter
+    def ceiling(self, value):
+        self._ceiling = max(1, value)
+        if self.limit > self._ceiling:
+            self.limit = self._ceiling
+
+    @property
+    def request_scale(self):
+        return self._request_scale
+
+    def __enter__(self):
+        super().__enter__()
+        self._started.time = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        super().__exit__(exc_type, exc_val, exc_tb)
+        self.record(time.monotonic() - self._started.time, error=exc_type is not None)
+
+    def record(self, latency, error=False):
+        """Adjust the limit and request size after a request"""
+        with self._cond:
+            if error or latency > self._target_latency:
+                now = time.monotonic()
+                if now - self._last_decrease > self._target_latency:
+                    self._last_decrease = now
+                    self._limit = max(1, self._limit // 2)
+                    self._request_scale = max(
+                        MIN_REQUEST_SCALE, self._request_scale / 2
+                    )
+                    self._successes = 0
+                    log.info(
+                        f"Slow requests ({latency:.1f}s), limit {self._limit}, "
+                        f"request scale {self._request_scale}"
+                    )
+                return
+
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._successes = 0
+                if self._limit < self._ceiling:
+                    self._limit += 1
+                    self._cond.notify()
+
+            if latency < self._target_latency / 2:
+                self._request_scale = min(1.0, self._request_scale * 2)
+
+
+def check_updatable(connector):
+    """Raise ValueError unless archives of a connector class can be updated"""
+    if not hasattr(connector, "group_last_timestamps"):
+        raise ValueError(f"{connector.TYPE} archives do not support updating")
+
+
+def split_period(first_timestamp, last_timestamp, window=None):
+    """Cut a period into consecutive time windows
+
+    :param first_timestamp:
+    :param last_timestamp:
+    :param window: Window length (timedelta), None - single window for the whole period
+    :return: List of (start, end) tuples
+    """
+    if not window or first_timestamp is None or last_timestamp is None:
+        return [(first_timestamp, last_timestamp)]
+
+    windows = []
+    start = first_timestamp
+    while start < last_timestamp:
+        end = min(start + window, last_timestamp)
+        windows.append((start, end))
+        start = end
+
+    return windows or [(first_timestamp, last_timestamp)]
+
+
+def _trim_window(df, end):
+    """Drop rows at or after `end` (UTC), they belong to the next window"""
+    import pandas as pd
+
+    if not isinstance(df.index, pd.DatetimeIndex):
+        return df
+
+    return df[utc_index(df.index) < to_utc(end)]
+
+
+def _trim_stored(df, last_stored):
+    """Drop rows at or before `last_stored` (UTC), they are already in the archive"""
+    import pandas as pd
+
+    if not isinstance(df.index, pd.DatetimeIndex):
+        return df
+
+    return df[utc_index(df.index) > to_utc(last_stored)]
+
+
+def retry_delay(attempt):
+    """Backoff before retry number `attempt` (1 based) - full jitter"""
+    return random.uniform(
+        0, min(MAX_RETRY_BACKOFF_SECONDS, RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    )
+
+
+def connection_limiter(conn_name, conn_type=None):
+    """Return the limiter shared by every job reading from `conn_name`
+
+    :param conn_name: Source connection name
+    :param conn_type: Source connection type, used to pick the default limit
+    :return: ConnectionLimiter (AdaptiveConnectionLimiter with adaptive load control)
+    """
+    with _connection_limiters_lock:
+        if conn_name not in _connection_limiters:
+            limit = CONNECTION_CONCURRENCY_LIMITS.get(
+                conn_type, DEFAULT_CONNECTION_CONCURRENCY
+            )
+            _connection_limiters[conn_name] = (
+                AdaptiveConnectionLimiter(
+                    limit,
+                    target_latency=CONNECTION_TARGET_LATENCY_SECONDS.get(
+                        conn_type, DEFAULT_TARGET_LATENCY_SECONDS
+                    ),
+                )
+                if ADAPTIVE_LOAD_CONTROL
+                else ConnectionLimiter(limit)
+            )
+
+        return _connection_limiters[conn_name]
+
+
+class ArchiveWriter:
+    """
+    Single consumer owning the destination connector.
+
+    Frames are queued by the readers and written sequentially on the writer thread,
+    so connectors that are not thread safe (i.e. zip) can be fed from many readers.
+    The queue is bounded, which keeps readers from running too far ahead of the disk.
+
+    :param conn_type: Destination connector type (i.e. "zip")
+    :param conn_name: Destination connection name
+    :param max_pending: Max number of frames waiting to be written
+    :param conn_params: Connector specific parameters (i.e. zipfile_path)
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        conn_type,
+        conn_name,
+        max_pending=DEFAULT_MAX_READERS * WRITER_QUEUE_DEPTH_PER_READER,
+        **conn_params,
+    ):
+        self._conn = _connector_class(conn_type)(conn_name=conn_name, **conn_params)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        self._error = None
+        self._write_seconds = 0.0
+        # Callbacks of the stored frames, called once the archive is closed
+        self._written = []
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def connection(self):
+        return self._conn
+
+    @property
+    def write_seconds(self):
+        """Time spent writing to the archive"""
+        return self._write_seconds
+
+    def open(self):
+        self._conn.connect()
+        self._thread = threading.Thread(
+            target=self._run, name=f"archive-writer-{self._conn.name}", daemon=True
+        )
+        self._thread.start()
+
+    def close(self):
+        if self._thread is None:
+            return
+
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+        self._conn.disconnect()
+
+        # The frames written before a writer error are in the closed archive as well
+        written, self._written = self._written, []
+        for on_written, archive_bytes in self._frame_archive_bytes(written):
+            on_written(archive_bytes)
+
+        self._raise_error()
+
+    def list_groups(self):
+        return self._conn.list_groups()
+
+    def write_attributes(self, attributes):
+        self._put(self._conn.write_tag_attributes, attributes)
+
+    def write(self, group, df, on_conflict="append", on_written=None):
+        """Queue a frame for writing
+
+        :param group: Destination group
+        :param df: Data frame
+        :param on_conflict:
+        :param on_written: Called once the frame is committed, when the archive is closed.
+            Zip entries and the Parquet footer are only written on close, an archive
+            left by a killed process does not hold the frames written before.
+            Called with the compressed archive bytes of the frame - its share (by rows)
+            of the bytes written to `group`, 0 when the connector does not report them.
+        """
+        self._put(self._write, group, df, on_conflict, on_written)
+
+    def last_timestamps(self, groups=None):
+        """Last timestamp stored in the archive, by group"""
+        check_updatable(type(self._conn))
+
+        self.flush()
+        return self._conn.group_last_timestamps(groups)
+
+    def close_group(self, group):
+        """Signal that no more data will be appended to `group`"""
+        if hasattr(self._conn, "close_group"):
+            self._put(self._conn.close_group, group)
+
+    def flush(self):
+        """Block until all queued frames are written"""
+        self._queue.join()
+        self._raise_error()
+
+    def _put(self, fn, *args, **kwargs):
+        self._raise_error()
+        self._queue.put((fn, args, kwargs))
+
+    def _write(self, group, df, on_conflict, on_written):
+        self._conn.write_group_values_period(group, df, on_conflict=on_conflict)
+        if on_written:
+            self._written.append((group, len(df.index), on_written))
+
+    def _frame_archive_bytes(self, written):
+        """Split the archive bytes written to every group across its frames, by rows"""
+        group_bytes = getattr(self._conn, "written_bytes", {})
+        group_rows = collections.Counter()
+        for group, rows, _ in written:
+            group_rows[group] += rows
+
+        for group, rows, on_written in written:
+            archive_bytes = group_bytes.get(group, 0)
+            yield on_written, (
+                archive_bytes * rows // group_rows[group] if group_rows[group] else 0
+            )
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+
+                if self._error is None:
+                    fn, args, kwargs = item
+                    started = time.monotonic()
+                    fn(*args, **kwargs)
+                    self._write_seconds += time.monotonic() - started
+            except Exception as e:
+                log.exception("Archive writer failed")
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+
+class _UnitFailed(Exception):
+    def __init__(self, error, attempts):
+        super().__init__(str(error))
+        self.error = error
+        self.attempts = attempts
+
+
+class ExtractionEngine:
+    """
+    Copies tags from a source connection into an ArchiveWriter.
+
+    Mirrors `copy_attributes` / `copy_period` of the data agent API, but splits the
+    tag list across `max_readers` concurrent readers and can stream each tag in
+    time windows. Requests against the same
+    source connection are additionally capped by its ConnectionLimiter, which is
+    shared between all engines. An adaptive limiter also splits windows into shorter
+    requests while the source connection is slow.
+
+    :param api: Data agent API
+    :param max_readers: Number of concurrent readers
+    """
+
+    def __init__(self, api, max_readers=DEFAULT_MAX_READERS):
+        self._api = api
+        self._max_readers = max(1, max_readers)
+
+    @property
+    def max_readers(self):
+        return self._max_readers
+
+    def copy_attributes(self, src_conn, tags, writer, dest_group="", attributes=None):
+        dest_group = dest_group.strip()
+
+        attr = self._api.read_tag_attributes(src_conn, tags, attributes)
+
+        if dest_group:
+            delimiter = writer.connection.GROUP_DELIMITER
+            attr = {f"{dest_group}{delimiter}{a}": attr[a] for a in attr}
+
+        writer.write_attributes(attr)
+        writer.flush()
+
+    def copy_period(
+        self,
+        src_conn,
+        tags,
+        writer,
+        first_timestamp,
+        last_timestamp,
+        dest_group="",
+        time_frequency=None,
+        on_conflict="ask",
+        progress_callback=None,
+        window=None,
+        checkpoint=None,
+        last_stored=None,
+        cancel_token=None,
+        window_callback=None,
+        report=None,
+    ):
+        """Copy a period of data for all `tags`
+
+        Each tag is read one time window at a time and every window is appended to the
+        destination group as soon as it arrives, so memory use depends on the window
+        length rather than on the length of the period.
+
+        :param src_conn: Source connection name
+        :param tags: Tags to copy
+        :param writer: ArchiveWriter
+        :param first_timestamp: Period start, naive timestamps are local time
+        :param last_timestamp: Period end, naive timestamps are local time
+        :param dest_group: Destination group, if empty - each tag is copied to its own group
+        :param time_frequency:
+        :param on_conflict: "ask" raises GroupAlreadyExists if any of the groups already exists
+        :param progress_callback: Called with (tag, completed tags counter)
+        :param window: Time window length (timedelta), None - read the whole period at once
+        :param checkpoint: Checkpoint recording stored units, completed units are skipped
+        :param last_stored: Last timestamp already stored in the archive, by tag. Only data
+            after it is copied for these tags (i.e. when updating an existing archive).
+        :param cancel_token: CancellationToken checked before every window, a cancelled
+            copy raises ExtractionCancelled once the windows being read are stored
+        :param window_callback: Called with (tag, rows, bytes) for every window read
+        :param report: JobReport recording requests, retries and archived frames
+        :return: Failed units - list of dictionaries (tag, start, end, error, attempts).
+            The windows of a tag following its failed window are not read (a tag is
+            appended in order), they are reported with the failed one as `skipped`.
+        """
+        tags = list(tags)
+        last_stored = last_stored or {}
+        dest_group = dest_group.strip()
+        # Windows are cut and trimmed in UTC, see the `timestamps` module
+        first_timestamp = to_utc(first_timestamp)
+        last_timestamp = to_utc(last_timestamp)
+
+        if on_conflict == "ask":
+            existing_groups = writer.list_groups()
+
+            if dest_group and dest_group in existing_groups:
+                raise GroupAlreadyExists(f"{dest_group} already exist")
+
+            for tag in tags:
+                if tag in existing_groups:
+                    raise GroupAlreadyExists(f"{tag} already exist")
+
+            on_conflict = "append"
+
+        if not tags:
+            return []
+
+        limiter = connection_limiter(src_conn, self._source_type(src_conn))
+        counter_lock = threading.Lock()
+        completed = [0]
+        failures = []
+
+        def read_tag(tag):
+            group = dest_group
+
+            stored_until = None
+            if tag in last_stored:
+                # Archives store naive UTC timestamps
+                stored_until = to_utc(last_stored[tag], naive_utc=True)
+                windows = (
+                    split_period(stored_until, last_timestamp, window)
+                    if last_timestamp is None or stored_until < last_timestamp
+                    else []
+                )
+            else:
+                windows = split_period(first_timestamp, last_timestamp, window)
+
+            # Windows of a tag are read in order, so they are appended in order
+            for i, (start, end) in enumerate(windows):
+                if checkpoint and checkpoint.is_completed(tag, start):
+                    continue
+
+                if cancel_token:
+                    cancel_token.check()
+
+                try:
+                    df = self._read_unit(
+                        src_conn,
+                        tag,
+                        start,
+                        end,
+                        time_frequency,
+                        limiter,
+                        cancel_token,
+                        report,
+                    )
+                except _UnitFailed as e:
+                    log.error(f"Failed reading {tag} [{start}, {end}]: {e.error}")
+                    with counter_lock:
+                        failures.append(
+                            {
+                                "tag": tag,
+                                "start": start,
+                                "end": end,
+                                "error": str(e.error),
+                                "attempts": e.attempts,
+                                "skipped": len(windows) - i - 1,
+                            }
+                        )
+                    break
+
+                if i < len(windows) - 1:
+                    df = _trim_window(df, end)
+                if i == 0 and stored_until is not None:
+                    df = _trim_stored(df, stored_until)
+
+                nbytes = (
+                    int(df.memory_usage(deep=True).sum())
+                    if window_callback or report
+                    else 0
+                )
+                if window_callback:
+                    window_callback(tag, len(df.index), nbytes)
+                if report:
+                    report.window_read(tag, len(df.index), nbytes)
+
+                if tag in last_stored and len(df.index) == 0:
+                    # Nothing new, keep the stored group untouched
+                    continue
+
+                if not group:
+                    group = df.columns[0] if len(df.columns) > 0 else tag
+
+                def on_written(
+                    archive_bytes,
+                    start=start,
+                    end=end,
+                    rows=len(df.index),
+                    nbytes=nbytes,
+                ):
+                    if checkpoint:
+                        checkpoint.mark_completed(tag, start, end)
+                    if report:
+                        report.written(tag, rows, nbytes, archive_bytes)
+
+                writer.write(
+                    group,
+                    df,
+                    on_conflict=on_conflict,
+                    on_written=on_written if checkpoint or report else None,
+                )
+                del df
+
+            if group and not dest_group:
+                writer.close_group(group)
+
+            with counter_lock:
+                completed[0] += 1
+                counter = completed[0]
+
+            if progress_callback:
+                progress_callback(tag, counter)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_readers, len(tags)),
+            thread_name_prefix="extraction-reader",
+        ) as executor:
+            futures = [executor.submit(read_tag, tag) for tag in tags]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+
+            for future in pending:
+                future.cancel()
+
+        for future in futures:
+            if future.done() and not future.cancelled() and future.exception():
+                raise future.exception()
+
+        writer.flush()
+        return failures
+
+    def _read_unit(
+        self,
+        src_conn,
+        tag,
+        start,
+        end,
+        time_frequency,
+        limiter,
+        cancel_token=None,
+        report=None,
+    ):
+        """Read a time window of a tag, retrying failed reads with backoff"""
+        for attempt in range(1, MAX_UNIT_ATTEMPTS + 1):
+            try:
+                return self._read_window(
+                    src_conn, tag, start, end, time_frequency, limiter, report
+                )
+            except Exception as e:
+                if attempt == MAX_UNIT_ATTEMPTS:
+                    raise _UnitFailed(e, attempt)
+
+                if report:
+                    report.retry(tag)
+
+                delay = retry_delay(attempt)
+                log.warning(
+                    f"Reading {tag} [{start}, {end}] failed ({e}), "
+                    f"retry {attempt} in {delay:.1f}s"
+                )
+                if cancel_token:
+                    cancel_token.sleep(delay)
+                    cancel_token.check()
+                else:
+                    time.sleep(delay)
+
+    def _read_window(
+        self, src_conn, tag, start, end, time_frequency, limiter, report=None
+    ):
+        """Read a time window (UTC bounds) of a tag in requests sized by the limiter"""
+        parts = []
+        part_start = start
+        while True:
+            part_end = end
+            if start is not None and end is not None and limiter.request_scale < 1:
+                part_end = min(part_start + (end - start) * limiter.request_scale, end)
+
+            with limiter:
+                started = time.monotonic()
+                try:
+                    df = self._api.read_tag_values_period(
+                        conn_name=src_conn,
+                        tags=[tag],
+                        first_timestamp=to_local_naive(part_start),
+                        last_timestamp=to_local_naive(part_end),
+                        time_frequency=time_frequency,
+                    )
+                finally:
+                    if report:
+                        report.request(
+                            tag,
+                            time.monotonic() - started,
+                            error=sys.exc_info()[0] is not None,
+                        )
+
+            if part_end == end:
+                parts.append(df)
+                break
+
+            # The next part starts at `part_end`
+            parts.append(_trim_window(df, part_end))
+            part_start = part_end
+
+        if len(parts) == 1:
+            return parts[0]
+
+        import pandas as pd
+
+        return pd.concat(parts)
+
+    def _source_type(self, conn_name):
+        for conn in self._api.list_connections():
+            if conn["name"] == conn_name:
+                return conn["type"]
+
+        return None
+
+
+def output_file_path(directory, now=None):
+    """Path of a new extraction output, without extension (shared by archive, log, etc.)
+
+    Outputs created within the same second (i.e. queued jobs) get a numbered suffix.
+    """
+    now = now or datetime.now()
+    base = os.path.join(
+        directory,
+        f'{OUTPUT_FILE_PREFIX}-v{SHORT_VERSION}-{now.strftime("%Y-%m-%dT%H-%M-%S")}',
+    )
+
+    with _output_paths_lock:
+        path, number = base, 1
+        while path in _output_paths:
+            number += 1
+            path = f"{base}-{number}"
+        _output_paths.add(path)
+
+    return path
+
+
+def create_job(
+    src_conn,
+    tags,
+    directory,
+    first_timestamp,
+    last_timestamp,
+    time_frequency=None,
+    window=None,
+    attributes_only=False,
+    max_readers=DEFAULT_MAX_READERS,
+    dest_conn=None,
+    dest_group="",
+    archive_type=DEFAULT_ARCHIVE_TYPE,
+    update_archive=None,
+):
+    """Describe a new extraction job writing into a new archive in `directory`
+
+    :param first_timestamp: Period start, naive timestamps are local time
+    :param last_timestamp: Period end, naive timestamps are local time
+    :param archive_type: Archive connector type (one of ARCHIVE_FORMATS)
+    :param update_archive: Existing archive to update instead of creating a new one - tags
+        already stored in it are copied from their last stored timestamp
+    :return: Job dictionary (stored in the checkpoint manifest)
+    :raises ValueError: The archive to update is not of an updatable format
+    """
+    if update_archive:
+        archive_type = archive_type_of(update_archive)
+        check_updatable(_connector_class(archive_type))
+        archive = update_archive
+        file_path = os.path.splitext(update_archive)[0]
+    else:
+        file_path = output_file_path(directory)
+        archive = f"{file_path}{ARCHIVE_FORMATS[archive_type]['extension']}"
+
+    return {
+        "src_conn": src_conn,
+        "tags": list(tags),
+        "dest_conn": dest_conn or os.path.basename(file_path),
+        "archive_type": archive_type,
+        "archive": archive,
+        "update": bool(update_archive),
+        "dest_group": dest_group,
+        # Stored in UTC, the manifest does not depend on the time zone of the machine
+        "first_timestamp": to_utc(first_timestamp),
+        "last_timestamp": to_utc(last_timestamp),
+        "time_frequency": time_frequency,
+        "window": window,
+        "attributes_only": attributes_only,
+        "max_readers": max_readers,
+    }
+
+
+def archive_type_of(path):
+    """Archive connector type by file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    for archive_type, archive_format in ARCHIVE_FORMATS.items():
+        if archive_format["extension"] == extension:
+            return archive_type
+
+    raise ValueError(f"Unsupported archive format '{os.path.basename(path)}'")
+
+
+def job_file_path(job, extension):
+    """Path of a file kept next to the job archive (i.e. ".log")"""
+    return f"{os.path.splitext(job['archive'])[0]}{extension}"
+
+
+def checkpoint_path(job):
+    return job_file_path(job, CHECKPOINT_FILE_EXTENSION)
+
+
+def _check_resumed_archive(job, archive_type, checkpoint):
+    """Start over when the archive of a resumed job was left unreadable
+
+    Units are recorded in the checkpoint once the archive is closed, an archive that
+    cannot be opened (i.e. the process was killed while writing it) does not hold them.
+    It is moved aside and the job is extracted again. An updated archive is the only
+    copy of its data, it is not replaced.
+    """
+    archive = job["archive"]
+    connector = _connector_class(archive_type)
+    if not os.path.exists(archive) or not hasattr(connector, "is_valid_archive"):
+        return
+
+    if connector.is_valid_archive(archive):
+        return
+
+    if job.get("update"):
+        raise ValueError(
+            f"'{archive}' is damaged (the extraction was interrupted while writing it), "
+            f"restore it from a backup before resuming"
+        )
+
+    damaged = f"{archive}{DAMAGED_ARCHIVE_SUFFIX}"
+    log.warning(f"'{archive}' is damaged, moved to '{damaged}' and extracted again")
+    os.replace(archive, damaged)
+    if checkpoint:
+        checkpoint.reset()
+
+
+def run_job(
+    api,
+    job,
+    checkpoint=None,
+    resume=False,
+    progress_callback=None,
+    confirm_append=None,
+    cancel_token=None,
+    window_callback=None,
+    report=None,
+):
+    """Copy tag attributes and then the data period of a job into its archive
+
+    :param api: Data agent API
+    :param job: Job description (see `create_job`)
+    :param checkpoint: Checkpoint recording stored units
+    :param resume: Resume an interrupted job - append to the archive and skip completed units
+        (an update job continues from the timestamps stored in the archive)
+    :param progress_callback: Called with (tag, completed tags counter)
+    :param confirm_append: Called with GroupAlreadyExists error, returns True to append
+        to the existing groups. If not provided - the error is raised.
+    :param cancel_token: CancellationToken to pause or cancel the job, a cancelled job
+        raises ExtractionCancelled after closing the archive (it can be resumed later)
+    :param window_callback: Called with (tag, rows, bytes) for every time window read
+    :param report: JobReport collecting the job statistics (the caller finishes and
+        saves it)
+    :return: Units that failed all read attempts (see `ExtractionEngine.copy_period`),
+        the checkpoint of the job can be resumed to read them again
+    """
+    engine = ExtractionEngine(api, max_readers=job["max_readers"])
+    archive_type = job.get("archive_type", DEFAULT_ARCHIVE_TYPE)
+
+    if resume:
+        _check_resumed_archive(job, archive_type, checkpoint)
+
+    with ArchiveWriter(
+        archive_type,
+        job["dest_conn"],
+        max_pending=job["max_readers"] * WRITER_QUEUE_DEPTH_PER_READER,
+        **{ARCHIVE_FORMATS[archive_type]["path_param"]: job["archive"]},
+    ) as writer:
+        if report:
+            report.attach_writer(writer)
+
+        last_stored = {}
+        if job.get("update"):
+            if job["dest_group"]:
+                last = writer.last_timestamps([job["dest_group"]])
+                if job["dest_group"] in last:
+                    last_stored = {tag: last[job["dest_group"]] for tag in job["tags"]}
+            else:
+                last_stored = writer.last_timestamps(job["tags"])
+
+        # Attributes are queued ahead of any data unit, so a resumed job with completed
+        # units already has them stored. Updated tags have them stored as well.
+        new_tags = [tag for tag in job["tags"] if tag not in last_stored]
+        if new_tags and not (resume and checkpoint and checkpoint.completed_units):
+            engine.copy_attributes(
+                src_conn=job["src_conn"],
+                tags=new_tags,
+                writer=writer,
+                dest_group=job["dest_group"],
+            )
+
+        if job["attributes_only"]:
+            return []
+
+        if cancel_token:
+            cancel_token.check()
+
+        def copy_period(on_conflict):
+            return engine.copy_period(
+                src_conn=job["src_conn"],
+                tags=job["tags"],
+                writer=writer,
+                dest_group=job["dest_group"],
+                first_timestamp=job["first_timestamp"],
+                last_timestamp=job["last_timestamp"],
+                time_frequency=job["time_frequency"],
+                on_conflict=on_conflict,
+                progress_callback=progress_callback,
+                window=job["window"],
+                checkpoint=checkpoint,
+                last_stored=last_stored,
+                cancel_token=cancel_token,
+                window_callback=window_callback,
+                report=report,
+            )
+
+        if resume or job.get("update"):
+            return copy_period(on_conflict="append")
+
+        try:
+            return copy_period(on_conflict="ask")
+
+        except GroupAlreadyExists as e:
+            if confirm_append is None:
+                raise
+
+            if confirm_append(e):
+                return copy_period(on_conflict="append")
+
+            return []
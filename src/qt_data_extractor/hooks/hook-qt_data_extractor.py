@@ -3,3 +3,8 @@
 from PyInstaller.utils.hooks import copy_metadata
 
 datas = copy_metadata("qt-data-extractor")
+# Archive connectors are imported on first use (extraction.ARCHIVE_CONNECTORS)
+hiddenimports = [
+    "qt_data_extractor.connectors.zip_stream",
+    "qt_data_extractor.connectors.parquet",
+]
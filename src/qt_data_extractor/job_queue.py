@@ -0,0 +1,242 @@
+"""
+Queue of extraction jobs.
+
+Queued jobs start in priority order (then in submission order) as soon as they get a
+slot: at most MAX_RUNNING_JOBS jobs run at a time, and at most the job slots of a source
+connection read from it. Jobs reading from different historians run in parallel, while
+a single historian is not flooded - the requests of concurrent jobs of a connection are
+capped together by its connection limiter (see `extraction.connection_limiter`). Jobs
+writing the same archive (i.e. updates of it) run one after the other.
+
+The queue only schedules, running the started jobs is up to the caller (the main window
+runs them on a thread pool). Jobs the caller runs right away (i.e. interactive extractions)
+are registered with `start`, so queued jobs wait for their slot and archive as well.
+"""
+
+import itertools
+import threading
+import time
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = [COMPLETED, FAILED, CANCELLED]
+
+MAX_RUNNING_JOBS = 4
+DEFAULT_CONNECTION_JOB_SLOTS = 1
+# Jobs running at the same time against a single source connection, by connection type
+CONNECTION_JOB_SLOTS = {
+    "osisoft-pi": 2,
+    "aspen-ip21": 1,
+}
+
+_job_ids = itertools.count(1)
+
+
+class QueuedJob:
+    """
+    Extraction job waiting in (or started from) a JobQueue.
+
+    :param job: Job description (see `extraction.create_job`)
+    :param priority: Higher priority jobs start first
+    :param conn_type: Type of the source connection, selects its job slots
+    """
+
+    def __init__(self, job, priority=0, conn_type=None):
+        self.id = next(_job_ids)
+        self.job = job
+        self.priority = priority
+        self.conn_type = conn_type
+        self.state = QUEUED
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        # Extracted tags, updated while the job runs
+        self.completed_tags = 0
+        self.failures = []
+        self.error = None
+
+    @property
+    def conn_name(self):
+        return self.job["src_conn"]
+
+    @property
+    def archive(self):
+        return self.job.get("archive")
+
+    @property
+    def tags_count(self):
+        return len(self.job["tags"])
+
+    @property
+    def is_finished(self):
+        return self.state in FINISHED_STATES
+
+    def __repr__(self):
+        return f"QueuedJob({self.id}, {self.conn_name}, {self.state})"
+
+
+class JobQueue:
+    """
+    Schedules queued jobs over the connection job slots.
+
+    :param max_running: Max number of jobs running at a time
+    :param connection_slots: Job slots by connection type (see CONNECTION_JOB_SLOTS)
+    """
+
+    def __init__(self, max_running=MAX_RUNNING_JOBS, connection_slots=None):
+        self._max_running = max(1, max_running)
+        self._type_slots = (
+            CONNECTION_JOB_SLOTS if connection_slots is None else connection_slots
+        )
+        # Slots set for single connections, by connection name
+        self._slots = {}
+        self._jobs = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._jobs)
+
+    @property
+    def jobs(self):
+        """All jobs - running, then queued in start order, then finished"""
+        with self._lock:
+            return sorted(self._jobs, key=self._order)
+
+    @property
+    def pending(self):
+        """Number of jobs queued or running"""
+        with self._lock:
+            return sum(1 for j in self._jobs if not j.is_finished)
+
+    def add(self, job, priority=0, conn_type=None):
+        """Queue a job, call `start_ready` to start it if possible
+
+        :return: QueuedJob
+        """
+        queued = QueuedJob(job, priority=priority, conn_type=conn_type)
+        with self._lock:
+            self._jobs.append(queued)
+        return queued
+
+    def start(self, job, conn_type=None):
+        """Register a job the caller runs right away, without waiting for a slot
+
+        The job takes a slot of its connection (even beyond its job slots) until it
+        finishes, so queued jobs of the connection wait for it.
+
+        :return: Running QueuedJob - the caller runs it and calls `finish`
+        :raises ValueError: A running job writes the archive of the job
+        """
+        queued = QueuedJob(job, conn_type=conn_type)
+        with self._lock:
+            if any(
+                j.state == RUNNING and j.archive == queued.archive for j in self._jobs
+            ):
+                raise ValueError(
+                    f"{queued.archive} is written by a running job, queue the job to run "
+                    f"it once that one finishes"
+                )
+
+            queued.state = RUNNING
+            queued.started = time.time()
+            self._jobs.append(queued)
+        return queued
+
+    def remove(self, queued):
+        """Drop a job that is not running"""
+        with self._lock:
+            if queued.state == RUNNING:
+                raise ValueError("A running job cannot be removed, cancel it first")
+            self._jobs.remove(queued)
+
+    def clear_finished(self):
+        with self._lock:
+            self._jobs = [j for j in self._jobs if not j.is_finished]
+
+    def set_priority(self, queued, priority):
+        with self._lock:
+            queued.priority = priority
+
+    def cancel(self, queued):
+        """Cancel a job that has not started, returns False if it is running or finished"""
+        with self._lock:
+            if queued.state != QUEUED:
+                return False
+
+            self._finish(queued, CANCELLED)
+            return True
+
+    def connection_slots(self, conn_name, conn_type=None):
+        """Number of jobs that may run at the same time against a connection"""
+        return self._slots.get(
+            conn_name, self._type_slots.get(conn_type, DEFAULT_CONNECTION_JOB_SLOTS)
+        )
+
+    def set_connection_slots(self, conn_name, slots):
+        with self._lock:
+            self._slots[conn_name] = max(1, slots)
+
+    def start_ready(self):
+        """Mark the jobs that can start now as running, in start order
+
+        :return: List of started QueuedJob - the caller runs them and calls `finish`
+        """
+        with self._lock:
+            running = [j for j in self._jobs if j.state == RUNNING]
+            per_connection = {}
+            for j in running:
+                per_connection[j.conn_name] = per_connection.get(j.conn_name, 0) + 1
+            archives = {j.archive for j in running}
+
+            started = []
+            for queued in sorted(self._jobs, key=self._order):
+                if len(running) + len(started) >= self._max_running:
+                    break
+
+                if queued.state != QUEUED:
+                    continue
+
+                slots = self.connection_slots(queued.conn_name, queued.conn_type)
+                if per_connection.get(queued.conn_name, 0) >= slots:
+                    # Waits for a job of its connection, jobs of other connections go on
+                    continue
+
+                if queued.archive in archives:
+                    # Waits for the job writing its archive
+                    continue
+
+                queued.state = RUNNING
+                queued.started = time.time()
+                per_connection[queued.conn_name] = (
+                    per_connection.get(queued.conn_name, 0) + 1
+                )
+                archives.add(queued.archive)
+                started.append(queued)
+
+            return started
+
+    def finish(self, queued, state, failures=None, error=None):
+        """Record the outcome of a running job (one of FINISHED_STATES)"""
+        with self._lock:
+            queued.failures = failures or []
+            queued.error = error
+            self._finish(queued, state)
+
+    @staticmethod
+    def _finish(queued, state):
+        if state not in FINISHED_STATES:
+            raise ValueError(f"Not a finished state: {state}")
+
+        queued.state = state
+        queued.finished = time.time()
+
+    @staticmethod
+    def _order(queued):
+        if queued.state == RUNNING:
+            return 0, queued.started, queued.id
+        if queued.state == QUEUED:
+            return 1, -queued.priority, queued.id
+        return 2, queued.finished, queued.id
@@ -1,13 +1,11 @@
+import functools
 import logging
 import os
-import sys
 from collections import OrderedDict
-from datetime import datetime
+from datetime import timedelta
 
-import pandas as pd
-from data_agent.exceptions import GroupAlreadyExists, TargetConnectionError
+from data_agent.exceptions import TargetConnectionError
 from PySide6 import QtCore, QtGui, QtWidgets
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (  # QToolTip,
     QDialog,
     QDialogButtonBox,
@@ -15,25 +13,97 @@ from PySide6.QtWidgets import (  # QToolTip,
     QMessageBox,
     QPushButton,
     QTableWidgetItem,
-    QTreeWidgetItem,
 )
 
 from qt_data_extractor import __version__
+from qt_data_extractor.cancellation import ExtractionCancelled
+from qt_data_extractor.checkpoint import CHECKPOINT_FILE_EXTENSION, Checkpoint
 from qt_data_extractor.design.create_connection import CreateConnectionDialog
-from qt_data_extractor.design.pandas_model import DataTableDialog
+from qt_data_extractor.design.forms import (
+    CopyProgressForm,
+    CopyPromptForm,
+    MainWindowForm,
+    ManageConnectionsForm,
+)
+from qt_data_extractor.design.job_queue import JobQueueDialog
+from qt_data_extractor.design.tag_list_import import TagListImportDialog
+from qt_data_extractor.design.tags_tree_model import (
+    TAG_ATTRIBUTES_ROLE,
+    TAG_NAME_ROLE,
+    SelectedTagsModel,
+    TagsTreeModel,
+)
+from qt_data_extractor.extraction import (
+    ARCHIVE_FORMATS,
+    DEFAULT_ARCHIVE_TYPE,
+    DEFAULT_MAX_READERS,
+    checkpoint_path,
+    create_job,
+    job_file_path,
+    output_file_path,
+    run_job,
+)
+from qt_data_extractor.job_queue import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    MAX_RUNNING_JOBS,
+    JobQueue,
+)
+from qt_data_extractor.profiling import OperationProfiler, profiling_requested
+from qt_data_extractor.progress import ProgressThrottle, format_duration
+from qt_data_extractor.report import REPORT_FILE_EXTENSION, JobReport
+from qt_data_extractor.selected_tags import SelectedTags
+from qt_data_extractor.tag_catalog import TagCatalog, user_data_dir
+from qt_data_extractor.tag_import import (
+    TAG_LIST_FILE_FILTER,
+    TagList,
+    open_tag_list,
+    parse_text,
+)
+from qt_data_extractor.tag_resolution import TagResolver
+from qt_data_extractor.tag_search import TagSearchIndex
 from qt_data_extractor.worker_thread import Worker
 
 log = logging.getLogger(__name__)
 
 WINDOW_DEFAULT_TITLE = "Imubit Data Extractor"
-SHORT_VERSION = f'{__version__.split(".")[0]}.{__version__.split(".")[1]}'
-MAX_TAGS_TO_LOAD = 100
-MAX_PREVIEW_SAMPLES = 500
+# Safety limit of tags listed by a single historian query (the tree fetches rows lazily)
+MAX_TAGS_TO_LOAD = 100000
+# Tags of a list filter (i.e. tags file) queried per historian call and calls running at
+# the same time, the tree is populated batch by batch
+TAGS_LIST_BATCH_SIZE = 500
+TAGS_LIST_CONCURRENCY = 4
+# Tag names listed in the missing and ambiguous tags warning
+MAX_RESOLUTION_MESSAGE_LENGTH = 2000
+# Preview table cells are formatted lazily, so previews are not limited to a screenful
+MAX_PREVIEW_SAMPLES = 100000
+# Extraction progress reports per second and lines kept in the progress dialog log
+PROGRESS_INTERVAL_SECONDS = 0.1
+MAX_EXTRACTION_LOG_LINES = 5000
+# Memory budget of preview reads kept for repeated previews and zooming
+PREVIEW_CACHE_MEGABYTES = 256
 ENABLE_EDITING_CONFIG_BEFORE_EXTRACTION = False
 TAGS_FILTER_DEFAULT_PLACEHOLDER = "Search tags by filter..."
-WILDCARD_CHARACTERS = ["*", "%", "?"]
-
-bundle_dir = getattr(sys, "_MEIPASS", os.path.abspath(os.path.dirname(__file__)))
+# Full tag catalog of a connection is loaded in background for searching as you type
+ENABLE_LOCAL_TAG_SEARCH = True
+TAG_CATALOG_FILTER = "*"
+TAG_SEARCH_DELAY_MS = 150
+# Extraction time windows - data is read and archived one window at a time
+EXTRACTION_TIME_WINDOWS = OrderedDict(
+    [
+        ("Whole period", None),
+        ("1 hour", timedelta(hours=1)),
+        ("1 day", timedelta(days=1)),
+        ("7 days", timedelta(days=7)),
+        ("30 days", timedelta(days=30)),
+    ]
+)
+DEFAULT_EXTRACTION_TIME_WINDOW = "7 days"
+# Result of the copy prompt when the job is queued instead of run right away
+COPY_PROMPT_QUEUE = 2
+# Suffix of tag browsing profiles, saved next to the extraction outputs
+BROWSE_PROFILE_SUFFIX = "-browse"
 
 
 class NoDelayHintProxyStyle(QtWidgets.QProxyStyle):
@@ -49,38 +119,22 @@ class NoDelayHintProxyStyle(QtWidgets.QProxyStyle):
 
 class MainWindow(QtCore.QObject):
     def __init__(self, api):
-        loader = QUiLoader()
-
         self._api = api
+        try:
+            self._tag_catalog = TagCatalog(api)
+        except Exception as e:
+            log.warning(f"Tag catalog cache not available, using memory: {e}")
+            self._tag_catalog = TagCatalog(api, path=":memory:")
+        # Created by the first preview, it brings pandas and the charts in
+        self._preview_cache = None
         self._existing_connections = []
-        self._registered_connectors = self._api.list_supported_connectors()
-        self._registered_connectors = {
-            k: self._registered_connectors[k]
-            for k in self._registered_connectors
-            if self._registered_connectors[k]["category"] == "historian"
-        }
-        self._w = loader.load(
-            os.path.abspath(os.path.join(bundle_dir, "design/main-window.ui")), None
-        )
-        self._dialogCopyPrompt = loader.load(
-            os.path.abspath(os.path.join(bundle_dir, "design/copy-prompt.ui")),
-            parentWidget=self._w,
-        )
-        self._dialogCopyPrompt.setWindowTitle(WINDOW_DEFAULT_TITLE)
-        self._dialogCopyProgress = loader.load(
-            os.path.abspath(os.path.join(bundle_dir, "design/copy-progress.ui")),
-            parentWidget=self._w,
-        )
-        self._dialogCopyProgress.setWindowTitle(WINDOW_DEFAULT_TITLE)
-        self._dialogCreateConnection = CreateConnectionDialog(
-            connectors=self._registered_connectors
-        )
-        self._dialogCreateConnection.setWindowTitle(WINDOW_DEFAULT_TITLE)
-        self._dialogManageConnections = loader.load(
-            os.path.abspath(os.path.join(bundle_dir, "design/manage-connections.ui")),
-            parentWidget=self._w,
-        )
-        self._dialogManageConnections.setWindowTitle(WINDOW_DEFAULT_TITLE)
+        self._search_indexes = {}
+        # Id of the latest tags query, results of older queries are dropped
+        self._tags_request = 0
+        self._tags_loading = False
+        self._w = MainWindowForm()
+        # Worker of the running interactive extraction, controlled by the progress dialog
+        self._extraction_worker = None
 
         self._w.comboSampleRate.setToolTip(
             """
@@ -96,7 +150,115 @@ class MainWindow(QtCore.QObject):
 
         self._w.comboSampleRate.setStyle(NoDelayHintProxyStyle())
 
+        self._tags_model = TagsTreeModel(children_loader=self._load_tag_children)
+        self._w.treeLeftTagHierarchy.setModel(self._tags_model)
+
+        self._selected_tags = SelectedTags()
+        self._selected_tags_model = SelectedTagsModel(self._selected_tags)
+        self._w.treeSelectedTags.setModel(self._selected_tags_model)
+        self._tags_model.set_marked(self._selected_tags)
+        self._selected_tags.subscribe(self._on_selected_tags_store_change)
+
         self.threadpool = QtCore.QThreadPool()
+        self._workers = set()
+        # Queued extraction jobs run on their own pool, tag browsing is not held up
+        self._job_queue = JobQueue()
+        self._jobs_threadpool = QtCore.QThreadPool()
+        self._jobs_threadpool.setMaxThreadCount(MAX_RUNNING_JOBS)
+        # Workers of the running queued jobs, by job id
+        self._job_workers = {}
+
+        self._search_timer = QtCore.QTimer()
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(TAG_SEARCH_DELAY_MS)
+
+        # Every operation is profiled, otherwise the next one if toggled from the menu
+        self._profile_all_operations = profiling_requested()
+
+    # Dialogs are created on first use, not to slow the startup down
+
+    @functools.cached_property
+    def _registered_connectors(self):
+        connectors = self._api.list_supported_connectors()
+        return {
+            k: connectors[k]
+            for k in connectors
+            if connectors[k]["category"] == "historian"
+        }
+
+    @functools.cached_property
+    def _dialogCopyPrompt(self):
+        dialog = CopyPromptForm(parent=self._w)
+        dialog.setWindowTitle(WINDOW_DEFAULT_TITLE)
+        dialog.spinReaders.setValue(DEFAULT_MAX_READERS)
+        for window_name, window in EXTRACTION_TIME_WINDOWS.items():
+            dialog.comboTimeWindow.addItem(window_name, window)
+        dialog.comboTimeWindow.setCurrentText(DEFAULT_EXTRACTION_TIME_WINDOW)
+        for archive_type, archive_format in ARCHIVE_FORMATS.items():
+            dialog.comboArchiveFormat.addItem(archive_format["name"], archive_type)
+        queue_button = dialog.buttonBox.addButton(
+            "Add to &Queue", QDialogButtonBox.ActionRole
+        )
+        queue_button.clicked.connect(lambda: dialog.done(COPY_PROMPT_QUEUE))
+        return dialog
+
+    @functools.cached_property
+    def _dialogCopyProgress(self):
+        dialog = CopyProgressForm(parent=self._w)
+        dialog.setWindowTitle(WINDOW_DEFAULT_TITLE)
+        dialog.textExtractionLog.document().setMaximumBlockCount(
+            MAX_EXTRACTION_LOG_LINES
+        )
+        dialog.buttonBox.rejected.connect(self.on_cancel_extraction)
+        return dialog
+
+    @functools.cached_property
+    def _buttonPauseExtraction(self):
+        button = self._dialogCopyProgress.buttonBox.addButton(
+            "Pause", QDialogButtonBox.ActionRole
+        )
+        button.setCheckable(True)
+        button.setVisible(False)
+        button.toggled.connect(self.on_pause_extraction)
+        return button
+
+    @functools.cached_property
+    def _dialogCreateConnection(self):
+        dialog = CreateConnectionDialog(connectors=self._registered_connectors)
+        dialog.setWindowTitle(WINDOW_DEFAULT_TITLE)
+        return dialog
+
+    @functools.cached_property
+    def _dialogJobQueue(self):
+        dialog = JobQueueDialog(self._job_queue, parent=self._w)
+        dialog.setWindowTitle(f"{WINDOW_DEFAULT_TITLE} - Job Queue")
+        dialog.scheduling_changed.connect(self._start_queued_jobs)
+        dialog.cancel_requested.connect(self.on_cancel_queued_job)
+        return dialog
+
+    @functools.cached_property
+    def _dialogManageConnections(self):
+        dialog = ManageConnectionsForm(parent=self._w)
+        dialog.setWindowTitle(WINDOW_DEFAULT_TITLE)
+        return dialog
+
+    def _operation_profiler(self, path, title):
+        """OperationProfiler of an operation if profiling is on, None otherwise"""
+        if not self._profile_all_operations:
+            if not self._w.actionProfileNextOperation.isChecked():
+                return None
+
+            self._w.actionProfileNextOperation.setChecked(False)
+
+        return OperationProfiler(path, title=title)
+
+    def _browse_profiler(self, title):
+        directory = self._w.comboArchiveDirectory.currentText()
+        if not os.path.isdir(directory):
+            directory = user_data_dir()
+        return self._operation_profiler(
+            f"{output_file_path(directory)}{BROWSE_PROFILE_SUFFIX}", title
+        )
 
     def _show_msg_box(self, msg, icon=QMessageBox.Icon.Information):
         mb = QMessageBox(self._w)
@@ -110,10 +272,14 @@ class MainWindow(QtCore.QObject):
         return f"{conn_name} ({conn_type})"
 
     def _get_selected_tags(self):
-        return [
-            self._w.treeSelectedTags.topLevelItem(i).data(0, QtCore.Qt.UserRole)
-            for i in range(0, self._w.treeSelectedTags.topLevelItemCount())
-        ]
+        return self._selected_tags.names
+
+    def _get_right_selected_tags(self):
+        """Tags selected in the selected tags view (name -> attributes)"""
+        return {
+            index.data(TAG_NAME_ROLE): index.data(TAG_ATTRIBUTES_ROLE)
+            for index in self._w.treeSelectedTags.selectionModel().selectedRows()
+        }
 
     @property
     def _current_connection(self):
@@ -170,6 +336,7 @@ class MainWindow(QtCore.QObject):
 
         try:
             self._api.create_connection(**args)
+            self._invalidate_caches(args["conn_name"])
             self._refresh_connections()
             self._w.comboLeftConnection.setCurrentText(
                 self._connection_title(args["conn_name"], args["conn_type"])
@@ -223,6 +390,7 @@ class MainWindow(QtCore.QObject):
                     == QMessageBox.StandardButton.Yes
                 ):
                     self._api.delete_connection(conn_name)
+                    self._invalidate_caches(conn_name)
                     self._dialogManageConnections.tableConnections.removeRow(
                         self._dialogManageConnections.tableConnections.currentRow()
                     )
@@ -239,51 +407,97 @@ class MainWindow(QtCore.QObject):
         if len(self._existing_connections) > 0:
             self._dialogManageConnections.buttonBox.removeButton(delete_button)
 
+    def _invalidate_caches(self, conn_name):
+        self._tag_catalog.invalidate(conn_name)
+        if self._preview_cache is not None:
+            self._preview_cache.invalidate(conn_name)
+
     @QtCore.Slot()
     def on_view_tags(self, left=True):
+        from qt_data_extractor.design.pandas_model import DataTableDialog
+        from qt_data_extractor.design.plot_preview import TimeSeriesChartView
+        from qt_data_extractor.preview_cache import PreviewCache
+
         source_conn = self._w.comboLeftConnection.currentData()
 
-        items = (
-            self._w.treeLeftTagHierarchy.selectedItems()
-            if left
-            else self._w.treeSelectedTags.selectedItems()
+        source_tags = (
+            self._get_tree_selected_tags() if left else self._get_right_selected_tags()
         )
 
-        # for i in items:
-        #     print(i.data(0, QtCore.Qt.UserRole), ':::', i.parent().data(0, QtCore.Qt.UserRole))
-
-        source_tags = {
-            i.data(0, QtCore.Qt.UserRole): i.data(1, QtCore.Qt.UserRole) for i in items
-        }
-
         if not source_tags:
             self._show_msg_box("No tags selected!")
             return
 
-        try:
-            df = self._api.read_tag_values_period(
+        if self._preview_cache is None:
+            self._preview_cache = PreviewCache(
+                self._api, max_megabytes=PREVIEW_CACHE_MEGABYTES
+            )
+
+        first_timestamp = self._w.dateTimeLeftFrom.dateTime().toPython()
+        last_timestamp = self._w.dateTimeLeftTo.dateTime().toPython()
+        time_frequency = self._w.comboSampleRate.currentText()
+
+        def read_plot_values(first, last, time_frequency, max_results):
+            return self._preview_cache.read_tag_values_period(
                 conn_name=source_conn["name"],
                 tags=list(source_tags.keys()),
-                first_timestamp=self._w.dateTimeLeftFrom.dateTime().toPython(),
-                last_timestamp=self._w.dateTimeLeftTo.dateTime().toPython(),
-                time_frequency=self._w.comboSampleRate.currentText(),
+                first_timestamp=first,
+                last_timestamp=last,
+                time_frequency=time_frequency,
+                max_results=max_results,
+            )
+
+        def read_preview(progress_callback, cancel_token):
+            return self._preview_cache.read_tag_values_period(
+                conn_name=source_conn["name"],
+                tags=list(source_tags.keys()),
+                first_timestamp=first_timestamp,
+                last_timestamp=last_timestamp,
+                time_frequency=time_frequency,
                 max_results=MAX_PREVIEW_SAMPLES,
             )
 
+        def show_preview(df):
             if len(df) == 0:
                 self._show_msg_box("No data available in the selected period!")
                 return
 
-            dlg = DataTableDialog(df, parent=self._w)
-            dlg.show()
-
-        except Exception as e:
-            QMessageBox.critical(self._w, self._w.windowTitle(), str(e))
+            try:
+                chart = TimeSeriesChartView(
+                    read_plot_values,
+                    first_timestamp,
+                    last_timestamp,
+                    time_frequency=time_frequency,
+                    threadpool=self.threadpool,
+                )
+                dlg = DataTableDialog(df, parent=self._w, chart=chart)
+                dlg.show()
+                # Resolution of the plot follows the chart width, known once shown
+                chart.load()
+
+            except Exception as e:
+                QMessageBox.critical(self._w, self._w.windowTitle(), str(e))
+
+        def failed(error):
+            QMessageBox.critical(self._w, self._w.windowTitle(), str(error[1]))
+
+        def set_view_enabled(enabled):
+            self._w.buttonLeftView.setEnabled(enabled)
+            self._w.buttonRightView.setEnabled(enabled)
+
+        # Large previews take a while to read, the window stays responsive meanwhile
+        set_view_enabled(False)
+        worker = Worker(read_preview)
+        worker.profiler = self._browse_profiler(f"Previewing {len(source_tags)} tags")
+        worker.signals.result.connect(show_preview)
+        worker.signals.error.connect(failed)
+        worker.signals.finished.connect(lambda: set_view_enabled(True))
+        self._start_worker(worker)
 
     @QtCore.Slot()
     def on_selected_tags_change(self):
-        selected_items = len(self._w.treeSelectedTags.selectedItems())
-        total_items = self._w.treeSelectedTags.topLevelItemCount()
+        selected_items = len(self._w.treeSelectedTags.selectionModel().selectedRows())
+        total_items = len(self._selected_tags)
         self._w.labelRightPanelStatus.setText(
             f"{selected_items} / {total_items} tags"
             if selected_items > 0
@@ -292,43 +506,25 @@ class MainWindow(QtCore.QObject):
 
     @QtCore.Slot()
     def on_add_selected_tags(self):
-        source_items = self._w.treeLeftTagHierarchy.selectedItems()
-
-        source_tags = {
-            i.data(0, QtCore.Qt.UserRole): i.data(1, QtCore.Qt.UserRole)
-            for i in source_items
-        }
+        source_tags = self._get_tree_selected_tags()
         if not source_tags:
             return
 
-        for i, tag_name in enumerate(source_tags):
-            if tag_name in self._get_selected_tags():
-                continue
-
-            row = [source_tags[tag_name]["Name"]]
-
-            item = QTreeWidgetItem(row)
-            item.setData(0, QtCore.Qt.UserRole, (tag_name))
-            item.setData(1, QtCore.Qt.UserRole, (source_tags[tag_name]))
-
-            self._w.treeSelectedTags.addTopLevelItem(item)
-
-        self._mark_selected_tags()
-
-        self.on_selected_tags_change()
+        self._selected_tags.add(source_tags)
 
     @QtCore.Slot()
     def on_remove_selected_tags(self, all):
         if all:
-            self._w.treeSelectedTags.clear()
-            self._mark_selected_tags()
+            self._selected_tags.clear()
             return
 
-        root = self._w.treeSelectedTags.invisibleRootItem()
-        for item in self._w.treeSelectedTags.selectedItems():
-            (item.parent() or root).removeChild(item)
+        self._selected_tags.remove(self._get_right_selected_tags())
 
-        self._mark_selected_tags()
+    def _on_selected_tags_store_change(self, added, removed):
+        # Only rows of the changed tags are re-rendered in the tag browser
+        self._tags_model.update_marked(added)
+        self._tags_model.update_marked(removed)
+        self.on_selected_tags_change()
 
     @QtCore.Slot()
     def on_copy_tags(self):
@@ -343,19 +539,8 @@ class MainWindow(QtCore.QObject):
             self._show_msg_box("Archive directory not selected!")
             return
 
-        now = datetime.now()
-
         dest_conn_name = self._dialogCopyPrompt.comboCopyTarget.currentText()
 
-        filename = (
-            f'extractor-output-v{SHORT_VERSION}-{now.strftime("%Y-%m-%dT%H-%M-%S")}'
-        )
-
-        file_path = os.path.join(
-            self._w.comboArchiveDirectory.currentText(),
-            filename,
-        )
-
         self._dialogCopyPrompt.labelCopyDescription.setText(
             f"Extract {len(source_tags)} tags to"
         )
@@ -369,6 +554,9 @@ class MainWindow(QtCore.QObject):
         self._dialogCopyPrompt.comboSampleRate.setCurrentIndex(
             self._w.comboSampleRate.currentIndex()
         )
+        self._dialogCopyPrompt.comboArchiveFormat.setCurrentIndex(
+            self._w.comboArchiveFormat.currentIndex()
+        )
         self._dialogCopyPrompt.checkboxAttributesOnly.stateChanged.connect(
             lambda state: self._dialogCopyPrompt.groupboxDataSettings.setEnabled(
                 state == 0
@@ -381,139 +569,297 @@ class MainWindow(QtCore.QObject):
         if not ENABLE_EDITING_CONFIG_BEFORE_EXTRACTION:
             # Put everything in readonly mode
             self._dialogCopyPrompt.comboCopyTarget.setEnabled(False)
+            self._dialogCopyPrompt.comboArchiveFormat.setEnabled(False)
             self._dialogCopyPrompt.groupboxDataSettings.setEnabled(False)
             self._dialogCopyPrompt.checkboxAttributesOnly.setEnabled(False)
 
         do_copy_prompt = self._dialogCopyPrompt.exec_()
-        if do_copy_prompt != 1:
+        if do_copy_prompt not in [QDialog.Accepted, COPY_PROMPT_QUEUE]:
+            return
+
+        update_archive = None
+        if self._dialogCopyPrompt.checkboxUpdateArchive.isChecked():
+            update_archive, _ = QFileDialog.getOpenFileName(
+                parent=self._w,
+                caption="Select Archive to Update",
+                dir=self._w.comboArchiveDirectory.currentText() or ".",
+                filter=" ".join(f'*{f["extension"]}' for f in ARCHIVE_FORMATS.values()),
+            )
+            if not update_archive:
+                return
+
+        try:
+            job = create_job(
+                src_conn=source_conn["name"],
+                tags=source_tags,
+                directory=self._w.comboArchiveDirectory.currentText(),
+                first_timestamp=self._dialogCopyPrompt.dateTimeFrom.dateTime().toPython(),
+                last_timestamp=self._dialogCopyPrompt.dateTimeTo.dateTime().toPython(),
+                time_frequency=self._dialogCopyPrompt.comboSampleRate.currentText(),
+                window=self._dialogCopyPrompt.comboTimeWindow.currentData(),
+                attributes_only=self._dialogCopyPrompt.checkboxAttributesOnly.isChecked(),
+                max_readers=self._dialogCopyPrompt.spinReaders.value(),
+                dest_conn=dest_conn_name,
+                archive_type=self._dialogCopyPrompt.comboArchiveFormat.currentData(),
+                update_archive=update_archive,
+            )
+        except ValueError as e:
+            QMessageBox.critical(self._w, self._w.windowTitle(), str(e))
+            return
+
+        if do_copy_prompt == COPY_PROMPT_QUEUE:
+            self._queue_extraction(job, conn_type=source_conn["type"])
+        else:
+            self._run_extraction(job, conn_type=source_conn["type"])
+
+    @QtCore.Slot()
+    def on_resume_extraction(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            parent=self._w,
+            caption="Select Extraction Checkpoint",
+            dir=self._w.comboArchiveDirectory.currentText() or ".",
+            filter=f"*{CHECKPOINT_FILE_EXTENSION}",
+        )
+        if not filename:
             return
 
         try:
-            dest_group = ""
-            copy_from_timestamp = (
-                self._dialogCopyPrompt.dateTimeFrom.dateTime().toPython()
+            checkpoint = Checkpoint.load(filename)
+            job = checkpoint.job
+
+            if not self._api.is_connected(job["src_conn"]):
+                self._api.enable_connection(job["src_conn"])
+
+        except Exception as e:
+            QMessageBox.critical(self._w, self._w.windowTitle(), str(e))
+            return
+
+        if (
+            QMessageBox.question(
+                self._w,
+                self._w.windowTitle(),
+                f'Resume extraction of {len(job["tags"])} tags from [{job["src_conn"]}] '
+                f"into {os.path.basename(job['archive'])}? "
+                f"({checkpoint.completed_units} parts already extracted)",
+                QMessageBox.Yes | QMessageBox.No,
+            )
+            != QMessageBox.StandardButton.Yes
+        ):
+            return
+
+        conn_type = next(
+            (
+                c["type"]
+                for c in self._existing_connections
+                if c["name"] == job["src_conn"]
+            ),
+            None,
+        )
+        self._run_extraction(job, checkpoint=checkpoint, conn_type=conn_type)
+
+    def _run_extraction(self, job, checkpoint=None, conn_type=None):
+        """Run extraction job on the thread pool, with the progress dialog
+
+        The job is registered as running in the job queue, queued jobs of its connection
+        and archive wait for it.
+
+        :param job: Job description, stored in the checkpoint manifest
+        :param checkpoint: Checkpoint of an interrupted job to resume, None - start a new job
+        :param conn_type: Type of the source connection
+        """
+        if self._extraction_worker is not None:
+            # The progress dialog controls a single extraction
+            self._show_msg_box(
+                "An extraction is already running, add the job to the queue instead.",
+                icon=QMessageBox.Icon.Warning,
             )
-            copy_to_timestamp = self._dialogCopyPrompt.dateTimeTo.dateTime().toPython()
-            attributes_only = self._dialogCopyPrompt.checkboxAttributesOnly.isChecked()
+            return
+
+        resume = checkpoint is not None
+        source_tags = job["tags"]
+        report = JobReport(job)
+        queued = None
+
+        try:
+            queued = self._job_queue.start(job, conn_type=conn_type)
+            if "_dialogJobQueue" in self.__dict__:
+                self._dialogJobQueue.refresh()
+
+            if not resume and not job["attributes_only"]:
+                checkpoint = Checkpoint.create(checkpoint_path(job), job)
 
             self._dialogCopyProgress.buttonBox.button(QDialogButtonBox.Cancel).setText(
                 "Cancel"
             )
             self._dialogCopyProgress.buttonBox.button(
                 QDialogButtonBox.Cancel
-            ).setEnabled(False)
+            ).setEnabled(True)
+            self._buttonPauseExtraction.setChecked(False)
+            self._buttonPauseExtraction.setText("Pause")
+            self._buttonPauseExtraction.setVisible(True)
             self._dialogCopyProgress.textExtractionLog.clear()
-            self._dialogCopyProgress.labelCopy.setText("Extraction in progress...")
-            self._dialogCopyProgress.labelFrom.setText(f'From: [{source_conn["name"]}]')
-            self._dialogCopyProgress.labelTo.setText(f"To: [{filename}.zip]")
+            # Full log goes to a file next to the archive, the view keeps the last lines
+            log_file = open(job_file_path(job, ".log"), "a")
+
+            def log_message(text):
+                self._dialogCopyProgress.textExtractionLog.append(text)
+                log_file.write(text + "\n")
+
+            self._dialogCopyProgress.labelCopy.setText(
+                "Resuming extraction..." if resume else "Extraction in progress..."
+            )
+            self._dialogCopyProgress.labelFrom.setText(f'From: [{job["src_conn"]}]')
+            self._dialogCopyProgress.labelTo.setText(
+                f'To: [{os.path.basename(job["archive"])}]'
+            )
             self._dialogCopyProgress.labelTotalCopied.setText(f"0 / {len(source_tags)}")
             self._dialogCopyProgress.progressBar.setRange(0, len(source_tags))
             self._dialogCopyProgress.progressBar.setValue(0)
 
             self._dialogCopyProgress.show()
 
-            # Functions executed from worker thread
-            def update_progress(tag, counter):
-                log.info(f"Extracting tag ({counter}) - {tag}")
-                self._dialogCopyProgress.textExtractionLog.append(
-                    f"Extracting tag {counter}: {tag}"
-                )
-                self._dialogCopyProgress.progressBar.setValue(counter - 1)
-                self._dialogCopyProgress.labelFrom.setText(
-                    f'From: [{source_conn["name"]}] {tag} ...'
+            log_message(
+                f'Initialiizing data extraction from [{job["src_conn"]}] '
+                f'using {job["max_readers"]} readers...'
+            )
+            if resume:
+                log_message(
+                    f"Resuming from {checkpoint.path}, "
+                    f"{checkpoint.completed_units} parts already extracted..."
                 )
+            log_message(
+                f'Updating {job["archive"]} archive with new data...'
+                if job.get("update")
+                else f'Opening {job["archive"]} archive...'
+            )
+
+            # Progress is aggregated in the worker and reported a few times per second
+            def update_progress(counter, progress):
+                queued.completed_tags = counter
+                if "_dialogJobQueue" in self.__dict__:
+                    self._dialogJobQueue.update_job(queued)
+                if progress["tags"]:
+                    log.info(f"Extracted {counter} tags - {progress['tags'][-1]}")
+                    log_message(
+                        "\n".join(
+                            f"Extracted tag {counter - len(progress['tags']) + i}: {tag}"
+                            for i, tag in enumerate(progress["tags"], 1)
+                        )
+                    )
+                    self._dialogCopyProgress.labelFrom.setText(
+                        f'From: [{job["src_conn"]}] {progress["tags"][-1]} ...'
+                    )
+                self._dialogCopyProgress.progressBar.setValue(counter)
                 self._dialogCopyProgress.labelTotalCopied.setText(
-                    f"{counter} / {len(source_tags)}"
+                    f"{counter} / {len(source_tags)} tags - "
+                    f'{progress["rows_per_second"]:,.0f} rows/s, '
+                    f'{progress["bytes_per_second"] / 2**20:,.1f} MB/s, '
+                    f'ETA {format_duration(progress["eta"])}'
                 )
 
-            def copy_process_run(progress_callback):
-                self._dialogCopyProgress.textExtractionLog.append(
-                    f'Initialiizing data extraction from [{source_conn["name"]}]...'
-                )
-                self._dialogCopyProgress.textExtractionLog.append(
-                    f"Opening {file_path}.zip archive..."
-                )
-                dest_conn = self._api.create_connection(
-                    conn_name=dest_conn_name,
-                    conn_type="zip",
-                    enabled=True,
-                    ignore_existing=True,
-                    zipfile_path=f"{file_path}.zip",
+            # Executed from worker thread
+            def confirm_append(e):
+                return (
+                    QMessageBox.question(
+                        self._w,
+                        self._w.windowTitle(),
+                        f"{e} \n Would you like to proceed and append to existing data?",
+                        QMessageBox.Yes | QMessageBox.No,
+                    )
+                    == QMessageBox.StandardButton.Yes
                 )
 
-                self._api.copy_attributes(
-                    src_conn=source_conn["name"],
-                    tags=source_tags,
-                    dest_conn=dest_conn["name"],
-                    dest_group=dest_group,
-                )
+            worker = self._extraction_worker_for(
+                job, checkpoint, resume, report, confirm_append=confirm_append
+            )
+
+            def complete_success(failures):
+                report.finish("completed", failures=failures)
+                queued.completed_tags = queued.tags_count
+                self._job_queue.finish(queued, COMPLETED, failures=failures)
+                self._dialogCopyProgress.progressBar.setValue(len(source_tags))
 
-                if not attributes_only:
-                    try:
-                        self._api.copy_period(
-                            src_conn=source_conn["name"],
-                            tags=source_tags,
-                            dest_conn=dest_conn["name"],
-                            dest_group=dest_group,
-                            first_timestamp=copy_from_timestamp,
-                            last_timestamp=copy_to_timestamp,
-                            time_frequency=self._dialogCopyPrompt.comboSampleRate.currentText(),
-                            on_conflict="ask",
-                            # progress_callback=lambda tag, counter: update_progress(tag, counter))
-                            progress_callback=lambda tag, counter: progress_callback.emit(
-                                tag, counter
-                            ),
+                if failures:
+                    self._dialogCopyProgress.labelCopy.setText(
+                        f"Extraction Completed, {len(failures)} tags failed!"
+                    )
+                    log_message(
+                        f"Extraction finished, failed reading {len(failures)} tags:"
+                    )
+                    for failure in failures:
+                        log_message(
+                            f'{failure["tag"]} from {failure["start"]} '
+                            f'({failure["attempts"]} attempts, '
+                            f'{failure["skipped"]} following windows skipped): '
+                            f'{failure["error"]}'
+                        )
+                    if checkpoint:
+                        log_message(
+                            f"Use 'Resume Extraction...' with {checkpoint.path} "
+                            f"to extract the failed parts again."
+                        )
+                    if not resume:
+                        failed = {failure["tag"] for failure in failures}
+                        self._selected_tags.remove(
+                            [tag for tag in source_tags if tag not in failed]
                         )
+                    return
+
+                if checkpoint:
+                    checkpoint.remove()
 
-                    except GroupAlreadyExists as e:
-                        if (
-                            QMessageBox.question(
-                                self._w,
-                                self._w.windowTitle(),
-                                f"{e} \n Would you like to proceed and append to existing data?",
-                                QMessageBox.Yes | QMessageBox.No,
-                            )
-                            == QMessageBox.StandardButton.Yes
-                        ):
-                            self._api.copy_period(
-                                src_conn=source_conn["name"],
-                                tags=source_tags,
-                                dest_conn=dest_conn["name"],
-                                dest_group=dest_group,
-                                first_timestamp=copy_from_timestamp,
-                                last_timestamp=copy_to_timestamp,
-                                time_frequency=self._dialogCopyPrompt.comboSampleRate.currentText(),
-                                on_conflict="append",
-                                # progress_callback=lambda tag, counter: update_progress(tag, counter))
-                                progress_callback=lambda tag, counter: progress_callback.emit(
-                                    tag, counter
-                                ),
-                            )
-
-            def complete_success(result):
-                self._dialogCopyProgress.progressBar.setValue(len(source_tags))
                 self._dialogCopyProgress.labelCopy.setText("Extraction Completed!")
-                self._dialogCopyProgress.textExtractionLog.append(
-                    "Extraction finished successfuly!"
-                )
-                self.on_remove_selected_tags(all=True)
+                log_message("Extraction finished successfuly!")
+                if not resume:
+                    self.on_remove_selected_tags(all=True)
 
             def complete_error(result):
-                self._dialogCopyProgress.labelCopy.setText("Extraction Failed!")
-                self._dialogCopyProgress.textExtractionLog.append(
-                    "Extraction Failed!\n\r"
+                cancelled = issubclass(result[0], ExtractionCancelled)
+                report.finish("cancelled" if cancelled else "failed", error=result[1])
+                self._job_queue.finish(
+                    queued, CANCELLED if cancelled else FAILED, error=result[1]
                 )
-                self._dialogCopyProgress.textExtractionLog.append(str(result[0]))
-                self._dialogCopyProgress.textExtractionLog.append(str(result[1]))
-                self._dialogCopyProgress.textExtractionLog.append(str(result[2]))
+                if cancelled:
+                    self._dialogCopyProgress.labelCopy.setText("Extraction Cancelled!")
+                    log_message(
+                        "Extraction cancelled, the archive contains the data extracted "
+                        "so far."
+                    )
+                    if checkpoint:
+                        log_message(
+                            f"Use 'Resume Extraction...' with {checkpoint.path} "
+                            f"to continue the extraction."
+                        )
+                    return
+
+                self._dialogCopyProgress.labelCopy.setText("Extraction Failed!")
+                log_message("Extraction Failed!\n\r")
+                log_message(str(result[0]))
+                log_message(str(result[1]))
+                log_message(str(result[2]))
+                if checkpoint:
+                    log_message(
+                        f"Use 'Resume Extraction...' with {checkpoint.path} "
+                        f"to continue where the extraction stopped."
+                    )
 
             def worker_complete():
-                self._api.delete_connection(dest_conn_name)
+                self._extraction_worker = None
+                self._job_workers.pop(queued.id, None)
+                if checkpoint:
+                    checkpoint.close()
 
-                with open(f"{file_path}.log", "w") as writer:
-                    writer.write(
-                        self._dialogCopyProgress.textExtractionLog.toPlainText()
-                    )
+                try:
+                    report_path = job_file_path(job, REPORT_FILE_EXTENSION)
+                    report.write_json(report_path)
+                    log_message(f"Extraction report saved to {report_path}")
+                except OSError as e:
+                    log_message(f"Failed saving the extraction report: {e}")
+
+                if worker.profiler:
+                    log_message(f"Profile saved to {worker.profiler.summary_path}")
+
+                log_file.close()
 
                 self._dialogCopyProgress.labelFrom.setText("")
                 self._dialogCopyProgress.labelTo.setText("")
@@ -523,179 +869,533 @@ class MainWindow(QtCore.QObject):
                 self._dialogCopyProgress.buttonBox.button(
                     QDialogButtonBox.Cancel
                 ).setEnabled(True)
+                self._buttonPauseExtraction.setVisible(False)
+                # Frees the slot of the job for the queued ones
+                self._start_queued_jobs()
 
-            worker = Worker(copy_process_run)
-            worker.signals.progress.connect(update_progress)
+            worker.profiler = self._operation_profiler(
+                job_file_path(job, ""), title=f"Extraction of {len(source_tags)} tags"
+            )
+            worker.signals.progress.connect(update_progress, QtCore.Qt.QueuedConnection)
             worker.signals.result.connect(complete_success)
             worker.signals.error.connect(complete_error)
             worker.signals.finished.connect(worker_complete)
 
-            self.threadpool.start(worker)
+            self._extraction_worker = worker
+            self._job_workers[queued.id] = worker
+            self._start_worker(worker)
 
         except Exception as e:
+            if queued is not None:
+                self._job_queue.finish(queued, FAILED, error=e)
+                self._start_queued_jobs()
             QMessageBox.critical(self._w, self._w.windowTitle(), str(e))
 
-    def _mark_selected_tags(self):
-        selected_tags = self._get_selected_tags()
+    def _extraction_worker_for(
+        self, job, checkpoint, resume, report, confirm_append=None
+    ):
+        """Worker running an extraction job, reports progress a few times per second
+
+        Progress is aggregated by the readers and polled by a timer as well, so it keeps
+        coming while the readers wait for the historian. Snapshots are emitted from both
+        threads, connect to the progress signal with a queued connection to get them in
+        order.
+        """
+
+        def copy_process_run(progress_callback, cancel_token):
+            try:
+                return run_job(
+                    self._api,
+                    job,
+                    checkpoint=checkpoint,
+                    resume=resume,
+                    progress_callback=progress.tag_completed,
+                    confirm_append=confirm_append,
+                    cancel_token=cancel_token,
+                    window_callback=progress.window_read,
+                    report=report,
+                )
+            finally:
+                progress.flush()
+
+        worker = Worker(copy_process_run)
+        progress = ProgressThrottle(
+            len(job["tags"]),
+            lambda snapshot: worker.signals.progress.emit(
+                snapshot["completed"], snapshot
+            ),
+            interval=PROGRESS_INTERVAL_SECONDS,
+        )
+
+        timer = QtCore.QTimer(self._w)
+        timer.setInterval(int(PROGRESS_INTERVAL_SECONDS * 1000))
+        timer.timeout.connect(progress.poll)
+        worker.signals.finished.connect(timer.stop)
+        worker.signals.finished.connect(timer.deleteLater)
+        timer.start()
+
+        return worker
+
+    def _queue_extraction(self, job, conn_type=None):
+        """Queue an extraction job, it starts once its source connection has a free slot"""
+        self._job_queue.add(job, conn_type=conn_type)
+        self._dialogJobQueue.refresh()
+        self.on_show_job_queue()
+        self._start_queued_jobs()
+
+    @QtCore.Slot()
+    def _start_queued_jobs(self):
+        for queued in self._job_queue.start_ready():
+            self._run_queued_job(queued)
+
+        if "_dialogJobQueue" in self.__dict__:
+            self._dialogJobQueue.refresh()
 
-        font_deselected = QtGui.QFont()
-        font_deselected.setBold(False)
+    def _run_queued_job(self, queued):
+        """Run a job started by the job queue, its log goes to a file next to the archive"""
+        job = queued.job
+        report = JobReport(job)
+        checkpoint = None
 
-        font_selected = QtGui.QFont()
-        font_selected.setBold(True)
+        try:
+            if not job["attributes_only"]:
+                checkpoint = Checkpoint.create(checkpoint_path(job), job)
+            log_file = open(job_file_path(job, ".log"), "a")
+        except Exception as e:
+            if checkpoint:
+                checkpoint.close()
+            self._job_queue.finish(queued, FAILED, error=e)
+            QtCore.QTimer.singleShot(0, self._start_queued_jobs)
+            return
 
-        for i in range(0, self._w.treeLeftTagHierarchy.topLevelItemCount()):
-            item = self._w.treeLeftTagHierarchy.topLevelItem(i)
+        def log_message(text):
+            log_file.write(text + "\n")
 
-            tag_name = item.data(0, QtCore.Qt.UserRole)
-            for i in range(item.columnCount()):
-                item.setFont(
-                    i, font_selected if tag_name in selected_tags else font_deselected
+        log_message(
+            f'Queued job {queued.id} - extraction of {len(job["tags"])} tags from '
+            f'[{job["src_conn"]}] into {job["archive"]} using {job["max_readers"]} readers...'
+        )
+
+        def update_progress(counter, progress):
+            queued.completed_tags = counter
+            if progress["tags"]:
+                log_message(
+                    "\n".join(
+                        f"Extracted tag {counter - len(progress['tags']) + i}: {tag}"
+                        for i, tag in enumerate(progress["tags"], 1)
+                    )
                 )
+            self._dialogJobQueue.update_job(queued)
+
+        def complete_success(failures):
+            report.finish("completed", failures=failures)
+            queued.completed_tags = queued.tags_count
+            self._job_queue.finish(queued, COMPLETED, failures=failures)
+
+            if failures:
+                log_message(
+                    f"Extraction finished, failed reading {len(failures)} tags:"
+                )
+                for failure in failures:
+                    log_message(
+                        f'{failure["tag"]} from {failure["start"]}: {failure["error"]}'
+                    )
+                if checkpoint:
+                    log_message(
+                        f"Use 'Resume Extraction...' with {checkpoint.path} "
+                        f"to extract the failed parts again."
+                    )
+                return
+
+            if checkpoint:
+                checkpoint.remove()
+            log_message("Extraction finished successfuly!")
+
+        def complete_error(result):
+            cancelled = issubclass(result[0], ExtractionCancelled)
+            report.finish("cancelled" if cancelled else "failed", error=result[1])
+            self._job_queue.finish(
+                queued, CANCELLED if cancelled else FAILED, error=result[1]
+            )
+            log_message(
+                "Extraction cancelled, the archive contains the data extracted so far."
+                if cancelled
+                else f"Extraction Failed!\n{result[2]}"
+            )
+            if checkpoint:
+                log_message(
+                    f"Use 'Resume Extraction...' with {checkpoint.path} "
+                    f"to continue the extraction."
+                )
+
+        def worker_complete():
+            self._job_workers.pop(queued.id, None)
+            if checkpoint:
+                checkpoint.close()
+
+            try:
+                report_path = job_file_path(job, REPORT_FILE_EXTENSION)
+                report.write_json(report_path)
+                log_message(f"Extraction report saved to {report_path}")
+            except OSError as e:
+                log_message(f"Failed saving the extraction report: {e}")
+
+            log_file.close()
+            # Frees the slot of the job for the next one
+            self._start_queued_jobs()
+
+        worker = self._extraction_worker_for(job, checkpoint, False, report)
+        worker.profiler = self._operation_profiler(
+            job_file_path(job, ""),
+            title=f"Queued extraction of {len(job['tags'])} tags",
+        )
+        worker.signals.progress.connect(update_progress, QtCore.Qt.QueuedConnection)
+        worker.signals.result.connect(complete_success)
+        worker.signals.error.connect(complete_error)
+        worker.signals.finished.connect(worker_complete)
+
+        self._job_workers[queued.id] = worker
+        self._start_worker(worker, threadpool=self._jobs_threadpool)
+
+    @QtCore.Slot()
+    def on_show_job_queue(self):
+        self._dialogJobQueue.show()
+        self._dialogJobQueue.raise_()
+
+    @QtCore.Slot(object)
+    def on_cancel_queued_job(self, queued):
+        worker = self._job_workers.get(queued.id)
+        if worker is not None:
+            worker.cancel()
+
+    @QtCore.Slot()
+    def on_cancel_extraction(self):
+        """Cancel button of the progress dialog - stops a running extraction, closes otherwise"""
+        if self._extraction_worker is None:
+            self._dialogCopyProgress.reject()
+            return
+
+        self._extraction_worker.cancel()
+        self._dialogCopyProgress.labelCopy.setText("Cancelling extraction...")
+        self._dialogCopyProgress.textExtractionLog.append(
+            "Cancelling, waiting for running requests to complete..."
+        )
+        self._dialogCopyProgress.buttonBox.button(QDialogButtonBox.Cancel).setEnabled(
+            False
+        )
+        self._buttonPauseExtraction.setVisible(False)
+
+    @QtCore.Slot(bool)
+    def on_pause_extraction(self, paused):
+        if self._extraction_worker is None:
+            return
+
+        if paused:
+            self._extraction_worker.pause()
+            self._dialogCopyProgress.labelCopy.setText("Extraction paused")
+            self._buttonPauseExtraction.setText("Resume")
+        else:
+            self._extraction_worker.resume()
+            self._dialogCopyProgress.labelCopy.setText("Extraction in progress...")
+            self._buttonPauseExtraction.setText("Pause")
+
+    def _get_tree_selected_tags(self):
+        """Tags selected in the tag browser (name -> attributes)"""
+        return dict(
+            self._tags_model.tag(index)
+            for index in self._w.treeLeftTagHierarchy.selectionModel().selectedRows()
+        )
 
     # Dynamic tree expansion
-    @QtCore.Slot(QTreeWidgetItem)
-    def on_tree_expanded(self, clicked_item):
+    def _load_tag_children(self, parent, tag_name):
         conn_name = self._current_connection["name"]
-        display_attributes = OrderedDict(self._current_connection["default_attributes"])
-
-        tag = clicked_item.data(1, QtCore.Qt.UserRole)
-        if tag["HasChildren"]:
-            # Reload children
-            for i in reversed(range(clicked_item.childCount())):
-                clicked_item.removeChild(clicked_item.child(i))
 
-            children = self._api.list_tags(
+        def list_children(progress_callback, cancel_token):
+            return self._tag_catalog.list_tags(
                 conn_name,
-                filter=tag["Name"],
+                filter=tag_name,
                 include_attributes=True,
                 max_results=MAX_TAGS_TO_LOAD,
             )
 
-            for i, child_name in enumerate(children):
-                row = [
-                    str(children[child_name][key])
-                    if key in children[child_name]
-                    else ""
-                    for j, key in enumerate(display_attributes.keys())
-                ]
+        def failed(error):
+            self._tags_model.add_children(parent, {})
+            QMessageBox.critical(self._w, self._w.windowTitle(), str(error[1]))
 
-                child_item = QTreeWidgetItem(row)
-                child_item.setData(0, QtCore.Qt.UserRole, (child_name))
-                child_item.setData(1, QtCore.Qt.UserRole, (children[child_name]))
-
-                clicked_item.addChild(child_item)
+        worker = Worker(list_children)
+        worker.profiler = self._browse_profiler(f"Listing children of {tag_name}")
+        worker.signals.result.connect(
+            lambda children: self._tags_model.add_children(parent, children)
+        )
+        worker.signals.error.connect(failed)
+        self._start_worker(worker)
 
     @QtCore.Slot()
     def on_tree_selection_changed(self):
-        total_items = self._w.treeLeftTagHierarchy.topLevelItemCount()
-        selected_items = len(self._w.treeLeftTagHierarchy.selectedItems())
-        too_many_tags_msg = (
-            " (Too Many Tags to Display - Narrow Your Search)"
-            if total_items >= MAX_TAGS_TO_LOAD
-            else ""
+        total_items = self._tags_model.total_count
+        selected_items = len(
+            self._w.treeLeftTagHierarchy.selectionModel().selectedRows()
         )
+        if self._tags_loading:
+            status_msg = " (Loading...)"
+        elif total_items >= MAX_TAGS_TO_LOAD:
+            status_msg = " (Too Many Tags to Display - Narrow Your Search)"
+        else:
+            status_msg = ""
         self._w.labelLeftPanelStatus.setText(
-            f"{selected_items} / {total_items} tags {too_many_tags_msg}"
+            f"{selected_items} / {total_items} tags {status_msg}"
             if selected_items > 0
-            else f"{total_items} tags {too_many_tags_msg}"
+            else f"{total_items} tags {status_msg}"
         )
 
     @QtCore.Slot()
-    def on_refresh_tags_tree(self, filter, max_results=MAX_TAGS_TO_LOAD):
-        try:
-            conn_name = self._current_connection["name"]
-            display_attributes = OrderedDict(
-                self._current_connection["default_attributes"]
-            )
+    def on_refresh_tags_tree(self, filter, max_results=None):
+        if not isinstance(self._current_connection, dict):
+            return
 
-            # Prepare headers
-            self._w.treeLeftTagHierarchy.clear()
-            self._w.treeLeftTagHierarchy.setColumnCount(len(display_attributes))
-            self._w.treeLeftTagHierarchy.setHeaderLabels(
-                [a["Name"] for a in display_attributes.values()]
-            )
+        # Supersedes a query still running
+        self._tags_request += 1
+        request = self._tags_request
+        self._tags_loading = False
 
-            # Update items
-            tags = self._api.list_tags(
-                conn_name,
-                filter=filter,
-                include_attributes=list(display_attributes.keys()),
-                max_results=max_results,
-            )
+        conn_name = self._current_connection["name"]
+        display_attributes = OrderedDict(self._current_connection["default_attributes"])
 
-            # Update top level rows
-            for i, tag_name in enumerate(tags):
-                row = [
-                    str(tags[tag_name][key]) if key in tags[tag_name] else ""
-                    for j, key in enumerate(display_attributes.keys())
-                ]
+        search_index = self._search_indexes.get(conn_name)
+        if isinstance(filter, str) and search_index:
+            # Resolved locally from the tag catalog, the tree fetches rows as needed
+            index, catalog = search_index
+            names = index.search(filter, max_results=max_results or 0)
+            self._populate_tags_tree(catalog, names)
+            self.on_tree_selection_changed()
+            return
 
-                item = QTreeWidgetItem(row)
-                item.setData(0, QtCore.Qt.UserRole, (tag_name))
-                item.setData(1, QtCore.Qt.UserRole, (tags[tag_name]))
+        if max_results is None:
+            max_results = MAX_TAGS_TO_LOAD
+        streamed = not isinstance(filter, str)
+
+        def list_tags(progress_callback, cancel_token):
+            include_attributes = list(display_attributes.keys())
+            if not streamed:
+                return self._tag_catalog.list_tags(
+                    conn_name,
+                    filter=filter,
+                    include_attributes=include_attributes,
+                    max_results=max_results,
+                )
 
-                if tags[tag_name]["HasChildren"]:
-                    item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            resolver = TagResolver(
+                functools.partial(
+                    self._tag_catalog.list_tags,
+                    conn_name,
+                    include_attributes=include_attributes,
+                    max_results=max_results,
+                ),
+                batch_size=TAGS_LIST_BATCH_SIZE,
+                concurrency=TAGS_LIST_CONCURRENCY,
+            )
+            return resolver.resolve(
+                names=filter if isinstance(filter, list) else None,
+                # Batches are queried while the rest of the list is being read
+                batches=filter.batches(TAGS_LIST_BATCH_SIZE, read_ahead=True)
+                if isinstance(filter, TagList)
+                else None,
+                on_batch=lambda found: progress_callback.emit(request, found),
+                # Cancelled by a newer query
+                cancelled=lambda: request != self._tags_request,
+            )
+
+        def batch_listed(batch_request, found):
+            if batch_request == self._tags_request:
+                self._tags_model.append_tags(found)
+                self.on_tree_selection_changed()
 
-                self._w.treeLeftTagHierarchy.addTopLevelItem(item)
+        def listed(result):
+            if request != self._tags_request:
+                return
 
-            self._mark_selected_tags()
+            self._tags_loading = False
+            if not streamed:
+                self._populate_tags_tree(result)
+                self.on_tree_selection_changed()
+                return
 
-            # If filter is a list of tags - we need to show which tags were not found
-            if isinstance(filter, list):
-                lower_exist = [s.lower() for s in tags.keys()]
+            self._sort_tags_tree()
+            self.on_tree_selection_changed()
 
-                missing_tags = [
-                    s
-                    for s in filter
-                    if not any(c in s for c in WILDCARD_CHARACTERS)
-                    and s.lower() not in lower_exist
-                ]
+            # Filter is a list of tags - show which tags were not found
+            messages = []
+            if result.missing:
+                messages.append(
+                    f"Cannot find {len(result.missing)} tag(s): "
+                    f"{', '.join(result.missing)}"[:MAX_RESOLUTION_MESSAGE_LENGTH]
+                )
+            if result.ambiguous:
+                messages.append(
+                    f"{len(result.ambiguous)} tag(s) match several tags differing in case: "
+                    f"{', '.join(result.ambiguous)}"[:MAX_RESOLUTION_MESSAGE_LENGTH]
+                )
+            if messages:
+                self._show_msg_box("\n\n".join(messages), icon=QMessageBox.Icon.Warning)
 
-                if missing_tags:
-                    self._show_msg_box(
-                        f"Cannot find {len(missing_tags)} tag(s): {', '.join(missing_tags)}"[
-                            :2000
-                        ],
-                        icon=QMessageBox.Icon.Warning,
-                    )
+        def failed(error):
+            if request != self._tags_request:
+                return
 
+            self._tags_loading = False
             self.on_tree_selection_changed()
 
-        except Exception as e:
             mb = QMessageBox(self._w)
             # mb.setIcon(QMessageBox.Icon.Error)
             mb.setWindowTitle(self._w.windowTitle())
-            mb.setText(f"Error retrieving tags: {str(e)}")
+            mb.setText(f"Error retrieving tags: {str(error[1])}")
             mb.exec_()
 
+        self._populate_tags_tree({})
+        self._tags_loading = True
+        self.on_tree_selection_changed()
+
+        worker = Worker(list_tags)
+        if isinstance(filter, TagList):
+            title = f"Listing tags of {filter.source}"
+        elif isinstance(filter, list):
+            title = f"Listing {len(filter)} tags"
+        else:
+            title = f"Listing tags '{filter}'"
+        worker.profiler = self._browse_profiler(title)
+        worker.signals.progress.connect(batch_listed)
+        worker.signals.result.connect(listed)
+        worker.signals.error.connect(failed)
+        self._start_worker(worker)
+
+    def _populate_tags_tree(self, tags, names=None):
+        display_attributes = OrderedDict(self._current_connection["default_attributes"])
+
+        self._tags_model.set_tags(
+            tags,
+            names,
+            columns=[(key, a["Name"]) for key, a in display_attributes.items()],
+        )
+        self._sort_tags_tree()
+
+    def _sort_tags_tree(self):
+        tree = self._w.treeLeftTagHierarchy
+        if tree.isSortingEnabled():
+            header = tree.header()
+            self._tags_model.sort(
+                header.sortIndicatorSection(), header.sortIndicatorOrder()
+            )
+
+    @QtCore.Slot()
+    def on_search_tags(self):
+        """Search as you type - only when the tag catalog is loaded"""
+        if not isinstance(self._current_connection, dict):
+            return
+
+        filter = self._w.comboLeftTagFilter.currentText().strip()
+        if filter == TAGS_FILTER_DEFAULT_PLACEHOLDER:
+            return
+
+        if self._current_connection["name"] in self._search_indexes:
+            self.on_refresh_tags_tree(filter)
+
+    def _load_search_index(self, conn):
+        """Load full tag catalog of a connection in background and index it"""
+        if not ENABLE_LOCAL_TAG_SEARCH or conn["name"] in self._search_indexes:
+            return
+
+        display_attributes = OrderedDict(conn["default_attributes"])
+
+        def load_catalog(progress_callback, cancel_token):
+            catalog = self._tag_catalog.list_tags(
+                conn["name"],
+                filter=TAG_CATALOG_FILTER,
+                include_attributes=list(display_attributes.keys()),
+                max_results=0,
+            )
+            return TagSearchIndex(catalog), catalog
+
+        def loaded(result):
+            self._search_indexes[conn["name"]] = result
+            log.info(f"Tag catalog of {conn['name']} loaded - {len(result[0])} tags")
+
+        def failed(error):
+            log.warning(f"Tag catalog of {conn['name']} not loaded: {error[1]}")
+
+        worker = Worker(load_catalog)
+        worker.signals.result.connect(loaded)
+        worker.signals.error.connect(failed)
+        self._start_worker(worker)
+
+    def _start_worker(self, worker, threadpool=None):
+        # Keep the worker (and its signals) alive until queued signals are delivered
+        self._workers.add(worker)
+        worker.signals.finished.connect(lambda: self._workers.discard(worker))
+        (threadpool or self.threadpool).start(worker)
+
+    @QtCore.Slot()
+    def on_refresh_tag_catalog(self):
+        if not isinstance(self._current_connection, dict):
+            return
+
+        self._tag_catalog.invalidate(self._current_connection["name"])
+        self._search_indexes.pop(self._current_connection["name"], None)
+        self._load_search_index(self._current_connection)
+        self.on_refresh_tags_tree(self._w.comboLeftTagFilter.currentText())
+
     @QtCore.Slot(str)
     def on_tags_file_select(self):
         filename, filter = QFileDialog.getOpenFileName(
             parent=self._w,
             caption="Select Tags File",
             dir=".",
-            # filter='*.xls, *.xlsx, *.xlsm, *.xlsb, *.odf, *.ods, *.odt')
-            filter="*.xlsx",
+            filter=TAG_LIST_FILE_FILTER,
         )
         if not filename:
             return
 
         try:
-            df = pd.read_excel(filename, header=None)
-            df = df.dropna()
-            tags_to_find = df.iloc[:, 0].tolist()
-
-            self.on_refresh_tags_tree(filter=tags_to_find, max_results=0)
-            self._w.comboLeftTagFilter.clear()
+            dialog = TagListImportDialog(path=filename, parent=self._w)
+            dialog.setWindowTitle(WINDOW_DEFAULT_TITLE)
+            if dialog.exec_() != QDialog.Accepted:
+                return
 
+            tag_list = open_tag_list(filename, **dialog.values)
         except Exception as e:
-            mb = QMessageBox(self._w)
-            # mb.setIcon(QMessageBox.Icon.Error)
-            mb.setWindowTitle(self._w.windowTitle())
-            mb.setText(f"Error reading excel file: {str(e)}")
-            mb.exec_()
+            self._show_msg_box(
+                f"Error reading tags file: {e}", icon=QMessageBox.Icon.Critical
+            )
+            return
+
+        self._import_tag_list(tag_list)
+
+    @QtCore.Slot()
+    def on_paste_tags(self):
+        text = QtWidgets.QApplication.clipboard().text()
+        if not text.strip():
+            self._show_msg_box("No tags in the clipboard!")
+            return
+
+        dialog = TagListImportDialog(text=text, parent=self._w)
+        dialog.setWindowTitle(WINDOW_DEFAULT_TITLE)
+        if dialog.exec_() != QDialog.Accepted:
+            return
+
+        values = dialog.values
+        self._import_tag_list(
+            TagList(
+                parse_text(text),
+                column=values["column"],
+                skip_rows=values["skip_rows"],
+                source="clipboard",
+            )
+        )
+
+    def _import_tag_list(self, tag_list):
+        """Show the tags of a list, they are resolved while the list is being read"""
+        self._w.comboLeftTagFilter.clear()
+        self._search_timer.stop()
+        self.on_refresh_tags_tree(filter=tag_list, max_results=0)
 
     def _refresh_connections(self):
         """ """
@@ -755,7 +1455,10 @@ class MainWindow(QtCore.QObject):
     def _refresh_current_connection_view(self, current_conn, conn_info=None):
         self._w.buttonLeftConnect.hide()
         self._w.labelLeftConnectionDetails.setText("")
-        self._w.treeLeftTagHierarchy.clear()
+        # Drop results of queries still running for the previous connection
+        self._tags_request += 1
+        self._tags_loading = False
+        self._tags_model.clear()
         self._w.labelLeftPanelStatus.clear()
 
         if not current_conn:
@@ -776,6 +1479,7 @@ class MainWindow(QtCore.QObject):
 
         if "name" in current_conn["supported_filters"]:
             self._w.comboLeftTagFilter.show()
+            self._load_search_index(current_conn)
         else:
             self._w.comboLeftTagFilter.hide()
 
@@ -816,18 +1520,27 @@ class MainWindow(QtCore.QObject):
         # Menu Bar
         self._w.actionAddNewConnection.triggered.connect(self.on_create_new_connection)
         self._w.actionManageConnections.triggered.connect(self.on_manage_connections)
+        self._w.actionResumeExtraction.triggered.connect(self.on_resume_extraction)
+        self._w.actionJobQueue.triggered.connect(self.on_show_job_queue)
+        self._w.actionRefreshTagCatalog.triggered.connect(self.on_refresh_tag_catalog)
+        if self._profile_all_operations:
+            # Profiling of every operation is set by the environment
+            self._w.actionProfileNextOperation.setChecked(True)
+            self._w.actionProfileNextOperation.setEnabled(False)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._tag_catalog.close)
 
         # Display
 
         self._w.comboLeftTagFilter.textActivated.connect(self.on_refresh_tags_tree)
+        self._w.comboLeftTagFilter.editTextChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self.on_search_tags)
         self._w.comboLeftTagFilter.installEventFilter(self._filterWidgetEventInspector)
 
-        self._w.treeLeftTagHierarchy.itemExpanded.connect(self.on_tree_expanded)
-        self._w.treeLeftTagHierarchy.itemSelectionChanged.connect(
+        self._w.treeLeftTagHierarchy.selectionModel().selectionChanged.connect(
             self.on_tree_selection_changed
         )
 
-        self._w.treeSelectedTags.itemSelectionChanged.connect(
+        self._w.treeSelectedTags.selectionModel().selectionChanged.connect(
             self.on_selected_tags_change
         )
 
@@ -838,6 +1551,8 @@ class MainWindow(QtCore.QObject):
         self._w.buttonRightView.clicked.connect(lambda: self.on_view_tags(left=False))
 
         self._w.buttonLeftTagsFileSelect.clicked.connect(self.on_tags_file_select)
+        self._w.actionImportTagsList.triggered.connect(self.on_tags_file_select)
+        self._w.actionPasteTagsList.triggered.connect(self.on_paste_tags)
 
         self._w.buttonAddSelectedTags.clicked.connect(self.on_add_selected_tags)
 
@@ -873,6 +1588,12 @@ class MainWindow(QtCore.QObject):
             self._w.comboArchiveDirectory.addItem(conn["name"])
         self._w.buttonSelectArchiveFile.clicked.connect(on_directory_select)
 
+        for archive_type, archive_format in ARCHIVE_FORMATS.items():
+            self._w.comboArchiveFormat.addItem(archive_format["name"], archive_type)
+        self._w.comboArchiveFormat.setCurrentIndex(
+            self._w.comboArchiveFormat.findData(DEFAULT_ARCHIVE_TYPE)
+        )
+
         # Refresh
         # shortcutRefresh = QtGui.QShortcut(QtGui.QKeySequence('Ctrl+r'), self._w)
         # shortcutRefresh.activated.connect(QtWidgets.QApplication.instance().quit)
@@ -0,0 +1,178 @@
+"""
+In-memory cache of tag value previews.
+
+Previewing the same tags again (or zooming into a previewed period) is served from
+memory. Values are cached per connection, tag and sample rate along with the time range
+they cover: a range inside a cached one is sliced out of it, a partially overlapping
+range reads only the missing part from the historian. Least recently used entries are
+evicted to keep the cache within a megabyte budget.
+
+Cached ranges are tz-aware UTC, requested bounds without a time zone are local time and
+a naive index of the returned values is UTC (see `qt_data_extractor.timestamps`).
+"""
+
+import threading
+from collections import OrderedDict, defaultdict
+
+import pandas as pd
+
+from qt_data_extractor.timestamps import to_local_naive, to_utc
+
+DEFAULT_PREVIEW_CACHE_MB = 256
+
+
+def _utc(ts, naive_utc=False):
+    return pd.Timestamp(to_utc(pd.Timestamp(ts), naive_utc=naive_utc))
+
+
+def _index_bound(ts, index):
+    """UTC timestamp comparable with `index`"""
+    if getattr(index, "tz", None) is None:
+        return ts.tz_localize(None)
+
+    return ts.tz_convert(index.tz)
+
+
+class _Entry:
+    __slots__ = ("first", "last", "values", "size")
+
+    def __init__(self, first, last, values):
+        self.first = first
+        self.last = last
+        self.values = values
+        self.size = int(values.memory_usage(deep=True))
+
+    def slice(self, first, last):
+        index = self.values.index
+        first = _index_bound(max(first, self.first), index)
+        last = _index_bound(min(last, self.last), index)
+        return self.values.loc[first:last]
+
+
+class PreviewCache:
+    """
+    Caching front of `api.read_tag_values_period`.
+
+    :param api: Data agent API
+    :param max_megabytes: Memory budget of the cached values
+    """
+
+    def __init__(self, api, max_megabytes=DEFAULT_PREVIEW_CACHE_MB):
+        self._api = api
+        self._max_bytes = int(max_megabytes * 1024 * 1024)
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self):
+        """Bytes used by the cached values"""
+        return self._size
+
+    def read_tag_values_period(
+        self,
+        conn_name,
+        tags,
+        first_timestamp,
+        last_timestamp,
+        time_frequency=None,
+        max_results=None,
+    ):
+        """Same as `api.read_tag_values_period`, served from the cache when possible"""
+        first, last = _utc(first_timestamp), _utc(last_timestamp)
+
+        # Tags missing the same ranges are read together
+        entries = {}
+        missing = defaultdict(list)
+        with self._lock:
+            for tag in tags:
+                entry = self._entries.get((conn_name, tag, time_frequency))
+                if entry is not None:
+                    self._entries.move_to_end((conn_name, tag, time_frequency))
+                    entries[tag] = entry
+                missing[self._missing(entry, first, last, max_results)].append(tag)
+
+        for ranges, group in missing.items():
+            for start, end in ranges:
+                df = self._api.read_tag_values_period(
+                    conn_name=conn_name,
+                    tags=group,
+                    first_timestamp=to_local_naive(start),
+                    last_timestamp=to_local_naive(end),
+                    time_frequency=time_frequency,
+                    max_results=max_results,
+                )
+                entries.update(
+                    self._store(
+                        conn_name, group, time_frequency, start, end, df, max_results
+                    )
+                )
+
+        df = pd.concat([entries[tag].slice(first, last) for tag in tags], axis=1)
+        return df.iloc[:max_results] if max_results else df
+
+    def invalidate(self, conn_name=None):
+        """Drop cached values of a connection (all connections if None)"""
+        with self._lock:
+            for key in [k for k in self._entries if conn_name in (None, k[0])]:
+                self._size -= self._entries.pop(key).size
+
+    @staticmethod
+    def _missing(entry, first, last, max_results):
+        if entry is None or entry.last < first or entry.first > last:
+            return ((first, last),)
+
+        # The first `max_results` values of the range are known already
+        if (
+            max_results
+            and entry.first <= first
+            and len(entry.slice(first, last)) >= max_results
+        ):
+            return ()
+
+        ranges = []
+        if first < entry.first:
+            ranges.append((first, entry.first))
+        if last > entry.last:
+            ranges.append((entry.last, last))
+        return tuple(ranges)
+
+    def _store(self, conn_name, tags, time_frequency, start, end, df, max_results):
+        # Data after the last returned sample is unknown if the read was truncated,
+        # data of the future is not there yet
+        end = min(end, pd.Timestamp.now(tz="UTC"))
+        if max_results and len(df) >= max_results:
+            end = min(end, _utc(df.index[-1], naive_utc=True))
+
+        columns = {str(c).lower(): c for c in df.columns}
+        stored = {}
+        with self._lock:
+            for tag in tags:
+                column = columns.get(tag.lower())
+                values = (
+                    df[column].rename(tag)
+                    if column is not None
+                    else pd.Series(index=df.index[:0], dtype=float, name=tag)
+                )
+                first, last = start, end
+
+                key = (conn_name, tag, time_frequency)
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._size -= old.size
+                    # Contiguous ranges are merged, a disjoint range replaces the old one
+                    if old.first <= end and start <= old.last:
+                        values = pd.concat([old.values, values]).sort_index()
+                        values = values[~values.index.duplicated(keep="last")]
+                        first, last = min(old.first, start), max(old.last, end)
+
+                entry = _Entry(first, last, values)
+                stored[tag] = entry
+                if first <= last:
+                    self._entries[key] = entry
+                    self._size += entry.size
+
+            while self._size > self._max_bytes and self._entries:
+                self._size -= self._entries.popitem(last=False)[1].size
+
+        return stored
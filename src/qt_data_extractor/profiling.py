@@ -0,0 +1,169 @@
+"""
+Opt-in profiling of extraction and tag browsing operations.
+
+An operation runs under cProfile (the thread running it and every thread it starts, i.e.
+extraction readers and the archive writer) and tracemalloc. When it ends, the merged
+profile is saved as `<output>.prof` (pstats format, i.e. for snakeviz) and a readable
+summary of the slowest functions and the top allocation sites as `<output>.profile.txt`,
+next to the extraction log.
+
+Profiling is enabled for every operation by the QT_DATA_EXTRACTOR_PROFILE environment
+variable, or for the next operation from the Help menu.
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+log = logging.getLogger(__name__)
+
+PROFILE_ENVIRONMENT_VARIABLE = "QT_DATA_EXTRACTOR_PROFILE"
+PROFILE_FILE_EXTENSION = ".prof"
+PROFILE_SUMMARY_EXTENSION = ".profile.txt"
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+# Frames kept per traced allocation, more frames cost more memory and time
+TRACEMALLOC_FRAMES = 1
+
+# Profile hooks and tracemalloc are process wide, one operation is profiled at a time
+_session_lock = threading.Lock()
+
+
+def profiling_requested():
+    """Profiling of every operation requested by the environment"""
+    return os.getenv(PROFILE_ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+
+class OperationProfiler:
+    """
+    Context manager profiling the operation it wraps.
+
+    Saving failures are logged, they never fail the profiled operation. An operation
+    started while another one is profiled runs without profiling.
+
+    :param path: Output path without extension (i.e. the extraction job archive's)
+    :param title: Operation description written to the summary
+    """
+
+    def __init__(self, path, title=""):
+        self._path = path
+        self._title = title
+        self._lock = threading.Lock()
+        self._profilers = []
+        self._active = False
+        self._started_tracemalloc = False
+        self._started = None
+
+    @property
+    def profile_path(self):
+        return f"{self._path}{PROFILE_FILE_EXTENSION}"
+
+    @property
+    def summary_path(self):
+        return f"{self._path}{PROFILE_SUMMARY_EXTENSION}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        if not _session_lock.acquire(blocking=False):
+            log.warning(f"Another operation is being profiled, {self._title} is not")
+            return
+
+        self._active = True
+        self._started = time.monotonic()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        tracemalloc.reset_peak()
+
+        threading.setprofile(self._thread_started)
+        self._enable_profiler()
+
+    def stop(self):
+        """Stop profiling and save the results"""
+        if not self._active:
+            return
+
+        try:
+            threading.setprofile(None)
+            with self._lock:
+                for profiler in self._profilers:
+                    profiler.disable()
+
+            duration = time.monotonic() - self._started
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+            self._save(duration, snapshot, peak)
+            log.info(f"Profile of {self._title} saved to {self.summary_path}")
+        except Exception as e:
+            log.warning(f"Failed saving profile of {self._title}: {e}")
+        finally:
+            self._active = False
+            _session_lock.release()
+
+    def _thread_started(self, frame, event, arg):
+        # Called in every new thread (threading.setprofile), hands over to cProfile
+        sys.setprofile(None)
+        self._enable_profiler()
+
+    def _enable_profiler(self):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ runs a single profiler at a time
+            return
+
+        with self._lock:
+            self._profilers.append(profiler)
+
+    def _save(self, duration, snapshot, peak):
+        with self._lock:
+            profilers = list(self._profilers)
+
+        stats = pstats.Stats(profilers[0])
+        for profiler in profilers[1:]:
+            stats.add(profiler)
+        stats.dump_stats(self.profile_path)
+
+        summary = io.StringIO()
+        summary.write(f"{self._title}\n")
+        summary.write(
+            f"Duration {duration:.2f}s, {len(profilers)} thread(s) profiled, "
+            f"peak traced memory {peak / 1024 / 1024:.1f} MB\n"
+        )
+
+        stats.stream = summary
+        for sort_key, title in [
+            (pstats.SortKey.CUMULATIVE, "cumulative time"),
+            (pstats.SortKey.TIME, "own time"),
+        ]:
+            summary.write(f"\nTop {TOP_FUNCTIONS} functions by {title}\n")
+            stats.sort_stats(sort_key).print_stats(TOP_FUNCTIONS)
+
+        summary.write(f"\nTop {TOP_ALLOCATIONS} allocation sites (still allocated)\n")
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            summary.write(f"{stat}\n")
+
+        with open(self.summary_path, "w") as fl:
+            fl.write(summary.getvalue())
@@ -0,0 +1,106 @@
+"""
+Extraction progress aggregation.
+
+Readers report every stored tag and time window. Forwarding each event to the GUI floods
+its event loop on jobs of tens of thousands of tags, so events are aggregated and
+reported at a fixed rate together with the throughput and the estimated time left. A
+single read can take minutes, so the caller also polls the aggregator on a timer (the GUI
+event loop, the batch command's main thread) to keep the reports coming meanwhile.
+"""
+
+import threading
+import time
+
+DEFAULT_PROGRESS_INTERVAL_SECONDS = 0.1
+
+
+class ProgressThrottle:
+    """
+    Aggregates extraction progress, thread safe.
+
+    The callback is called with a snapshot dictionary at most once per `interval`:
+
+    completed / total
+        Completed tags / all tags of the job
+    tags
+        Tags completed since the previous report
+    rows / bytes
+        Rows and bytes (in memory size) read so far
+    rows_per_second / bytes_per_second
+        Average throughput since the start
+    elapsed / eta
+        Seconds since the start / estimated seconds left (None before the first tag)
+
+    :param total: Number of tags of the job
+    :param callback: Called with the snapshot
+    :param interval: Min seconds between reports
+    """
+
+    def __init__(self, total, callback, interval=DEFAULT_PROGRESS_INTERVAL_SECONDS):
+        self._total = total
+        self._callback = callback
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._last_report = 0.0
+        self._completed = 0
+        self._tags = []
+        self._rows = 0
+        self._bytes = 0
+
+    def tag_completed(self, tag, counter):
+        """Progress callback of `run_job`"""
+        with self._lock:
+            self._completed = max(self._completed, counter)
+            self._tags.append(tag)
+        self._report()
+
+    def window_read(self, tag, rows, nbytes):
+        """Window callback of `run_job`"""
+        with self._lock:
+            self._rows += rows
+            self._bytes += nbytes
+        self._report()
+
+    def poll(self):
+        """Report if `interval` passed since the last report, even without new events"""
+        self._report()
+
+    def flush(self):
+        """Report pending progress right away (i.e. at the end of the job)"""
+        self._report(force=True)
+
+    def _report(self, force=False):
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_report < self._interval:
+                return
+
+            self._last_report = now
+            elapsed = max(now - self._started, 1e-6)
+            snapshot = {
+                "completed": self._completed,
+                "total": self._total,
+                "tags": self._tags,
+                "rows": self._rows,
+                "bytes": self._bytes,
+                "rows_per_second": self._rows / elapsed,
+                "bytes_per_second": self._bytes / elapsed,
+                "elapsed": elapsed,
+                "eta": elapsed / self._completed * (self._total - self._completed)
+                if self._completed
+                else None,
+            }
+            self._tags = []
+
+            # Called under the lock, so reports arrive in order
+            self._callback(snapshot)
+
+
+def format_duration(seconds):
+    """Seconds as h:mm:ss"""
+    if seconds is None:
+        return "--:--:--"
+
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
@@ -0,0 +1,197 @@
+"""
+Performance report of an extraction job.
+
+The engine records every historian request, retry and archived frame into a
+`JobReport`. Once the job ends, the report is saved as JSON next to the archive (per tag
+latency, rows, bytes in memory and compressed in the archive, retries, time spent in
+historian reads versus archive writes), and optionally as a Prometheus text format file
+for node exporter textfile collectors.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+REPORT_FILE_EXTENSION = ".report.json"
+PROMETHEUS_METRIC_PREFIX = "qt_data_extractor"
+
+
+class _TagStats:
+    __slots__ = (
+        "requests",
+        "errors",
+        "retries",
+        "read_seconds",
+        "max_latency",
+        "rows_read",
+        "bytes_read",
+        "rows_written",
+        "bytes_in_memory",
+        "bytes_written",
+    )
+
+    def __init__(self):
+        for field in self.__slots__:
+            setattr(self, field, 0)
+
+    def to_dict(self):
+        res = {field: getattr(self, field) for field in self.__slots__}
+        res["mean_latency"] = self.read_seconds / self.requests if self.requests else 0
+        return res
+
+
+class JobReport:
+    """
+    Collects job statistics, thread safe.
+
+    :param job: Job description (see `create_job`)
+    """
+
+    def __init__(self, job):
+        self._job = job
+        self._lock = threading.Lock()
+        self._tags = {}
+        self._started = datetime.now()
+        self._started_monotonic = time.monotonic()
+        self._duration = None
+        self._status = "running"
+        self._error = None
+        self._failures = []
+        self._writer = None
+
+    def _tag(self, tag):
+        stats = self._tags.get(tag)
+        if stats is None:
+            stats = self._tags[tag] = _TagStats()
+        return stats
+
+    def attach_writer(self, writer):
+        """Report the write time of the job's ArchiveWriter"""
+        self._writer = writer
+
+    def request(self, tag, latency, error=False):
+        """A historian request of `tag` took `latency` seconds"""
+        with self._lock:
+            stats = self._tag(tag)
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.read_seconds += latency
+            stats.max_latency = max(stats.max_latency, latency)
+
+    def retry(self, tag):
+        with self._lock:
+            self._tag(tag).retries += 1
+
+    def window_read(self, tag, rows, nbytes):
+        with self._lock:
+            stats = self._tag(tag)
+            stats.rows_read += rows
+            stats.bytes_read += nbytes
+
+    def written(self, tag, rows, nbytes, archive_bytes=0):
+        """A frame of `tag` was committed to the archive, `nbytes` is its size in memory
+        and `archive_bytes` its compressed size in the archive"""
+        with self._lock:
+            stats = self._tag(tag)
+            stats.rows_written += rows
+            stats.bytes_in_memory += nbytes
+            stats.bytes_written += archive_bytes
+
+    def finish(self, status, failures=None, error=None):
+        """Record the outcome - "completed", "failed" or "cancelled" """
+        self._duration = time.monotonic() - self._started_monotonic
+        self._status = status
+        self._failures = list(failures or [])
+        self._error = str(error) if error is not None else None
+
+    def to_dict(self):
+        with self._lock:
+            tags = {tag: stats.to_dict() for tag, stats in self._tags.items()}
+
+        totals = {
+            field: sum(t[field] for t in tags.values())
+            for field in [
+                "requests",
+                "errors",
+                "retries",
+                "read_seconds",
+                "rows_read",
+                "bytes_read",
+                "rows_written",
+                "bytes_in_memory",
+                "bytes_written",
+            ]
+        }
+        totals["write_seconds"] = self._writer.write_seconds if self._writer else 0.0
+
+        return {
+            "job": {
+                k: self._job[k]
+                for k in [
+                    "src_conn",
+                    "archive",
+                    "archive_type",
+                    "first_timestamp",
+                    "last_timestamp",
+                    "time_frequency",
+                    "window",
+                    "max_readers",
+                    "update",
+                ]
+                if k in self._job
+            },
+            "status": self._status,
+            "error": self._error,
+            "started": self._started,
+            "duration": self._duration,
+            "tags_total": len(self._job["tags"]),
+            # Read seconds are summed over the concurrent readers
+            "totals": totals,
+            "failures": self._failures,
+            "tags": tags,
+        }
+
+    def write_json(self, path):
+        with open(path, "w") as fl:
+            json.dump(self.to_dict(), fl, indent=2, default=str)
+
+    def write_prometheus(self, path):
+        """Job totals in Prometheus text exposition format"""
+        report = self.to_dict()
+        totals = report["totals"]
+        labels = (
+            f'connection="{_escape(self._job["src_conn"])}",'
+            f'archive="{_escape(os.path.basename(self._job["archive"]))}"'
+        )
+        metrics = [
+            ("job_success", "gauge", int(report["status"] == "completed")),
+            ("job_duration_seconds", "gauge", report["duration"] or 0),
+            ("job_tags", "gauge", report["tags_total"]),
+            ("job_failed_units", "gauge", len(report["failures"])),
+            ("requests_total", "counter", totals["requests"]),
+            ("request_errors_total", "counter", totals["errors"]),
+            ("retries_total", "counter", totals["retries"]),
+            ("read_seconds_total", "counter", totals["read_seconds"]),
+            ("write_seconds_total", "counter", totals["write_seconds"]),
+            ("rows_read_total", "counter", totals["rows_read"]),
+            ("bytes_read_total", "counter", totals["bytes_read"]),
+            ("rows_written_total", "counter", totals["rows_written"]),
+            ("bytes_in_memory_total", "counter", totals["bytes_in_memory"]),
+            ("bytes_written_total", "counter", totals["bytes_written"]),
+        ]
+
+        lines = []
+        for name, metric_type, value in metrics:
+            lines.append(f"# TYPE {PROMETHEUS_METRIC_PREFIX}_{name} {metric_type}")
+            lines.append(f"{PROMETHEUS_METRIC_PREFIX}_{name}{{{labels}}} {value}")
+
+        # Written aside and renamed, so collectors never read a partial file
+        with open(f"{path}.tmp", "w") as fl:
+            fl.write("\n".join(lines) + "\n")
+        os.replace(f"{path}.tmp", path)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
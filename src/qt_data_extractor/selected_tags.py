@@ -0,0 +1,69 @@
+"""
+Tags selected for extraction.
+
+Tags are kept in a dictionary (insertion ordered), so membership checks and bulk
+updates cost O(1) per tag regardless of the selection size. Views subscribe to
+change notifications and update only the affected rows.
+"""
+
+
+class SelectedTags:
+    """
+    Selection store - tag name -> attributes.
+
+    Subscribers are called with (added, removed) lists of tag names after every change.
+    """
+
+    def __init__(self):
+        self._tags = {}
+        self._subscribers = []
+
+    def __len__(self):
+        return len(self._tags)
+
+    def __iter__(self):
+        return iter(self._tags)
+
+    def __contains__(self, tag_name):
+        return tag_name in self._tags
+
+    def __getitem__(self, tag_name):
+        return self._tags[tag_name]
+
+    @property
+    def names(self):
+        return list(self._tags)
+
+    def subscribe(self, callback):
+        self._subscribers.append(callback)
+
+    def add(self, tags):
+        """Add tags (name -> attributes), returns names of the tags not selected before"""
+        added = [name for name in tags if name not in self._tags]
+        for name in added:
+            self._tags[name] = tags[name]
+
+        self._notify(added, [])
+        return added
+
+    def remove(self, names):
+        """Remove tags, returns names of the removed tags"""
+        removed = [name for name in dict.fromkeys(names) if name in self._tags]
+        for name in removed:
+            del self._tags[name]
+
+        self._notify([], removed)
+        return removed
+
+    def clear(self):
+        removed = list(self._tags)
+        self._tags = {}
+        self._notify([], removed)
+        return removed
+
+    def _notify(self, added, removed):
+        if not added and not removed:
+            return
+
+        for callback in self._subscribers:
+            callback(added, removed)
@@ -0,0 +1,178 @@
+"""
+Local cache of historian tag catalogs.
+
+Browsing a remote historian costs seconds per `list_tags` call, so results are kept in
+a SQLite database under the user profile, keyed by connection and query. Entries
+younger than the TTL are served locally. Stale entries are served as well while a
+background refresh updates them, unless they are too old to be trusted.
+"""
+
+import json
+import logging
+import os
+import platform
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+log = logging.getLogger(__name__)
+
+CATALOG_FILE_NAME = "tag-catalog.sqlite"
+DEFAULT_CATALOG_TTL = timedelta(hours=12)
+# Stale entries older than this are refreshed before being served
+DEFAULT_CATALOG_MAX_STALE = timedelta(days=7)
+
+
+def user_data_dir():
+    """Per user directory of the extractor (i.e. %APPDATA%\\qt-data-extractor)"""
+    if platform.system() == "Windows" and os.getenv("APPDATA"):
+        return os.path.join(os.getenv("APPDATA"), "qt-data-extractor")
+
+    return os.path.join(os.path.expanduser("~"), ".qt-data-extractor")
+
+
+class TagCatalog:
+    """
+    Caching front of `api.list_tags`.
+
+    :param api: Data agent API
+    :param path: SQLite database path, None - under the user profile
+    :param ttl: Age after which an entry is refreshed (timedelta)
+    :param max_stale: Age after which an entry is not served before it is refreshed
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS list_tags (
+            conn_name TEXT NOT NULL,
+            query TEXT NOT NULL,
+            result TEXT NOT NULL,
+            updated REAL NOT NULL,
+            PRIMARY KEY (conn_name, query)
+        )
+    """
+
+    def __init__(
+        self,
+        api,
+        path=None,
+        ttl=DEFAULT_CATALOG_TTL,
+        max_stale=DEFAULT_CATALOG_MAX_STALE,
+    ):
+        self._api = api
+        self._path = path or os.path.join(user_data_dir(), CATALOG_FILE_NAME)
+        self._ttl = ttl.total_seconds()
+        self._max_stale = max(ttl, max_stale).total_seconds()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tag-catalog-refresh"
+        )
+
+        if self._path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+        self._db = sqlite3.connect(self._path, check_same_thread=False)
+        with self._db:
+            self._db.execute(self._SCHEMA)
+            self._db.execute(
+                "DELETE FROM list_tags WHERE updated < ?",
+                (time.time() - self._max_stale,),
+            )
+
+    @property
+    def path(self):
+        return self._path
+
+    def list_tags(
+        self,
+        conn_name,
+        filter="",
+        include_attributes=False,
+        recursive=False,
+        max_results=0,
+        refresh=False,
+    ):
+        """Same as `api.list_tags`, served from the cache when possible
+
+        :param refresh: Query the historian even if the entry is fresh
+        """
+        kwargs = {
+            "filter": filter,
+            "include_attributes": include_attributes,
+            "recursive": recursive,
+            "max_results": max_results,
+        }
+        query = json.dumps(kwargs, sort_keys=True)
+
+        if not refresh:
+            cached = self._get(conn_name, query)
+            if cached is not None:
+                result, age = cached
+
+                if age < self._ttl:
+                    return result
+
+                if age < self._max_stale:
+                    self._refresh_in_background(conn_name, query, kwargs)
+                    return result
+
+        return self._refresh(conn_name, query, kwargs)
+
+    def invalidate(self, conn_name=None):
+        """Drop cached entries of a connection (all connections if None)"""
+        with self._lock, self._db:
+            if conn_name is None:
+                self._db.execute("DELETE FROM list_tags")
+            else:
+                self._db.execute(
+                    "DELETE FROM list_tags WHERE conn_name = ?", (conn_name,)
+                )
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._db.close()
+
+    def _get(self, conn_name, query):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT result, updated FROM list_tags WHERE conn_name = ? AND query = ?",
+                (conn_name, query),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return json.loads(row[0]), time.time() - row[1]
+
+    def _put(self, conn_name, query, result):
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO list_tags (conn_name, query, result, updated) "
+                "VALUES (?, ?, ?, ?)",
+                (conn_name, query, json.dumps(result, default=str), time.time()),
+            )
+
+    def _refresh(self, conn_name, query, kwargs):
+        result = self._api.list_tags(conn_name, **kwargs)
+        self._put(conn_name, query, result)
+        return result
+
+    def _refresh_in_background(self, conn_name, query, kwargs):
+        key = (conn_name, query)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._refresh(conn_name, query, kwargs)
+            except Exception as e:
+                log.warning(f"Failed refreshing tags of {conn_name}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(refresh)
@@ -0,0 +1,241 @@
+"""
+Streaming import of tag lists.
+
+Tag lists are read row by row - Excel workbooks in openpyxl read-only mode, CSV files,
+text files (one tag per line) and text pasted from the clipboard (i.e. cells copied from
+Excel). Names are taken from a selectable column, stripped and deduplicated as they are
+read, so resolving them against the historian can start with the first batch instead of
+waiting for the whole list.
+"""
+
+import contextlib
+import csv
+import io
+import itertools
+import os
+import queue
+import threading
+
+EXCEL_EXTENSIONS = [".xlsx", ".xlsm"]
+CSV_EXTENSIONS = [".csv"]
+TAG_LIST_FILE_FILTER = (
+    "Tag lists (*.xlsx *.xlsm *.csv *.txt);;"
+    "Excel workbooks (*.xlsx *.xlsm);;"
+    "CSV files (*.csv);;"
+    "Text files (*.txt);;"
+    "All files (*)"
+)
+CSV_DELIMITERS = ",;\t|"
+# Bytes of a CSV file looked at to guess its delimiter
+CSV_SNIFF_BYTES = 64 * 1024
+# Rows shown when selecting the tags column
+PREVIEW_ROWS = 20
+# Tag names handed over for resolving at a time
+DEFAULT_BATCH_SIZE = 500
+
+
+def is_excel_file(path):
+    return os.path.splitext(path)[1].lower() in EXCEL_EXTENSIONS
+
+
+def list_sheets(path):
+    """Sheet names of an Excel workbook, an empty list for other files"""
+    if not is_excel_file(path):
+        return []
+
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+def read_rows(path, sheet=None):
+    """
+    Rows (lists of cells) of a tag list file, read lazily.
+
+    :param path: Excel workbook, CSV file or text file (one row per line, cells may be
+        separated by tabs)
+    :param sheet: Excel sheet name, the first sheet if not set
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in EXCEL_EXTENSIONS:
+        yield from _read_excel_rows(path, sheet)
+    elif extension in CSV_EXTENSIONS:
+        yield from _read_csv_rows(path)
+    else:
+        with open(path, "r", encoding="utf-8-sig", errors="replace") as fl:
+            yield from _text_rows(fl)
+
+
+def parse_text(text):
+    """Rows of a pasted tag list - lines, cells copied from a spreadsheet are tab separated"""
+    return _text_rows(io.StringIO(text))
+
+
+def _text_rows(lines):
+    for line in lines:
+        yield line.rstrip("\r\n").split("\t")
+
+
+def _read_excel_rows(path, sheet):
+    import openpyxl
+
+    # Read-only mode streams the sheet XML instead of loading the whole workbook
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+        for row in worksheet.iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        workbook.close()
+
+
+def _read_csv_rows(path):
+    with open(path, "r", newline="", encoding="utf-8-sig", errors="replace") as fl:
+        sample = fl.read(CSV_SNIFF_BYTES)
+        fl.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS)
+        except csv.Error:
+            # A single column has no delimiter to guess
+            dialect = csv.excel
+
+        yield from csv.reader(fl, dialect)
+
+
+def _cell_text(value):
+    if value is None:
+        return ""
+
+    if isinstance(value, float) and value.is_integer():
+        # Numeric tag names read from a workbook
+        value = int(value)
+
+    return str(value).strip()
+
+
+def column_name(column):
+    """Spreadsheet name of a zero based column index, i.e. 0 -> A, 27 -> AB"""
+    name = ""
+    column += 1
+    while column:
+        column, remainder = divmod(column - 1, 26)
+        name = chr(ord("A") + remainder) + name
+    return name
+
+
+def column_index(name):
+    """Zero based index of a column given by its spreadsheet name or 1 based number"""
+    name = name.strip().upper()
+    if name.isdigit() and int(name) > 0:
+        return int(name) - 1
+
+    if not name or not name.isalpha() or not name.isascii():
+        raise ValueError(f'Invalid column "{name}"')
+
+    column = 0
+    for c in name:
+        column = column * 26 + ord(c) - ord("A") + 1
+    return column - 1
+
+
+class TagList:
+    """
+    Unique tag names of a tag list, read lazily from its rows.
+
+    Iterating yields each name once, in the order of the list, while the rows are
+    being read. The counters are updated as the list is read.
+
+    :param rows: Iterable of rows (lists of cells), i.e. read_rows() or parse_text()
+    :param column: Zero based index of the column holding the tag names
+    :param skip_rows: Leading rows skipped (i.e. a header)
+    :param source: Description of the list, i.e. the file name
+    """
+
+    def __init__(self, rows, column=0, skip_rows=0, source=""):
+        self._rows = rows
+        self._column = column
+        self._skip_rows = skip_rows
+        self.source = source
+        self.rows_read = 0
+        self.duplicates = 0
+        self.tags = []
+
+    def __iter__(self):
+        seen = set()
+        for row in itertools.islice(self._rows, self._skip_rows, None):
+            self.rows_read += 1
+            if self._column >= len(row):
+                continue
+
+            tag = _cell_text(row[self._column])
+            if not tag:
+                continue
+
+            if tag in seen:
+                self.duplicates += 1
+                continue
+
+            seen.add(tag)
+            self.tags.append(tag)
+            yield tag
+
+    def batches(self, size=DEFAULT_BATCH_SIZE, read_ahead=False):
+        """
+        Lists of up to `size` new tag names, as they are read.
+
+        :param size: Tag names per batch
+        :param read_ahead: Read the list in a background thread, so reading it overlaps
+            with whatever the consumer does with the batches (i.e. historian queries)
+        """
+        if not read_ahead:
+            yield from self._batches(size)
+            return
+
+        ready = queue.Queue()
+        stop = threading.Event()
+
+        def read():
+            try:
+                with contextlib.closing(self._batches(size)) as batches:
+                    for batch in batches:
+                        if stop.is_set():
+                            return
+                        ready.put(batch)
+                ready.put(None)
+            except Exception as e:
+                ready.put(e)
+
+        threading.Thread(target=read, name="tag-list-reader", daemon=True).start()
+        try:
+            while True:
+                batch = ready.get()
+                if batch is None:
+                    return
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            # The consumer may stop early, i.e. a superseded query
+            stop.set()
+
+    def _batches(self, size):
+        tags = iter(self)
+        while True:
+            batch = list(itertools.islice(tags, size))
+            if not batch:
+                return
+            yield batch
+
+
+def open_tag_list(path, sheet=None, column=0, skip_rows=0):
+    """TagList of a tag list file, see read_rows()"""
+    return TagList(
+        read_rows(path, sheet),
+        column=column,
+        skip_rows=skip_rows,
+        source=os.path.basename(path),
+    )
@@ -0,0 +1,149 @@
+"""
+Resolution of tag lists against a historian.
+
+A list is split into batches, a few of them queried at a time - large enough to save
+round trips, small enough for the historian to answer each in a reasonable time. The
+returned tags are matched to the requested names through a case insensitive hash
+index: a name is found when a single tag matches it, ambiguous when several tags differ
+from it only in case and missing when none does. Patterns (names with wildcards) are
+passed through, every tag they match is found.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from qt_data_extractor.tag_search import WILDCARDS
+
+DEFAULT_BATCH_SIZE = 500
+# Batches queried at the same time, per resolution
+DEFAULT_CONCURRENCY = 4
+
+
+def is_pattern(name):
+    """Name with wildcards, matching any number of tags"""
+    return not WILDCARDS.keys().isdisjoint(name)
+
+
+def batched(names, size=DEFAULT_BATCH_SIZE):
+    """Batches (lists) of up to `size` names of a list"""
+    names = list(names)
+    return [names[i : i + size] for i in range(0, len(names), size)]
+
+
+class TagResolution:
+    """
+    Outcome of a tag list resolution.
+
+    :param found: Tags of the historian matching the list (name -> attributes)
+    :param missing: Requested names not matching any tag
+    :param ambiguous: Requested names matching several tags differing only in case
+        (requested name -> matching tag names), these tags are in `found` as well
+    """
+
+    def __init__(self, found, missing, ambiguous):
+        self.found = found
+        self.missing = missing
+        self.ambiguous = ambiguous
+
+    def __repr__(self):
+        return (
+            f"TagResolution(found={len(self.found)}, missing={len(self.missing)}, "
+            f"ambiguous={len(self.ambiguous)})"
+        )
+
+
+class TagResolver:
+    """
+    Resolves tag lists with concurrent, batched queries.
+
+    :param list_tags: Query of a batch - callable(filter=[names]) returning a dict
+        name -> attributes, i.e. a partial of TagCatalog.list_tags
+    :param batch_size: Names per query
+    :param concurrency: Queries running at the same time
+    """
+
+    def __init__(
+        self, list_tags, batch_size=DEFAULT_BATCH_SIZE, concurrency=DEFAULT_CONCURRENCY
+    ):
+        self._list_tags = list_tags
+        self._batch_size = batch_size
+        self._concurrency = max(1, concurrency)
+
+    def resolve(self, names=None, batches=None, on_batch=None, cancelled=None):
+        """
+        Resolve a tag list.
+
+        :param names: Requested names (i.e. tags and patterns)
+        :param batches: Iterable of name lists instead of `names`, queried as they come
+            (i.e. TagList.batches() of a list still being read)
+        :param on_batch: Called with the tags found by each query, as queries complete
+            (from the querying threads)
+        :param cancelled: Callable returning True when the resolution is no longer needed
+        :return: TagResolution, None if cancelled
+        """
+        if batches is None:
+            batches = batched(names or [], self._batch_size)
+        cancelled = cancelled or (lambda: False)
+
+        requested = []
+        futures = []
+        # Bounds queries in flight, batches are not taken from a list being read faster
+        # than they are queried
+        slots = threading.BoundedSemaphore(self._concurrency)
+
+        def query(batch):
+            try:
+                if cancelled():
+                    return {}
+
+                found = self._list_tags(filter=batch)
+                if on_batch:
+                    on_batch(found)
+                return found
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix="tag-resolver"
+        ) as executor:
+            try:
+                for batch in batches:
+                    slots.acquire()
+                    if cancelled() or any(f.done() and f.exception() for f in futures):
+                        slots.release()
+                        break
+
+                    requested.extend(batch)
+                    futures.append(executor.submit(query, batch))
+
+                found = {}
+                for future in futures:
+                    found.update(future.result())
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        if cancelled():
+            return None
+
+        return self._match(requested, found)
+
+    @staticmethod
+    def _match(requested, found):
+        index = {}
+        for name in found:
+            index.setdefault(name.casefold(), []).append(name)
+
+        missing = []
+        ambiguous = {}
+        for name in requested:
+            if is_pattern(name):
+                continue
+
+            matches = index.get(name.casefold())
+            if not matches:
+                missing.append(name)
+            elif len(matches) > 1:
+                ambiguous[name] = matches
+
+        return TagResolution(found, missing, ambiguous)
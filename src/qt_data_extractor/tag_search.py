@@ -0,0 +1,182 @@
+"""
+In-process search over the tag catalog of a connection.
+
+Tag names and descriptions are kept in one lowercase text block (a line per tag) and
+in a sorted name list. Wildcard patterns with a literal prefix are resolved with a
+binary search over the sorted names, other queries scan the text block for their
+longest literal part, which is done by the regex engine in C. Both stop once enough
+results are found, so typing into the filter gets answers in milliseconds even for
+catalogs of hundreds of thousands of tags.
+"""
+
+import bisect
+import re
+from array import array
+
+# Wildcards of the historian filters - "*" and "%" match any text, "?" a single character
+WILDCARDS = {"*": ".*", "%": ".*", "?": "."}
+# Above this number of prefix candidates, scanning the text block is faster
+MAX_PREFIX_CANDIDATES = 20000
+
+_WILDCARDS_RE = re.compile("([*%?])")
+
+
+def _glob_to_regex(pattern):
+    return "".join(
+        WILDCARDS.get(part, re.escape(part))
+        for part in _WILDCARDS_RE.split(pattern)
+        if part
+    )
+
+
+def _one_line(text):
+    """Text kept on a single line of the text block"""
+    return str(text or "").replace("\r", " ").replace("\n", " ")
+
+
+class TagSearchIndex:
+    """
+    Search index over tag names and descriptions.
+
+    A query without wildcards matches tags whose name or description contains it
+    (name prefix matches first). A query with wildcards matches whole tag names, as the
+    historian filters do. Matching is case insensitive.
+
+    :param tags: Tags dictionary as returned by `list_tags` (name -> attributes)
+    :param description_attribute: Attribute searched along with the tag name
+    """
+
+    def __init__(self, tags, description_attribute="Description"):
+        self._names = list(tags)
+
+        self._lower_names = [_one_line(name).lower() for name in self._names]
+
+        # Names with descriptions for text queries, names only for wildcard patterns
+        self._text, self._line_starts = self._text_block(
+            f"{name}\t{_one_line(tags[tag].get(description_attribute))}".lower()
+            for tag, name in zip(self._names, self._lower_names)
+        )
+        self._names_text, self._name_starts = self._text_block(self._lower_names)
+
+        # Tag positions sorted by name for prefix lookups
+        self._sorted = sorted(
+            range(len(self._lower_names)), key=self._lower_names.__getitem__
+        )
+        self._sorted_names = [self._lower_names[i] for i in self._sorted]
+
+    def __len__(self):
+        return len(self._names)
+
+    @property
+    def names(self):
+        return self._names
+
+    def search(self, query, max_results=0):
+        """Tag names matching `query`
+
+        :param query: Text or wildcard pattern (`*`, `%`, `?`)
+        :param max_results: Max number of results, 0 - all
+        :return: List of tag names
+        """
+        query = query.strip().lower()
+        if not query:
+            return self._names[:max_results] if max_results else list(self._names)
+
+        if _WILDCARDS_RE.search(query):
+            return self._search_pattern(query, max_results)
+
+        return self._search_text(query, max_results)
+
+    def _search_text(self, query, max_results):
+        found = self._prefix_range(query, max_results)
+        positions = [self._sorted[i] for i in found]
+
+        if not max_results or len(positions) < max_results:
+            seen = set(positions)
+            for i in self._scan(re.escape(query), self._text, self._line_starts):
+                if i not in seen:
+                    seen.add(i)
+                    positions.append(i)
+                    if max_results and len(positions) >= max_results:
+                        break
+
+        return [self._names[i] for i in positions]
+
+    def _search_pattern(self, pattern, max_results):
+        if not pattern.strip("*%"):
+            return self.search("", max_results)
+
+        regex = re.compile(_glob_to_regex(pattern))
+        prefix = _WILDCARDS_RE.split(pattern)[0]
+
+        if prefix:
+            lo, hi = self._prefix_bounds(prefix)
+            if hi - lo <= MAX_PREFIX_CANDIDATES:
+                res = []
+                for i in range(lo, hi):
+                    if regex.fullmatch(self._sorted_names[i]):
+                        res.append(self._sorted[i])
+                        if max_results and len(res) >= max_results:
+                            break
+
+                return [self._names[i] for i in sorted(res)]
+
+        # Scan for the longest literal part, then match whole names
+        literal = max(
+            (p for p in _WILDCARDS_RE.split(pattern) if p not in WILDCARDS),
+            key=len,
+            default="",
+        )
+
+        res = []
+        for i in self._scan(
+            re.escape(literal) if literal else "(?m)^",
+            self._names_text,
+            self._name_starts,
+        ):
+            if regex.fullmatch(self._lower_names[i]):
+                res.append(i)
+                if max_results and len(res) >= max_results:
+                    break
+
+        return [self._names[i] for i in res]
+
+    def _prefix_bounds(self, prefix):
+        lo = bisect.bisect_left(self._sorted_names, prefix)
+        hi = bisect.bisect_left(self._sorted_names, prefix + "\uffff", lo)
+        return lo, hi
+
+    def _prefix_range(self, prefix, max_results):
+        lo, hi = self._prefix_bounds(prefix)
+        if max_results:
+            hi = min(hi, lo + max_results)
+        return range(lo, hi)
+
+    @staticmethod
+    def _text_block(lines):
+        """Join lines into one text, returns the text and the start offset of every line"""
+        lines = list(lines)
+        starts = array("q")
+        pos = 0
+        for line in lines:
+            starts.append(pos)
+            pos += len(line) + 1
+
+        return "\n".join(lines) + "\n", starts
+
+    @staticmethod
+    def _scan(regex, text, line_starts):
+        """Yield positions of tags whose line matches `regex`, in catalog order"""
+        compiled = re.compile(regex)
+        pos = 0
+        while True:
+            match = compiled.search(text, pos)
+            if match is None:
+                return
+
+            yield bisect.bisect_right(line_starts, match.start()) - 1
+
+            # Continue from the next line
+            pos = text.find("\n", match.start()) + 1
+            if pos == 0:
+                return
@@ -0,0 +1,45 @@
+"""
+Time zone conventions.
+
+Timestamps selected by the user (the GUI date pickers, the batch command line) without
+a time zone are local time. Source connectors take naive period bounds in local time as
+well (PI evaluates them as AFTime strings in the time zone of the machine), but return a
+naive UTC index, which is also what the archives store. Everything in between - jobs,
+time windows, trimming, checkpoints and previews - is kept as tz-aware UTC.
+"""
+
+from datetime import timezone
+
+
+def to_utc(ts, naive_utc=False):
+    """
+    tz-aware UTC datetime of a timestamp.
+
+    :param ts: datetime or pandas Timestamp, None is passed through
+    :param naive_utc: A naive `ts` is UTC (i.e. read from an archive or a returned
+        index), otherwise it is local time (i.e. selected by the user)
+    """
+    if ts is None:
+        return None
+
+    if hasattr(ts, "to_pydatetime"):
+        ts = ts.to_pydatetime()
+
+    if ts.tzinfo is None and naive_utc:
+        return ts.replace(tzinfo=timezone.utc)
+
+    # Naive datetimes are taken as local time
+    return ts.astimezone(timezone.utc)
+
+
+def to_local_naive(ts):
+    """Naive local time of a timestamp - period bounds passed to source connectors"""
+    if ts is None:
+        return None
+
+    return to_utc(ts).astimezone().replace(tzinfo=None)
+
+
+def utc_index(index):
+    """UTC DatetimeIndex of a frame, a naive index (returned by source connectors) is UTC"""
+    return index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
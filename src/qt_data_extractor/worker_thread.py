@@ -1,10 +1,13 @@
 # https://www.pythonguis.com/tutorials/multithreading-pyside-applications-qthreadpool/
 
+import contextlib
 import sys
 import traceback
 
 from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
+from qt_data_extractor.cancellation import CancellationToken
+
 
 class WorkerSignals(QObject):
     """
@@ -44,6 +47,10 @@ class Worker(QRunnable):
     :param args: Arguments to pass to the callback function
     :param kwargs: Keywords to pass to the callback function
 
+    The callback also receives `progress_callback` (progress signal) and `cancel_token`
+    (CancellationToken set by `cancel`, `pause` and `resume`). Set `profiler` (i.e.
+    OperationProfiler) to run the callback under it.
+
     """
 
     def __init__(self, fn, *args, **kwargs):
@@ -54,9 +61,21 @@ class Worker(QRunnable):
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
+        self.token = CancellationToken()
+        self.profiler = None
 
         # Add the callback to our kwargs
         self.kwargs["progress_callback"] = self.signals.progress
+        self.kwargs["cancel_token"] = self.token
+
+    def cancel(self):
+        self.token.cancel()
+
+    def pause(self):
+        self.token.pause()
+
+    def resume(self):
+        self.token.resume()
 
     @Slot()
     def run(self):
@@ -66,7 +85,8 @@ class Worker(QRunnable):
 
         # Retrieve args/kwargs here; and fire processing using them
         try:
-            result = self.fn(*self.args, **self.kwargs)
+            with self.profiler or contextlib.nullcontext():
+                result = self.fn(*self.args, **self.kwargs)
         except:  # noqa: E722
             traceback.print_exc()
             exctype, value = sys.exc_info()[:2]
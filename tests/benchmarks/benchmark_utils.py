@@ -0,0 +1,50 @@
+"""Synthetic historian setup shared by the benchmarks"""
+
+import os
+
+from data_agent.api import ServiceApi
+from data_agent.connection_manager import ConnectionManager
+
+from qt_data_extractor.connectors.synthetic import SyntheticHistorianConnector
+
+SCALE = float(os.getenv("QT_DATA_EXTRACTOR_BENCHMARK_SCALE", "1"))
+SYNTHETIC_CONNECTION = "synthetic"
+
+
+def scaled(size):
+    return max(int(size * SCALE), 1)
+
+
+class _MemoryConfig:
+    """Data agent configuration without persistence or preconfigured connections"""
+
+    connections = {}
+
+    def set(self, key, value, persist=True):
+        pass
+
+    def remove(self, key, persist=True):
+        pass
+
+
+def synthetic_api(**params):
+    """Data agent API with a single enabled synthetic historian connection"""
+    manager = ConnectionManager(
+        _MemoryConfig(),
+        extra_connectors={
+            SyntheticHistorianConnector.TYPE: SyntheticHistorianConnector
+        },
+    )
+    api = ServiceApi(
+        scheduler=None,
+        connection_manager=manager,
+        data_exchanger=None,
+        safe_manipulator=None,
+    )
+    api.create_connection(
+        SYNTHETIC_CONNECTION,
+        SyntheticHistorianConnector.TYPE,
+        enabled=True,
+        **params,
+    )
+    return api
@@ -0,0 +1,94 @@
+"""
+Benchmarks of the browsing and extraction hot paths against the synthetic historian.
+
+Run with `pytest tests/benchmarks`. Every benchmark reports its duration, throughput
+and peak traced memory in the terminal summary. Sizes are multiplied by
+QT_DATA_EXTRACTOR_BENCHMARK_SCALE (i.e. 10 for realistic loads), results are also
+saved as JSON to QT_DATA_EXTRACTOR_BENCHMARK_JSON if set.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+
+import pytest
+
+# Before any Qt import - benchmarks run headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmark_utils import SCALE  # noqa: E402
+
+RESULTS_FILE = os.getenv("QT_DATA_EXTRACTOR_BENCHMARK_JSON")
+
+_results = []
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(autouse=True)
+def user_profile(tmp_path, monkeypatch):
+    """Keep the tag catalog and other per user files out of the real profile"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+
+
+@pytest.fixture
+def benchmark(request):
+    """
+    Measure `fn` - timed first, then run again under tracemalloc for the peak memory.
+
+    Called as benchmark(fn, items=..., unit=...), returns the result of the timed run.
+    """
+
+    def measure(fn, items=None, unit="items", memory=True):
+        started = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - started
+
+        peak = None
+        if memory:
+            tracemalloc.start()
+            try:
+                fn()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        _results.append(
+            {
+                "name": request.node.name,
+                "seconds": seconds,
+                "items": items,
+                "unit": unit,
+                "throughput": items / seconds if items and seconds else None,
+                "peak_mb": peak / 1024 / 1024 if peak is not None else None,
+            }
+        )
+        return result
+
+    return measure
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+
+    terminalreporter.section(f"benchmarks (scale {SCALE:g})")
+    for r in _results:
+        throughput = (
+            f"{r['throughput']:>14,.0f} {r['unit']}/s" if r["throughput"] else ""
+        )
+        peak = f"{r['peak_mb']:>9.1f} MB peak" if r["peak_mb"] is not None else ""
+        terminalreporter.write_line(
+            f"{r['name']:<48} {r['seconds']:>9.3f}s {throughput:<24} {peak}"
+        )
+
+    if RESULTS_FILE:
+        with open(RESULTS_FILE, "w") as fl:
+            json.dump({"scale": SCALE, "results": _results}, fl, indent=2)
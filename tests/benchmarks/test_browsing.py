@@ -0,0 +1,218 @@
+import functools
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from benchmark_utils import SYNTHETIC_CONNECTION, scaled, synthetic_api
+from PySide6.QtCore import QModelIndex, Qt
+
+from qt_data_extractor.design.pandas_model import FORMAT_BLOCK_SIZE, PandasModel
+from qt_data_extractor.design.tags_tree_model import TagsTreeModel
+from qt_data_extractor.preview_cache import PreviewCache
+from qt_data_extractor.tag_catalog import TagCatalog
+from qt_data_extractor.tag_import import open_tag_list
+from qt_data_extractor.tag_resolution import TagResolver
+from qt_data_extractor.tag_search import TagSearchIndex
+
+TAGS_COUNT = scaled(20000)
+ATTRIBUTES = ["Name", "Description", "EngUnits"]
+PREVIEW_TAGS = 20
+PREVIEW_PERIOD = timedelta(days=7)
+UI_TIMEOUT_SECONDS = 60
+# Latency of a tags query, concurrent batches overlap it
+LIST_TAGS_LATENCY_SECONDS = 0.05
+MISSING_TAGS = 100
+
+
+@pytest.fixture(scope="module")
+def api():
+    return synthetic_api(tags_count=TAGS_COUNT)
+
+
+@pytest.fixture(scope="module")
+def catalog(api):
+    return api.list_tags(
+        SYNTHETIC_CONNECTION,
+        filter="*",
+        include_attributes=ATTRIBUTES,
+        max_results=0,
+    )
+
+
+def _wait(qapp, condition):
+    deadline = time.monotonic() + UI_TIMEOUT_SECONDS
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for the UI"
+        qapp.processEvents()
+        time.sleep(0.001)
+
+
+def test_list_tags(api, benchmark, tmp_path):
+    tag_catalog = TagCatalog(api, path=str(tmp_path / "catalog.sqlite"))
+
+    tags = benchmark(
+        lambda: tag_catalog.list_tags(
+            SYNTHETIC_CONNECTION,
+            filter="*",
+            include_attributes=ATTRIBUTES,
+            max_results=0,
+            refresh=True,
+        ),
+        items=TAGS_COUNT,
+        unit="tags",
+    )
+    assert len(tags) == TAGS_COUNT
+
+
+def test_list_tags_cached(api, benchmark, tmp_path):
+    tag_catalog = TagCatalog(api, path=str(tmp_path / "catalog.sqlite"))
+    kwargs = {"filter": "*", "include_attributes": ATTRIBUTES, "max_results": 0}
+    tag_catalog.list_tags(SYNTHETIC_CONNECTION, **kwargs)
+
+    tags = benchmark(
+        lambda: tag_catalog.list_tags(SYNTHETIC_CONNECTION, **kwargs),
+        items=TAGS_COUNT,
+        unit="tags",
+    )
+    assert len(tags) == TAGS_COUNT
+
+
+def test_search_index(catalog, benchmark):
+    index = benchmark(lambda: TagSearchIndex(catalog), items=len(catalog), unit="tags")
+
+    started = time.perf_counter()
+    found = index.search("syn:fi*2.pv")
+    assert found and time.perf_counter() - started < 1
+
+
+def test_tags_tree_populate(qapp, catalog, benchmark):
+    model = TagsTreeModel()
+    columns = [(a, a) for a in ATTRIBUTES]
+
+    def populate():
+        model.set_tags(catalog, columns=columns)
+        model.sort(0, Qt.DescendingOrder)
+        # Scroll through the whole tree
+        while model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+        for row in range(0, model.rowCount(), 100):
+            model.data(model.index(row, 1))
+        return model.rowCount()
+
+    assert benchmark(populate, items=len(catalog), unit="tags") == len(catalog)
+
+
+def test_main_window_tags_list(qapp, api, catalog, benchmark):
+    from qt_data_extractor.mainwindow import MainWindow
+
+    window = MainWindow(api)
+    window._refresh_connections()
+    window._w.comboLeftConnection.setCurrentIndex(0)
+    tags = list(catalog)
+
+    def refresh():
+        # Tags list filter - queried in batches, the tree is populated as they arrive
+        window.on_refresh_tags_tree(tags, max_results=0)
+        _wait(qapp, lambda: not window._tags_loading)
+        return window._tags_model.total_count
+
+    assert benchmark(refresh, items=len(tags), unit="tags") == len(tags)
+    window.threadpool.waitForDone()
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_tag_resolution(catalog, benchmark, concurrency):
+    api = synthetic_api(tags_count=TAGS_COUNT, latency=LIST_TAGS_LATENCY_SECONDS)
+    resolver = TagResolver(
+        functools.partial(api.list_tags, SYNTHETIC_CONNECTION),
+        concurrency=concurrency,
+    )
+    # Names as typed in tag lists - any case, and a few that do not exist
+    names = [tag.lower() for tag in catalog] + [
+        f"SYN:XX{i:06d}.PV" for i in range(MISSING_TAGS)
+    ]
+
+    result = benchmark(
+        lambda: resolver.resolve(names), items=len(names), unit="tags", memory=False
+    )
+    assert len(result.found) == len(catalog)
+    assert len(result.missing) == MISSING_TAGS and not result.ambiguous
+
+
+def test_tag_list_import(catalog, benchmark, tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    path = str(tmp_path / "tags.xlsx")
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Tags")
+    sheet.append(["Tag", "Description"])
+    # Every tag listed twice, the duplicates are dropped while reading
+    for _ in range(2):
+        for tag, attributes in catalog.items():
+            sheet.append([tag, attributes.get("Description")])
+    workbook.save(path)
+
+    tags = benchmark(
+        lambda: list(open_tag_list(path, sheet="Tags", skip_rows=1)),
+        items=len(catalog) * 2,
+        unit="rows",
+    )
+    assert len(tags) == len(catalog)
+
+
+def test_main_window_tags_file(qapp, api, catalog, benchmark, tmp_path):
+    from qt_data_extractor.mainwindow import MainWindow
+
+    path = tmp_path / "tags.csv"
+    path.write_text("\n".join(["Tag"] + list(catalog)))
+    window = MainWindow(api)
+    window._refresh_connections()
+    window._w.comboLeftConnection.setCurrentIndex(0)
+
+    def refresh():
+        # Tags are queried batch by batch while the file is being read
+        window._import_tag_list(open_tag_list(str(path), skip_rows=1))
+        _wait(qapp, lambda: not window._tags_loading)
+        return window._tags_model.total_count
+
+    assert benchmark(refresh, items=len(catalog), unit="tags") == len(catalog)
+    window.threadpool.waitForDone()
+
+
+def test_preview_table(qapp, api, benchmark):
+    tags = [f"SYN:TI{i:06d}.PV" for i in range(0, PREVIEW_TAGS * 5, 5)]
+    last = datetime(2024, 1, 1)
+    df = api.read_tag_values_period(
+        SYNTHETIC_CONNECTION, tags, last - PREVIEW_PERIOD, last
+    )
+
+    def render():
+        model = PandasModel(df)
+        # Scroll through the table, formatting every block once
+        for row in range(0, model.rowCount(), FORMAT_BLOCK_SIZE):
+            for col in range(model.columnCount()):
+                model.data(model.index(row, col), Qt.DisplayRole)
+        return model
+
+    benchmark(render, items=df.size, unit="values")
+
+
+def test_preview_zoom_cached(api, benchmark):
+    cache = PreviewCache(api)
+    tags = [f"SYN:FI{i:06d}.PV" for i in range(2, PREVIEW_TAGS * 5, 5)]
+    last = datetime(2024, 1, 1)
+    first = last - PREVIEW_PERIOD
+    cache.read_tag_values_period(SYNTHETIC_CONNECTION, tags, first, last)
+
+    def zoom():
+        # Halving the previewed range down to an hour, served from memory
+        start, end, values = first, last, 0
+        while end - start > timedelta(hours=1):
+            start += (end - start) / 4
+            end -= (end - start) / 3
+            values += cache.read_tag_values_period(
+                SYNTHETIC_CONNECTION, tags, start, end
+            ).size
+        return values
+
+    benchmark(zoom, items=zoom(), unit="values")
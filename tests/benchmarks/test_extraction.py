@@ -0,0 +1,148 @@
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from benchmark_utils import SYNTHETIC_CONNECTION, scaled, synthetic_api
+
+from qt_data_extractor import extraction
+from qt_data_extractor.extraction import ARCHIVE_FORMATS, create_job, run_job
+from qt_data_extractor.report import JobReport
+
+EXTRACTION_TAGS = scaled(20)
+# One minute raw samples, read in daily windows
+SAMPLE_INTERVAL_SECONDS = 60
+LAST_TIMESTAMP = datetime(2024, 1, 1)
+EXTRACTION_PERIOD = timedelta(days=7)
+EXTRACTION_WINDOW = timedelta(days=1)
+# Latency of a historian request, the readers overlap it
+REQUEST_LATENCY_SECONDS = 0.02
+# Queued jobs are small and wait on a slow historian, what the queue overlaps
+JOB_QUEUE_TAGS = scaled(5)
+JOB_QUEUE_LATENCY_SECONDS = 0.1
+JOB_QUEUE_TIMEOUT_SECONDS = 120
+
+
+@pytest.fixture(autouse=True)
+def limiters(monkeypatch):
+    """Every benchmark starts with fresh (adaptive) connection limiters"""
+    monkeypatch.setattr(extraction, "_connection_limiters", {})
+
+
+def _extract(api, directory, archive_type, max_readers):
+    tags = list(
+        api.list_tags(SYNTHETIC_CONNECTION, filter="*", max_results=EXTRACTION_TAGS)
+    )
+    job = create_job(
+        src_conn=SYNTHETIC_CONNECTION,
+        tags=tags,
+        # Archive names have a seconds resolution, every run gets its own directory
+        directory=tempfile.mkdtemp(dir=directory),
+        first_timestamp=LAST_TIMESTAMP - EXTRACTION_PERIOD,
+        last_timestamp=LAST_TIMESTAMP,
+        time_frequency="Raw Data",
+        window=EXTRACTION_WINDOW,
+        max_readers=max_readers,
+        archive_type=archive_type,
+    )
+    report = JobReport(job)
+    failures = run_job(api, job, report=report)
+    assert not failures
+    return report.to_dict()["totals"]
+
+
+def _values_count(tags=EXTRACTION_TAGS):
+    rows = int(EXTRACTION_PERIOD.total_seconds() // SAMPLE_INTERVAL_SECONDS) + 1
+    return rows * tags
+
+
+@pytest.mark.parametrize("max_readers", [1, 4])
+def test_copy_period_zip(benchmark, tmp_path, max_readers):
+    api = synthetic_api(
+        sample_interval=SAMPLE_INTERVAL_SECONDS, latency=REQUEST_LATENCY_SECONDS
+    )
+
+    totals = benchmark(
+        lambda: _extract(api, tmp_path, "zip-stream", max_readers),
+        items=_values_count(),
+        unit="values",
+    )
+    assert totals["rows_written"] == _values_count()
+
+
+def test_copy_period_parquet(benchmark, tmp_path):
+    if "parquet" not in ARCHIVE_FORMATS:
+        pytest.skip("Parquet archives require pyarrow")
+
+    api = synthetic_api(
+        sample_interval=SAMPLE_INTERVAL_SECONDS, latency=REQUEST_LATENCY_SECONDS
+    )
+
+    totals = benchmark(
+        lambda: _extract(api, tmp_path, "parquet", max_readers=4),
+        items=_values_count(),
+        unit="values",
+    )
+    assert totals["rows_written"] == _values_count()
+
+
+@pytest.mark.parametrize("max_running", [1, 4])
+def test_job_queue(qapp, benchmark, tmp_path, max_running):
+    from qt_data_extractor.connectors.synthetic import SyntheticHistorianConnector
+    from qt_data_extractor.job_queue import COMPLETED, JobQueue
+    from qt_data_extractor.mainwindow import MainWindow
+
+    api = synthetic_api(
+        sample_interval=SAMPLE_INTERVAL_SECONDS, latency=JOB_QUEUE_LATENCY_SECONDS
+    )
+    connections = [SYNTHETIC_CONNECTION, f"{SYNTHETIC_CONNECTION}-2"]
+    api.create_connection(
+        connections[1],
+        SyntheticHistorianConnector.TYPE,
+        enabled=True,
+        sample_interval=SAMPLE_INTERVAL_SECONDS,
+        latency=JOB_QUEUE_LATENCY_SECONDS,
+    )
+    tags = list(
+        api.list_tags(SYNTHETIC_CONNECTION, filter="*", max_results=JOB_QUEUE_TAGS)
+    )
+
+    window = MainWindow(api)
+    window._job_queue = JobQueue(max_running=max_running)
+
+    def run_queue():
+        directory = tempfile.mkdtemp(dir=tmp_path)
+        # Two jobs per connection - a single job slot each, the connections in parallel
+        for conn_name in connections * 2:
+            job = create_job(
+                src_conn=conn_name,
+                tags=tags,
+                directory=directory,
+                first_timestamp=LAST_TIMESTAMP - EXTRACTION_PERIOD,
+                last_timestamp=LAST_TIMESTAMP,
+                time_frequency="Raw Data",
+                window=EXTRACTION_WINDOW,
+                max_readers=1,
+                archive_type="zip-stream",
+            )
+            window._queue_extraction(job, conn_type=SyntheticHistorianConnector.TYPE)
+
+        deadline = time.monotonic() + JOB_QUEUE_TIMEOUT_SECONDS
+        while window._job_queue.pending:
+            assert time.monotonic() < deadline, "Timed out waiting for the queue"
+            qapp.processEvents()
+            time.sleep(0.001)
+
+        jobs = window._job_queue.jobs
+        window._job_queue.clear_finished()
+        return jobs
+
+    jobs = benchmark(
+        run_queue,
+        items=_values_count(len(tags)) * len(connections) * 2,
+        unit="values",
+        memory=False,
+    )
+    assert [q.state for q in jobs] == [COMPLETED] * len(connections) * 2
+    assert len({q.job["archive"] for q in jobs}) == len(jobs)
+    window._jobs_threadpool.waitForDone()
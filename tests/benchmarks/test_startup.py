@@ -0,0 +1,51 @@
+import subprocess
+import sys
+import time
+
+from benchmark_utils import synthetic_api
+
+# Loaded on first use (a preview, tags file or extraction), never at startup
+DEFERRED_MODULES = [
+    "pandas",
+    "openpyxl",
+    "pyarrow",
+    "PySide6.QtCharts",
+    "PySide6.QtUiTools",
+]
+# Construction and setup of the main window, generous for slow CI machines
+STARTUP_BUDGET_SECONDS = 5
+
+
+def test_main_window_imports():
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, qt_data_extractor.mainwindow; "
+            f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    assert not loaded, f"Imported at startup: {', '.join(loaded)}"
+
+
+def test_main_window_startup(qapp, benchmark):
+    from qt_data_extractor.mainwindow import MainWindow
+
+    api = synthetic_api()
+
+    def start():
+        started = time.perf_counter()
+        window = MainWindow(api)
+        window.setup()
+        window.show()
+        qapp.processEvents()
+        seconds = time.perf_counter() - started
+        window.threadpool.waitForDone()
+        window._w.close()
+        return seconds
+
+    assert benchmark(start, memory=False) < STARTUP_BUDGET_SECONDS
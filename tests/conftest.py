@@ -7,4 +7,19 @@
     - https://docs.pytest.org/en/stable/writing_plugins.html
 """
 
-# import pytest
+import time
+
+import pytest
+
+# Not UTC and switching to daylight saving time on 2024-03-10
+LOCAL_TIMEZONE = "EST+5EDT,M3.2.0,M11.1.0"
+
+
+@pytest.fixture
+def local_timezone(monkeypatch):
+    """Machine time zone other than UTC - historians take naive bounds as local time"""
+    monkeypatch.setenv("TZ", LOCAL_TIMEZONE)
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
@@ -0,0 +1,134 @@
+import os
+import zipfile
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+from benchmarks.benchmark_utils import SYNTHETIC_CONNECTION, synthetic_api
+
+from qt_data_extractor import extraction
+from qt_data_extractor.checkpoint import Checkpoint
+from qt_data_extractor.extraction import (
+    DAMAGED_ARCHIVE_SUFFIX,
+    ArchiveWriter,
+    checkpoint_path,
+    create_job,
+    run_job,
+)
+
+FIRST_TIMESTAMP = datetime(2024, 1, 1)
+LAST_TIMESTAMP = datetime(2024, 1, 3)
+WINDOW = timedelta(hours=12)
+
+
+@pytest.fixture
+def api():
+    return synthetic_api(tags_count=3)
+
+
+def _job(api, tmp_path):
+    return create_job(
+        src_conn=SYNTHETIC_CONNECTION,
+        tags=list(api.list_tags(SYNTHETIC_CONNECTION, filter="*")),
+        directory=str(tmp_path),
+        first_timestamp=FIRST_TIMESTAMP,
+        last_timestamp=LAST_TIMESTAMP,
+        time_frequency="Raw Data",
+        window=WINDOW,
+        max_readers=2,
+    )
+
+
+def _units(job):
+    return len(job["tags"]) * (LAST_TIMESTAMP - FIRST_TIMESTAMP) // WINDOW
+
+
+def test_units_recorded_once_archive_closed(tmp_path):
+    path = str(tmp_path / "archive.zip")
+    written = []
+    df = pd.DataFrame({"TAG": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2))
+
+    writer = ArchiveWriter("zip-stream", "archive", zipfile_path=path)
+    writer.open()
+    writer.write("TAG", df, on_written=lambda archive_bytes: written.append("TAG"))
+    writer.close_group("TAG")
+    writer.flush()
+    # Stored in the spool and the zip entry, but without a central directory yet
+    assert written == []
+
+    writer.close()
+    assert written == ["TAG"]
+    assert zipfile.is_zipfile(path)
+
+
+def test_resume_starts_over_when_archive_damaged(api, tmp_path):
+    job = _job(api, tmp_path)
+    checkpoint = Checkpoint.create(checkpoint_path(job), job)
+    assert not run_job(api, job, checkpoint=checkpoint)
+    checkpoint.close()
+    assert Checkpoint.load(checkpoint.path).completed_units == _units(job)
+
+    # Killed while rewriting the archive - the central directory is gone
+    with open(job["archive"], "r+b") as fl:
+        fl.truncate(os.path.getsize(job["archive"]) // 2)
+
+    checkpoint = Checkpoint.load(checkpoint.path)
+    assert not run_job(api, job, checkpoint=checkpoint, resume=True)
+    checkpoint.close()
+
+    assert os.path.exists(f"{job['archive']}{DAMAGED_ARCHIVE_SUFFIX}")
+    assert Checkpoint.load(checkpoint.path).completed_units == _units(job)
+    with zipfile.ZipFile(job["archive"]) as zf:
+        assert len([n for n in zf.namelist() if n.startswith("data/")]) == len(
+            job["tags"]
+        )
+
+
+def test_damaged_update_archive_not_replaced(api, tmp_path):
+    job = _job(api, tmp_path)
+    assert not run_job(api, job)
+
+    update = create_job(
+        src_conn=SYNTHETIC_CONNECTION,
+        tags=job["tags"],
+        directory=str(tmp_path),
+        first_timestamp=FIRST_TIMESTAMP,
+        last_timestamp=LAST_TIMESTAMP + WINDOW,
+        window=WINDOW,
+        update_archive=job["archive"],
+    )
+    with open(update["archive"], "r+b") as fl:
+        fl.truncate(os.path.getsize(update["archive"]) // 2)
+
+    checkpoint = Checkpoint.create(checkpoint_path(update), update)
+    with pytest.raises(ValueError, match="damaged"):
+        run_job(api, update, checkpoint=checkpoint, resume=True)
+    checkpoint.close()
+
+    assert os.path.exists(update["archive"])
+
+
+def test_update_rejected_before_reading(api, tmp_path, monkeypatch):
+    # An archive format without group_last_timestamps cannot be updated
+    monkeypatch.setitem(
+        extraction.ARCHIVE_CONNECTORS,
+        "synthetic",
+        "qt_data_extractor.connectors.synthetic:SyntheticHistorianConnector",
+    )
+    monkeypatch.setitem(
+        extraction.ARCHIVE_FORMATS,
+        "synthetic",
+        {"name": "Synthetic", "extension": ".syn", "path_param": "path"},
+    )
+    archive = tmp_path / "archive.syn"
+    archive.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="do not support updating"):
+        create_job(
+            src_conn=SYNTHETIC_CONNECTION,
+            tags=list(api.list_tags(SYNTHETIC_CONNECTION, filter="*")),
+            directory=str(tmp_path),
+            first_timestamp=FIRST_TIMESTAMP,
+            last_timestamp=LAST_TIMESTAMP,
+            update_archive=str(archive),
+        )
@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta, timezone
+
+from qt_data_extractor.cli import parse_args
+
+JOB_ARGS = ["--connection", "pi-main", "--tags-file", "tags.txt"]
+
+
+def test_period_offset_kept():
+    args = parse_args(
+        JOB_ARGS
+        + ["-o", ".", "--from", "2024-01-01T00:00Z", "--to", "2024-01-02T00:00+02:00"]
+    )
+
+    assert datetime.fromisoformat(args.first_timestamp) == datetime(
+        2024, 1, 1, tzinfo=timezone.utc
+    )
+    assert datetime.fromisoformat(args.last_timestamp) == datetime(
+        2024, 1, 1, 22, tzinfo=timezone.utc
+    )
+
+
+def test_update_ends_now_in_utc():
+    args = parse_args(JOB_ARGS + ["--update", "archive.zip", "--from", "2024-01-01"])
+
+    last = datetime.fromisoformat(args.last_timestamp)
+    assert last.utcoffset() == timedelta(0)
+    assert abs(datetime.now(timezone.utc) - last) < timedelta(minutes=1)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from qt_data_extractor.decimation import decimate, decimate_lttb, decimate_min_max
+
+
+@pytest.fixture
+def series():
+    x = np.arange(10000, dtype=np.int64) * 1000
+    y = np.sin(x / 1e6)
+    y[1234] = 50
+    y[8765] = -50
+    return x, y
+
+
+def test_min_max_keeps_extremes(series):
+    x, y = series
+    px, py = decimate_min_max(x, y, 100)
+
+    assert len(px) <= 200
+    assert np.all(np.diff(px) > 0)
+    assert py.max() == 50 and px[py.argmax()] == x[1234]
+    assert py.min() == -50 and px[py.argmin()] == x[8765]
+    assert set(px) <= set(x)
+
+
+def test_lttb_keeps_shape(series):
+    x, y = series
+    px, py = decimate_lttb(x, y, 300)
+
+    assert len(px) == 300
+    assert (px[0], px[-1]) == (x[0], x[-1])
+    assert np.all(np.diff(px) > 0)
+    # A spike is the largest triangle of its bucket
+    assert 50 in py and -50 in py
+
+
+def test_short_series_and_gaps():
+    x = np.arange(10, dtype=np.int64)
+    y = np.arange(10, dtype=float)
+    y[3] = np.nan
+
+    for method in ["minmax", "lttb"]:
+        px, py = decimate(x, y, 100, method=method)
+        assert list(px) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        assert not np.isnan(py).any()
+
+    with pytest.raises(ValueError):
+        decimate(x, y, 100, method="every-nth")
@@ -0,0 +1,179 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from benchmarks.benchmark_utils import SYNTHETIC_CONNECTION, synthetic_api
+
+from qt_data_extractor import extraction
+from qt_data_extractor.cancellation import CancellationToken, ExtractionCancelled
+from qt_data_extractor.checkpoint import Checkpoint
+from qt_data_extractor.extraction import (
+    MAX_RETRY_BACKOFF_SECONDS,
+    MAX_UNIT_ATTEMPTS,
+    MIN_REQUEST_SCALE,
+    AdaptiveConnectionLimiter,
+    ConnectionLimiter,
+    checkpoint_path,
+    create_job,
+    retry_delay,
+    run_job,
+)
+from qt_data_extractor.report import JobReport
+
+FIRST_TIMESTAMP = datetime(2024, 1, 1)
+LAST_TIMESTAMP = datetime(2024, 1, 2)
+WINDOW = timedelta(hours=6)
+WINDOWS = 4
+
+
+class _FlakyApi:
+    """Data agent API failing reads of a tag a number of times"""
+
+    def __init__(self, api, failures=None):
+        self._api = api
+        self._failures = dict(failures or {})
+        self._lock = threading.Lock()
+        self.reads = []
+
+    def __getattr__(self, name):
+        return getattr(self._api, name)
+
+    def read_tag_values_period(self, conn_name, tags, **kwargs):
+        with self._lock:
+            self.reads.append(tags[0])
+            if self._failures.get(tags[0], 0):
+                self._failures[tags[0]] -= 1
+                raise ConnectionError(f"Reading {tags[0]} failed")
+
+        return self._api.read_tag_values_period(conn_name, tags, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def fixed_requests(monkeypatch):
+    """Retry right away, a window is read in a single request"""
+    monkeypatch.setattr(extraction, "retry_delay", lambda attempt: 0)
+    monkeypatch.setattr(
+        extraction, "connection_limiter", lambda *args: ConnectionLimiter(4)
+    )
+
+
+@pytest.fixture
+def api():
+    return synthetic_api(tags_count=3)
+
+
+def _tags(api):
+    return list(api.list_tags(SYNTHETIC_CONNECTION, filter="*"))
+
+
+def _job(api, tmp_path, max_readers=1):
+    return create_job(
+        src_conn=SYNTHETIC_CONNECTION,
+        tags=_tags(api),
+        directory=str(tmp_path),
+        first_timestamp=FIRST_TIMESTAMP,
+        last_timestamp=LAST_TIMESTAMP,
+        window=WINDOW,
+        max_readers=max_readers,
+    )
+
+
+def test_retry_delay_bounded():
+    for attempt in range(1, 20):
+        assert 0 <= retry_delay(attempt) <= MAX_RETRY_BACKOFF_SECONDS
+
+
+def test_failed_reads_retried(api, tmp_path):
+    tag = _tags(api)[1]
+    flaky = _FlakyApi(api, {tag: MAX_UNIT_ATTEMPTS - 1})
+    job = _job(api, tmp_path)
+    report = JobReport(job)
+
+    assert run_job(flaky, job, report=report) == []
+    assert flaky.reads.count(tag) == WINDOWS + MAX_UNIT_ATTEMPTS - 1
+    assert report.to_dict()["tags"][tag]["retries"] == MAX_UNIT_ATTEMPTS - 1
+
+
+def test_failed_tag_isolated(api, tmp_path):
+    failed, *others = _tags(api)
+    flaky = _FlakyApi(api, {failed: MAX_UNIT_ATTEMPTS})
+    job = _job(api, tmp_path, max_readers=2)
+    checkpoint = Checkpoint.create(checkpoint_path(job), job)
+
+    failures = run_job(flaky, job, checkpoint=checkpoint)
+    checkpoint.close()
+
+    assert [(f["tag"], f["attempts"], f["skipped"]) for f in failures] == [
+        (failed, MAX_UNIT_ATTEMPTS, WINDOWS - 1)
+    ]
+    # Windows after the failed one are not read, other tags are extracted
+    assert flaky.reads.count(failed) == MAX_UNIT_ATTEMPTS
+    assert all(flaky.reads.count(tag) == WINDOWS for tag in others)
+
+    # Resuming extracts the failed tag only
+    retried = _FlakyApi(api)
+    checkpoint = Checkpoint.load(checkpoint.path)
+    assert run_job(retried, job, checkpoint=checkpoint, resume=True) == []
+    checkpoint.close()
+    assert retried.reads == [failed] * WINDOWS
+
+
+def test_cancelled_job_resumed(api, tmp_path):
+    token = CancellationToken()
+    job = _job(api, tmp_path)
+    checkpoint = Checkpoint.create(checkpoint_path(job), job)
+
+    with pytest.raises(ExtractionCancelled):
+        run_job(
+            api,
+            job,
+            checkpoint=checkpoint,
+            cancel_token=token,
+            progress_callback=lambda tag, counter: token.cancel(),
+        )
+    checkpoint.close()
+
+    # The tag being read when cancelled is stored, the others are read on resume
+    checkpoint = Checkpoint.load(checkpoint.path)
+    assert checkpoint.completed_units == WINDOWS
+    counting = _FlakyApi(api)
+    assert run_job(counting, job, checkpoint=checkpoint, resume=True) == []
+    checkpoint.close()
+
+    assert len(counting.reads) == (len(job["tags"]) - 1) * WINDOWS
+    assert (
+        Checkpoint.load(checkpoint.path).completed_units == len(job["tags"]) * WINDOWS
+    )
+
+
+def test_adaptive_limiter_backs_off_and_recovers():
+    limiter = AdaptiveConnectionLimiter(ceiling=8, target_latency=0.5, initial=4)
+
+    limiter.record(1.0)
+    assert limiter.limit == 2
+    assert limiter.request_scale == 0.5
+    # A burst of slow requests counts once
+    limiter.record(1.0, error=True)
+    assert limiter.limit == 2
+
+    # A limit's worth of fast requests adds one, the request size doubles back
+    limiter.record(0.1)
+    assert (limiter.limit, limiter.request_scale) == (2, 1.0)
+    limiter.record(0.1)
+    assert limiter.limit == 3
+
+    for _ in range(100):
+        limiter.record(0.1)
+    assert limiter.limit == limiter.ceiling
+
+
+def test_adaptive_limiter_floor(monkeypatch):
+    clock = iter(range(1, 1000))
+    monkeypatch.setattr(extraction.time, "monotonic", lambda: next(clock))
+    limiter = AdaptiveConnectionLimiter(ceiling=4, target_latency=0.5)
+
+    for _ in range(20):
+        limiter.record(0, error=True)
+
+    assert limiter.limit == 1
+    assert limiter.request_scale == MIN_REQUEST_SCALE
@@ -0,0 +1,92 @@
+import pytest
+
+from qt_data_extractor.job_queue import CANCELLED, COMPLETED, QUEUED, RUNNING, JobQueue
+
+
+def _job(conn_name, archive=None):
+    return {"src_conn": conn_name, "tags": ["TAG"], "archive": archive or conn_name}
+
+
+def _ids(jobs):
+    return [j.id for j in jobs]
+
+
+def test_connection_slots():
+    queue = JobQueue(max_running=4, connection_slots={"osisoft-pi": 2})
+    pi = [queue.add(_job("pi", f"pi-{i}"), conn_type="osisoft-pi") for i in range(3)]
+    ip21 = [
+        queue.add(_job("ip21", f"ip21-{i}"), conn_type="aspen-ip21") for i in range(2)
+    ]
+
+    # Jobs of another connection go on while a connection is at its slots
+    assert _ids(queue.start_ready()) == _ids([pi[0], pi[1], ip21[0]])
+    assert queue.start_ready() == []
+
+    queue.finish(pi[0], COMPLETED)
+    assert queue.start_ready() == [pi[2]]
+    queue.finish(ip21[0], COMPLETED)
+    assert queue.start_ready() == [ip21[1]]
+    assert queue.pending == 3
+
+
+def test_max_running_and_priority():
+    queue = JobQueue(max_running=2, connection_slots={})
+    low = queue.add(_job("a"))
+    high = queue.add(_job("b"), priority=1)
+    other = queue.add(_job("c"))
+
+    assert queue.start_ready() == [high, low]
+    assert other.state == QUEUED
+
+    queue.set_connection_slots("a", 2)
+    assert queue.connection_slots("a") == 2
+    queue.finish(high, COMPLETED)
+    assert queue.start_ready() == [other]
+
+
+def test_cancel_and_remove():
+    queue = JobQueue(max_running=1, connection_slots={})
+    running = queue.add(_job("a"))
+    waiting = queue.add(_job("b"))
+    queue.start_ready()
+
+    assert not queue.cancel(running)
+    assert queue.cancel(waiting)
+    assert waiting.state == CANCELLED
+    assert queue.start_ready() == []
+
+    assert running.state == RUNNING
+    assert queue.jobs == [running, waiting]
+    queue.clear_finished()
+    assert queue.jobs == [running]
+
+
+def test_jobs_of_an_archive_run_in_turn():
+    queue = JobQueue(max_running=4, connection_slots={"osisoft-pi": 4})
+    first = queue.add(_job("pi", "archive.zip"), conn_type="osisoft-pi")
+    update = queue.add(_job("pi", "archive.zip"), conn_type="osisoft-pi")
+    other = queue.add(_job("pi", "other.zip"), conn_type="osisoft-pi")
+
+    assert queue.start_ready() == [first, other]
+    assert update.state == QUEUED
+
+    queue.finish(first, COMPLETED)
+    assert queue.start_ready() == [update]
+
+
+def test_started_jobs_hold_their_slot_and_archive():
+    queue = JobQueue(max_running=2, connection_slots={"osisoft-pi": 1})
+    interactive = queue.start(_job("pi", "archive.zip"), conn_type="osisoft-pi")
+    update = queue.add(_job("pi", "archive.zip"), conn_type="osisoft-pi")
+    other = queue.add(_job("ip21", "other.zip"))
+
+    # Started beyond the slots of its connection, queued jobs wait for it
+    assert interactive.state == RUNNING
+    assert queue.start(_job("pi", "pi.zip"), conn_type="osisoft-pi").state == RUNNING
+    assert queue.start_ready() == []
+    with pytest.raises(ValueError, match="archive.zip"):
+        queue.start(_job("ip21", "archive.zip"))
+
+    queue.finish(interactive, COMPLETED)
+    assert queue.start_ready() == [other]
+    assert update.state == QUEUED
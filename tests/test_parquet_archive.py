@@ -0,0 +1,84 @@
+import os
+
+import pandas as pd
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from qt_data_extractor.connectors.parquet import ParquetConnector  # noqa: E402
+
+TAG = "TAG1"
+
+
+def _frame(start, periods=3):
+    return pd.DataFrame(
+        {TAG: [float(i) for i in range(periods)]},
+        index=pd.date_range(start, periods=periods, freq="h"),
+    )
+
+
+def _write(path, df, disconnect=True):
+    conn = ParquetConnector(parquet_path=path)
+    conn.connect()
+    conn.write_group_values_period(TAG, df)
+    if disconnect:
+        conn.disconnect()
+    return conn
+
+
+def _stored(path):
+    conn = ParquetConnector(parquet_path=path)
+    conn.connect()
+    try:
+        return conn.read_group_values_period(TAG)
+    finally:
+        conn.disconnect()
+
+
+def test_sessions_merged_on_close(tmp_path):
+    path = str(tmp_path / "archive.parquet")
+    _write(path, _frame("2024-01-01"))
+    _write(path, _frame("2024-01-02"))
+
+    assert len(_stored(path).index) == 6
+    assert sorted(os.listdir(tmp_path)) == ["archive.parquet"]
+
+
+def test_interrupted_session_dropped(tmp_path):
+    path = str(tmp_path / "archive.parquet")
+    _write(path, _frame("2024-01-01"))
+    # Killed before disconnecting - the archive is untouched
+    conn = _write(path, _frame("2024-01-02"), disconnect=False)
+    conn._writer.close()
+    conn._writer, conn._connected = None, False
+
+    assert ParquetConnector.is_valid_archive(path)
+    assert len(_stored(path).index) == 3
+    assert sorted(os.listdir(tmp_path)) == ["archive.parquet"]
+
+
+def test_backup_restored(tmp_path):
+    path = str(tmp_path / "archive.parquet")
+    _write(path, _frame("2024-01-01"))
+    # Left by a version rewriting the archive in place
+    os.replace(path, f"{path}{ParquetConnector.BACKUP_SUFFIX}")
+    with open(path, "wb") as fl:
+        fl.write(b"PAR1")
+
+    assert len(_stored(path).index) == 3
+    assert sorted(os.listdir(tmp_path)) == ["archive.parquet"]
+
+
+def test_written_bytes_match_row_groups(tmp_path):
+    path = str(tmp_path / "archive.parquet")
+    _write(path, _frame("2024-01-01"))
+    conn = _write(path, _frame("2024-01-02"))
+
+    # Only the row group of the last session
+    row_group = pq.read_metadata(path).row_group(1)
+    assert conn.written_bytes == {
+        TAG: sum(
+            row_group.column(i).total_compressed_size
+            for i in range(row_group.num_columns)
+        )
+    }
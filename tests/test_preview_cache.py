@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from benchmarks.benchmark_utils import SYNTHETIC_CONNECTION, synthetic_api
+
+from qt_data_extractor.design.plot_preview import plot_time_frequency
+from qt_data_extractor.preview_cache import PreviewCache
+
+FIRST_TIMESTAMP = datetime(2024, 3, 9)
+LAST_TIMESTAMP = datetime(2024, 3, 12)
+
+
+class _CountingApi:
+    def __init__(self, api):
+        self._api = api
+        self.reads = []
+
+    def read_tag_values_period(self, **kwargs):
+        self.reads.append((kwargs["first_timestamp"], kwargs["last_timestamp"]))
+        return self._api.read_tag_values_period(**kwargs)
+
+
+@pytest.fixture
+def api():
+    return synthetic_api(tags_count=3)
+
+
+def _tags(api):
+    return list(api.list_tags(SYNTHETIC_CONNECTION, filter="*"))
+
+
+def _read(source, tags, first, last):
+    return source.read_tag_values_period(
+        conn_name=SYNTHETIC_CONNECTION,
+        tags=tags,
+        first_timestamp=first,
+        last_timestamp=last,
+        time_frequency="Raw Data",
+    )
+
+
+@pytest.mark.usefixtures("local_timezone")
+def test_cached_ranges_in_utc(api):
+    counting = _CountingApi(api)
+    cache = PreviewCache(counting)
+    tags = _tags(api)
+
+    _read(cache, tags, FIRST_TIMESTAMP, LAST_TIMESTAMP)
+    # Same local period given in UTC (daylight saving time started meanwhile)
+    first = datetime(2024, 3, 10, 5, tzinfo=timezone.utc)
+    last = datetime(2024, 3, 11, 4, tzinfo=timezone.utc)
+    df = _read(cache, tags, first, last)
+
+    assert len(counting.reads) == 1
+    expected = _read(api, tags, datetime(2024, 3, 10), datetime(2024, 3, 11))
+    assert df.equals(expected)
+    assert df.index[0] == datetime(2024, 3, 10, 5)
+
+
+def test_plot_rate_snapped():
+    first = datetime(2024, 1, 1)
+
+    assert plot_time_frequency(first, first + timedelta(seconds=500), 1000) is None
+    assert plot_time_frequency(first, first + timedelta(hours=1), 1000) == "5 seconds"
+    assert plot_time_frequency(first, first + timedelta(hours=1, minutes=1), 1000) == (
+        "5 seconds"
+    )
+    # Never finer than the selected rate
+    assert plot_time_frequency(
+        first, first + timedelta(hours=1), 1000, "3 minutes"
+    ) == ("180 seconds")
+    assert plot_time_frequency(first, first + timedelta(days=3000), 1000) == (
+        f"{3 * 86400} seconds"
+    )
+
+
+def test_overlapping_range_reads_missing_part(api):
+    counting = _CountingApi(api)
+    cache = PreviewCache(counting)
+    tags = _tags(api)
+
+    _read(cache, tags, datetime(2024, 3, 9), datetime(2024, 3, 10))
+    df = _read(cache, tags, datetime(2024, 3, 9, 12), datetime(2024, 3, 11))
+    _read(cache, tags, datetime(2024, 3, 9, 6), datetime(2024, 3, 10, 18))
+
+    assert counting.reads[1:] == [(datetime(2024, 3, 10), datetime(2024, 3, 11))]
+    assert df.equals(_read(api, tags, datetime(2024, 3, 9, 12), datetime(2024, 3, 11)))
+
+
+def test_truncated_read_cached_up_to_last_value(api):
+    counting = _CountingApi(api)
+    cache = PreviewCache(counting)
+    tags = _tags(api)[:1]
+
+    df = cache.read_tag_values_period(
+        conn_name=SYNTHETIC_CONNECTION,
+        tags=tags,
+        first_timestamp=FIRST_TIMESTAMP,
+        last_timestamp=LAST_TIMESTAMP,
+        max_results=100,
+    )
+    assert len(df) == 100
+
+    # Values after the truncated read are unknown, they are read
+    _read(cache, tags, FIRST_TIMESTAMP, LAST_TIMESTAMP)
+    assert len(counting.reads) == 2
+    assert counting.reads[1][1] == LAST_TIMESTAMP
+
+
+def test_least_recently_used_evicted(api):
+    counting = _CountingApi(api)
+    # Room for a single tag of the period
+    cache = PreviewCache(counting, max_megabytes=0.008)
+    first, second = _tags(api)[:2]
+    last = FIRST_TIMESTAMP + timedelta(hours=6)
+
+    _read(cache, [first], FIRST_TIMESTAMP, last)
+    _read(cache, [second], FIRST_TIMESTAMP, last)
+    _read(cache, [second], FIRST_TIMESTAMP, last)
+    assert 0 < cache.size <= 0.008 * 1024 * 1024
+    assert len(counting.reads) == 2
+
+    _read(cache, [first], FIRST_TIMESTAMP, last)
+    assert len(counting.reads) == 3
+
+    cache.invalidate(SYNTHETIC_CONNECTION)
+    assert cache.size == 0
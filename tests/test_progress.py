@@ -0,0 +1,51 @@
+import time
+
+from qt_data_extractor import cli
+from qt_data_extractor.progress import ProgressThrottle, format_duration
+
+
+def test_reports_throttled():
+    snapshots = []
+    progress = ProgressThrottle(4, snapshots.append, interval=60)
+
+    progress.tag_completed("A", 1)
+    progress.window_read("B", 10, 100)
+    progress.tag_completed("B", 2)
+    assert [s["tags"] for s in snapshots] == [["A"]]
+
+    progress.flush()
+    assert snapshots[-1]["tags"] == ["B"]
+    assert (snapshots[-1]["completed"], snapshots[-1]["rows"]) == (2, 10)
+    assert snapshots[-1]["eta"] is not None
+
+
+def test_poll_reports_without_events():
+    snapshots = []
+    progress = ProgressThrottle(2, snapshots.append, interval=0.01)
+
+    progress.poll()
+    time.sleep(0.02)
+    progress.poll()
+    progress.poll()
+
+    assert len(snapshots) == 2
+    assert snapshots[1]["elapsed"] > snapshots[0]["elapsed"]
+    assert snapshots[1]["eta"] is None
+
+
+def test_batch_progress_while_reading(monkeypatch):
+    monkeypatch.setattr(cli, "PROGRESS_INTERVAL_SECONDS", 0.01)
+    snapshots = []
+    progress = ProgressThrottle(1, snapshots.append, interval=0.01)
+
+    def read(seconds):
+        time.sleep(seconds)
+        return "done"
+
+    assert cli._run_with_progress(progress, read, 0.3) == "done"
+    assert len(snapshots) >= 5
+
+
+def test_format_duration():
+    assert format_duration(None) == "--:--:--"
+    assert format_duration(3723.5) == "1:02:03"
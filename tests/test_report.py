@@ -0,0 +1,82 @@
+import io
+import os
+import zipfile
+from datetime import datetime, timedelta
+
+from benchmarks.benchmark_utils import SYNTHETIC_CONNECTION, synthetic_api
+
+from qt_data_extractor.extraction import create_job, run_job
+from qt_data_extractor.report import JobReport
+
+
+def test_written_rows_match_archive(tmp_path):
+    api = synthetic_api(tags_count=3)
+    job = create_job(
+        src_conn=SYNTHETIC_CONNECTION,
+        tags=list(api.list_tags(SYNTHETIC_CONNECTION, filter="*")),
+        directory=str(tmp_path),
+        first_timestamp=datetime(2024, 1, 1),
+        last_timestamp=datetime(2024, 1, 2),
+        window=timedelta(hours=6),
+    )
+    report = JobReport(job)
+    assert not run_job(api, job, report=report)
+    report.finish("completed")
+
+    with zipfile.ZipFile(job["archive"]) as zf:
+        stored = {
+            name: len(io.TextIOWrapper(zf.open(name)).readlines()) - 1
+            for name in zf.namelist()
+            if name.startswith("data/")
+        }
+        compressed = {name: zf.getinfo(name).compress_size for name in stored}
+
+    result = report.to_dict()
+    assert result["totals"]["rows_written"] == sum(stored.values())
+    assert result["totals"]["rows_written"] == result["totals"]["rows_read"]
+    for tag, stats in result["tags"].items():
+        assert stats["rows_written"] == stored[f"data/{tag}.csv"]
+        assert stats["bytes_in_memory"] > 0
+        # Frames split the compressed entry of their tag
+        assert 0 <= compressed[f"data/{tag}.csv"] - stats["bytes_written"] < 4
+
+
+def test_update_reports_appended_bytes(tmp_path):
+    api = synthetic_api(tags_count=1)
+    tags = list(api.list_tags(SYNTHETIC_CONNECTION, filter="*"))
+    job = create_job(
+        src_conn=SYNTHETIC_CONNECTION,
+        tags=tags,
+        directory=str(tmp_path),
+        first_timestamp=datetime(2024, 1, 1),
+        last_timestamp=datetime(2024, 1, 2),
+    )
+    assert not run_job(api, job)
+    with zipfile.ZipFile(job["archive"]) as zf:
+        stored = zf.getinfo(f"data/{tags[0]}.csv").compress_size
+
+    update = create_job(
+        src_conn=SYNTHETIC_CONNECTION,
+        tags=tags,
+        directory=str(tmp_path),
+        first_timestamp=datetime(2024, 1, 1),
+        last_timestamp=datetime(2024, 1, 3),
+        update_archive=job["archive"],
+    )
+    report = JobReport(update)
+    assert not run_job(api, update, report=report)
+    report.finish("completed")
+    with zipfile.ZipFile(job["archive"]) as zf:
+        extended = zf.getinfo(f"data/{tags[0]}.csv").compress_size
+
+    # The growth of the extended entry, not the rewritten archive
+    assert report.to_dict()["totals"]["bytes_written"] == extended - stored
+
+    path = str(tmp_path / "job.prom")
+    report.write_prometheus(path)
+    with open(path) as fl:
+        assert (
+            f"qt_data_extractor_bytes_written_total"
+            f'{{connection="{SYNTHETIC_CONNECTION}",'
+            f'archive="{os.path.basename(job["archive"])}"}} {extended - stored}\n'
+        ) in fl.read()
@@ -0,0 +1,67 @@
+import fnmatch
+
+from qt_data_extractor.tag_import import TagList, parse_text
+from qt_data_extractor.tag_resolution import TagResolver
+
+CATALOG = ["TI-101", "ti-101", "PI-102", "FI-103", "FI-104"]
+
+
+def _list_tags(filter):
+    """Historian query - names and patterns match case insensitively"""
+    return {
+        tag: {"Name": tag}
+        for name in filter
+        for tag in CATALOG
+        if fnmatch.fnmatch(tag.lower(), name.lower())
+    }
+
+
+def test_tag_list_dedup():
+    tags = TagList(
+        parse_text("Tag\tUnit\nTI-101\tdegC\n PI-102 \n\nTI-101\tdegC\n\tx\nFI-103"),
+        skip_rows=1,
+    )
+
+    assert list(tags) == ["TI-101", "PI-102", "FI-103"]
+    assert tags.tags == ["TI-101", "PI-102", "FI-103"]
+    assert tags.duplicates == 1
+    assert tags.rows_read == 6
+
+
+def test_tag_list_column_and_batches():
+    rows = [["1", f"TAG-{i % 5}"] for i in range(12)] + [["short"]]
+    tags = TagList(rows, column=1)
+
+    assert list(tags.batches(size=2, read_ahead=True)) == [
+        ["TAG-0", "TAG-1"],
+        ["TAG-2", "TAG-3"],
+        ["TAG-4"],
+    ]
+    assert tags.duplicates == 7
+
+
+def test_resolution_case_insensitive():
+    resolution = TagResolver(_list_tags, batch_size=2, concurrency=2).resolve(
+        names=["pi-102", "Fi-103", "TI-101", "XX-999", "fi-*"]
+    )
+
+    assert set(resolution.found) == set(CATALOG)
+    assert resolution.missing == ["XX-999"]
+    assert resolution.ambiguous == {"TI-101": ["TI-101", "ti-101"]}
+
+
+def test_resolution_of_list_being_read():
+    found = []
+    tags = TagList(parse_text("pi-102\nFI-104\npi-102\nZZ"))
+
+    resolution = TagResolver(_list_tags, batch_size=1).resolve(
+        batches=tags.batches(size=1, read_ahead=True), on_batch=found.append
+    )
+
+    assert sorted(resolution.found) == ["FI-104", "PI-102"]
+    assert resolution.missing == ["ZZ"]
+    assert len(found) == 3
+
+
+def test_resolution_cancelled():
+    assert TagResolver(_list_tags).resolve(["PI-102"], cancelled=lambda: True) is None
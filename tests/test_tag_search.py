@@ -0,0 +1,36 @@
+from qt_data_extractor.tag_search import TagSearchIndex
+
+TAGS = {
+    "FI-101": {"Description": "Feed flow"},
+    "TI-101": {"Description": "Feed temperature\nreactor inlet"},
+    "TI-102": {"Description": "Reactor\ntemperature\nreactor outlet"},
+    "PI-101": {"Description": None},
+}
+
+
+def test_text_query_matches_names_then_descriptions():
+    index = TagSearchIndex(TAGS)
+
+    assert index.search("ti-10") == ["TI-101", "TI-102"]
+    assert index.search("feed") == ["FI-101", "TI-101"]
+    assert index.search("FEED", max_results=1) == ["FI-101"]
+    assert index.search("101") == ["FI-101", "TI-101", "PI-101"]
+
+
+def test_multiline_descriptions_found_once():
+    index = TagSearchIndex(
+        {"a": {"Description": "x\nfoo"}, "b": {"Description": "foo\nfoo"}}
+    )
+
+    assert index.search("foo") == ["a", "b"]
+    assert TagSearchIndex(TAGS).search("reactor") == ["TI-101", "TI-102"]
+
+
+def test_pattern_matches_whole_names():
+    index = TagSearchIndex(TAGS)
+
+    assert index.search("ti-*") == ["TI-101", "TI-102"]
+    assert index.search("*-101") == ["FI-101", "TI-101", "PI-101"]
+    assert index.search("?i-102") == ["TI-102"]
+    assert index.search("*") == list(TAGS)
+    assert index.search("*", max_results=2) == list(TAGS)[:2]
@@ -0,0 +1,112 @@
+import io
+import zipfile
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+from benchmarks.benchmark_utils import SYNTHETIC_CONNECTION, synthetic_api
+
+from qt_data_extractor.extraction import (
+    ConnectionLimiter,
+    ExtractionEngine,
+    create_job,
+    run_job,
+)
+from qt_data_extractor.timestamps import to_utc
+
+SAMPLE_INTERVAL_SECONDS = 60
+# Daylight saving time starts on 2024-03-10 in the `local_timezone` fixture
+FIRST_TIMESTAMP = datetime(2024, 3, 8)
+LAST_TIMESTAMP = datetime(2024, 3, 12)
+WINDOW = timedelta(days=1)
+
+pytestmark = pytest.mark.usefixtures("local_timezone")
+
+
+@pytest.fixture
+def api():
+    return synthetic_api(tags_count=2, sample_interval=SAMPLE_INTERVAL_SECONDS)
+
+
+class _QuarterRequests(ConnectionLimiter):
+    @property
+    def request_scale(self):
+        return 0.25
+
+
+def _utc_naive(ts):
+    return to_utc(ts).replace(tzinfo=None)
+
+
+def _samples(first, last):
+    """Raw samples of a period (both ends included)"""
+    seconds = (to_utc(last) - to_utc(first)).total_seconds()
+    return int(seconds // SAMPLE_INTERVAL_SECONDS) + 1
+
+
+def _tags(api):
+    return list(api.list_tags(SYNTHETIC_CONNECTION, filter="*"))
+
+
+def _stored(archive, tag):
+    with zipfile.ZipFile(archive) as zf:
+        data = zf.read(f"data/{tag}.csv")
+    return pd.read_csv(io.BytesIO(data), index_col=0, parse_dates=True)
+
+
+def _extract(api, tmp_path, last_timestamp, update_archive=None):
+    job = create_job(
+        src_conn=SYNTHETIC_CONNECTION,
+        tags=_tags(api),
+        directory=str(tmp_path),
+        first_timestamp=FIRST_TIMESTAMP,
+        last_timestamp=last_timestamp,
+        time_frequency="Raw Data",
+        window=WINDOW,
+        max_readers=2,
+        update_archive=update_archive,
+    )
+    assert not run_job(api, job)
+    return job["archive"]
+
+
+def test_windows_follow_utc_index(api, tmp_path):
+    archive = _extract(api, tmp_path, LAST_TIMESTAMP)
+
+    for tag in _tags(api):
+        df = _stored(archive, tag)
+        assert df.index.is_unique
+        assert df.index.is_monotonic_increasing
+        assert df.index[0] == _utc_naive(FIRST_TIMESTAMP)
+        assert df.index[-1] == _utc_naive(LAST_TIMESTAMP)
+        assert len(df.index) == _samples(FIRST_TIMESTAMP, LAST_TIMESTAMP)
+
+
+def test_update_continues_after_last_stored(api, tmp_path):
+    updated_until = LAST_TIMESTAMP + timedelta(hours=30)
+    archive = _extract(api, tmp_path, LAST_TIMESTAMP)
+    _extract(api, tmp_path, updated_until, update_archive=archive)
+
+    for tag in _tags(api):
+        df = _stored(archive, tag)
+        assert df.index.is_unique
+        assert df.index[-1] == _utc_naive(updated_until)
+        assert len(df.index) == _samples(FIRST_TIMESTAMP, updated_until)
+
+
+def test_window_read_in_parts(api):
+    tag = _tags(api)[0]
+    start = to_utc(FIRST_TIMESTAMP)
+
+    df = ExtractionEngine(api)._read_window(
+        SYNTHETIC_CONNECTION,
+        tag,
+        start,
+        start + WINDOW,
+        "Raw Data",
+        _QuarterRequests(1),
+    )
+
+    assert df.index.is_unique
+    assert df.index[0] == start.replace(tzinfo=None)
+    assert len(df.index) == _samples(start, start + WINDOW)
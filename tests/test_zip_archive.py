@@ -0,0 +1,73 @@
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from qt_data_extractor.extraction import ArchiveWriter
+
+TAG = "TAG"
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "archive.zip")
+
+
+def _frame(start, periods):
+    return pd.DataFrame(
+        {TAG: [float(i) for i in range(periods)]},
+        index=pd.date_range(start, periods=periods, freq="min", name="timestamp"),
+    )
+
+
+def _write(path, df, attributes=None):
+    writer = ArchiveWriter("zip-stream", "archive", zipfile_path=path)
+    writer.open()
+    if attributes:
+        writer.write_attributes(attributes)
+    writer.write(TAG, df)
+    writer.close_group(TAG)
+    writer.close()
+
+
+def test_update_keeps_entries_compressed(path):
+    _write(path, _frame("2024-01-01", 1000), {TAG: {"Name": TAG}})
+    # A new tag changes the tags list, the archive is rewritten
+    _write(path, _frame("2024-01-02", 1000), {"OTHER": {"Name": "OTHER"}})
+
+    with zipfile.ZipFile(path) as zf:
+        names = zf.namelist()
+        assert len(names) == len(set(names))
+        info = zf.getinfo(f"data/{TAG}.csv")
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+        assert info.compress_size < info.file_size / 2
+
+        df = pd.read_csv(io.BytesIO(zf.read(f"data/{TAG}.csv")), index_col=0)
+    assert len(df.index) == 2000
+    assert df.index.is_unique
+
+
+def test_update_extends_stored_group(path):
+    _write(path, _frame("2024-01-01", 10))
+
+    writer = ArchiveWriter("zip-stream", "archive", zipfile_path=path)
+    writer.open()
+    stored_until = _frame("2024-01-01", 10).index[-1]
+    assert writer.last_timestamps() == {TAG: stored_until}
+
+    writer.write(TAG, _frame("2024-01-02", 5))
+    writer.close_group(TAG)
+    writer.write(TAG, _frame("2024-01-03", 5))
+    writer.close_group(TAG)
+    assert writer.last_timestamps()[TAG] == _frame("2024-01-03", 5).index[-1]
+    writer.close()
+
+    with zipfile.ZipFile(path) as zf:
+        assert zf.namelist().count(f"data/{TAG}.csv") == 1
+        df = pd.read_csv(
+            io.BytesIO(zf.read(f"data/{TAG}.csv")), index_col=0, parse_dates=True
+        )
+    assert len(df.index) == 20
+    assert df.index.is_monotonic_increasing
+    assert list(df.columns) == [TAG]